@@ -11,6 +11,7 @@ CREATE TABLE users (
 
 CREATE TABLE command_history (
     id INT AUTO_INCREMENT PRIMARY KEY,
+    sync_key CHAR(32) UNIQUE,  -- set by the local store, makes re-synced rows no-ops
     user_id INT,
     user_command TEXT,
     aura_response TEXT,
@@ -25,3 +26,6 @@ CREATE TABLE command_history (
 
 CREATE INDEX idx_history_user_time 
     ON command_history(user_id, timestamp);
+
+-- Existing databases:
+-- ALTER TABLE command_history ADD COLUMN sync_key CHAR(32) UNIQUE AFTER id;
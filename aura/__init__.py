@@ -11,12 +11,12 @@ class AURAEngineWrapper:
     def __init__(self):
         self._engine = _get_engine()
 
-    def execute(self, text: str, *args, **kwargs):
-        result = self._engine.execute_command(text)
+    def execute(self, text: str, *args, user_id=None, input_mode="text", **kwargs):
+        result = self._engine.execute_command(text, user_id=user_id, input_mode=input_mode)
         return result.get("message", "Done.")
 
-    def execute_command(self, text: str):
-        return self._engine.execute_command(text)
+    def execute_command(self, text: str, user_id=None, input_mode="text"):
+        return self._engine.execute_command(text, user_id=user_id, input_mode=input_mode)
 
     def get_history(self, limit: int = 20):
         return self._engine.get_history(limit)
@@ -0,0 +1,319 @@
+# aura/audio_bus.py
+"""
+Shared microphone capture for AURA
+ - One always-open sounddevice input stream (int16 mono)
+ - Devices without 16 kHz support are resampled to 16 kHz on capture
+ - Captured audio kept in a shared ring buffer
+ - Wake detector, command recognizer and recorders read through their
+   own cursors, so switching between them never reopens the device
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+import numpy as np
+import sounddevice as sd
+
+from aura.audio_devices import get_device_registry
+from aura.audio_format import BLOCK_SIZE, SAMPLE_RATE
+from aura.resample import StreamingResampler
+
+BUFFER_SECONDS = 30
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity, preallocated int16 ring buffer written from the
+    capture callback. The oldest audio is overwritten when full.
+
+    Storage is mirrored (each sample is written at i and i + capacity),
+    so any span of up to `capacity` samples is one contiguous slice and
+    can be handed out as a view without copying.
+    Positions are absolute sample counts since the stream opened, so a
+    reader can tell how far behind the writer it is.
+    """
+
+    def __init__(self, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = int(capacity)
+        self._buf = np.zeros(2 * self.capacity, dtype=np.int16)
+        self.write_pos = 0
+        # Replay sources pass an audio-time clock instead of wall time
+        self.clock = clock
+        self.last_write_time = clock()
+        self._cond = threading.Condition()
+        self.waiters = 0   # readers blocked in wait_for, i.e. caught up and idle
+
+    def write(self, samples: np.ndarray):
+        total = len(samples)
+        if total == 0:
+            return
+        samples = samples[-self.capacity:]
+        n = len(samples)
+        cap = self.capacity
+        with self._cond:
+            start = (self.write_pos + total - n) % cap
+            first = min(n, cap - start)
+            # Primary copy, wrapping at capacity ...
+            self._buf[start:start + first] = samples[:first]
+            self._buf[:n - first] = samples[first:]
+            # ... and the mirror half, so reads never wrap
+            self._buf[cap + start:cap + start + first] = samples[:first]
+            self._buf[cap:cap + n - first] = samples[first:]
+            self.write_pos += total
+            self.last_write_time = self.clock()
+            self._cond.notify_all()
+
+    def oldest_pos(self) -> int:
+        return max(0, self.write_pos - self.capacity)
+
+    def time_of(self, pos: int, sample_rate: int) -> float:
+        """Approximate clock() time at which sample pos was captured."""
+        return self.last_write_time - (self.write_pos - pos) / sample_rate
+
+    def view(self, pos: int, n: int) -> np.ndarray:
+        """
+        Contiguous view (no copy) of n samples from absolute position pos.
+        Stays valid until the writer laps pos, i.e. for as long as the
+        reader remains less than `capacity` samples behind.
+        """
+        start = pos % self.capacity
+        return self._buf[start:start + n]
+
+    def read_into(self, pos: int, out: np.ndarray) -> int:
+        """Copy samples starting at pos straight into out; returns count copied."""
+        with self._cond:
+            pos = max(pos, self.oldest_pos())
+            n = max(0, min(len(out), self.write_pos - pos))
+            out[:n] = self.view(pos, n)
+            return n
+
+    def wait_for(self, pos: int, timeout: Optional[float]) -> bool:
+        """Block until data past pos is available (or timeout)."""
+        with self._cond:
+            self.waiters += 1
+            try:
+                return self._cond.wait_for(lambda: self.write_pos > pos, timeout)
+            finally:
+                self.waiters -= 1
+
+
+class BusReader:
+    """
+    Independent read cursor on the shared capture buffer.
+
+    Drop-oldest policy: a reader more than max_lag samples behind the
+    writer skips forward so it keeps only the newest max_lag samples.
+    Each skip counts as an overrun and the skipped samples as dropped
+    frames; depth is how much audio is waiting for this reader.
+    """
+
+    def __init__(self, bus: "AudioBus", start_pos: int, max_lag: Optional[int] = None):
+        self.bus = bus
+        self.pos = start_pos
+        # Headroom below capacity keeps a handed-out view from being
+        # overwritten while the consumer is still using it
+        limit = bus.ring.capacity * 3 // 4
+        self.max_lag = min(max_lag or limit, limit)
+        self.overruns = 0
+        self.dropped_frames = 0
+        self.max_depth = 0
+
+    @property
+    def sample_rate(self) -> int:
+        return self.bus.sample_rate
+
+    def available(self) -> int:
+        return self.bus.ring.write_pos - self.pos
+
+    @property
+    def depth(self) -> int:
+        return max(0, self.available())
+
+    def _next_span(self, max_samples: Optional[int], timeout: Optional[float]) -> int:
+        """Wait for data, apply the drop-oldest policy and return samples ready."""
+        ring = self.bus.ring
+        if not ring.wait_for(self.pos, timeout):
+            return 0
+        lag = ring.write_pos - self.pos
+        if lag > self.max_lag:
+            dropped = lag - self.max_lag
+            self.pos += dropped
+            self.overruns += 1
+            self.dropped_frames += dropped
+            lag = self.max_lag
+        self.max_depth = max(self.max_depth, lag)
+        return lag if max_samples is None else min(lag, max_samples)
+
+    def read_view(self, max_samples: Optional[int] = None,
+                  timeout: Optional[float] = 0.5) -> Optional[np.ndarray]:
+        """
+        Next chunk as a contiguous int16 view into the ring buffer (no
+        copy), or None on timeout. Consume it before reading again.
+        """
+        n = self._next_span(max_samples, timeout)
+        if n == 0:
+            return None
+        data = self.bus.ring.view(self.pos, n)
+        self.pos += n
+        return data
+
+    def read(self, max_samples: Optional[int] = None, timeout: Optional[float] = 0.5) -> Optional[bytes]:
+        """Next chunk of int16 PCM as bytes (a copy), or None on timeout."""
+        data = self.read_view(max_samples, timeout)
+        return None if data is None else data.tobytes()
+
+    def readinto(self, out: np.ndarray, timeout: Optional[float] = 0.5) -> int:
+        """
+        Copy the next available samples directly into the caller's int16
+        array (no intermediate bytes object). Returns the number of
+        samples written, 0 on timeout.
+        """
+        n = self._next_span(len(out), timeout)
+        if n == 0:
+            return 0
+        n = self.bus.ring.read_into(self.pos, out[:n])
+        self.pos += n
+        return n
+
+    def skip_to_now(self):
+        self.pos = self.bus.ring.write_pos
+
+    def stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "overruns": self.overruns,
+            "dropped_frames": self.dropped_frames,
+            "input_overflows": self.bus.input_overflows,
+        }
+
+
+class AudioBus:
+    """
+    Owns the single capture stream. Call start() once; the stream then
+    stays open and any number of readers can attach or detach.
+    """
+
+    def __init__(self, device: Optional[int] = None, sample_rate: int = SAMPLE_RATE,
+                 buffer_seconds: float = BUFFER_SECONDS):
+        self.registry = get_device_registry()
+        self._auto_device = device is None
+        self.device = self.registry.best_input_device() if device is None else device
+        # Readers always see sample_rate; native_rate is what the device runs at
+        self.sample_rate = sample_rate
+        self.native_rate = sample_rate
+        self._resampler = None
+        self.buffer_seconds = buffer_seconds
+        self.ring = AudioRingBuffer(int(sample_rate * buffer_seconds))
+        self._stream = None
+        self._lock = threading.Lock()
+        self.audio_count = 0
+        self.input_overflows = 0   # blocks PortAudio itself dropped
+
+    def _pick_rate(self) -> int:
+        # Cached per device; only the first open pays for probing
+        rate = self.registry.pick_rate(self.device, self.sample_rate)
+        if rate != self.sample_rate:
+            print(f"INFO: AudioBus: {self.sample_rate}Hz not supported, "
+                  f"capturing at {rate}Hz and resampling to {self.sample_rate}Hz")
+        return rate
+
+    def _rescan_devices(self):
+        """Called with no stream open: pick up hotplugged/removed devices."""
+        if self.registry.refresh(rescan=True) and self._auto_device:
+            self.device = self.registry.best_input_device()
+
+    def _callback(self, indata, frames, time_, status):
+        if status:
+            if status.input_overflow:
+                self.input_overflows += 1
+            print(f"[Audio callback status: {status}]")
+        self.audio_count += 1
+        samples = np.frombuffer(indata, dtype=np.int16)
+        if self._resampler is not None:
+            samples = self._resampler.process(samples)
+        self.ring.write(samples)
+
+    @property
+    def is_active(self) -> bool:
+        return self._stream is not None and self._stream.active
+
+    def start(self, retries: int = 3):
+        """Open the shared input stream if it is not already running."""
+        with self._lock:
+            if self.is_active:
+                return
+            if self._stream is not None:
+                # Stream died under us (device unplugged or driver reset)
+                print("INFO: AudioBus: capture stream stopped, reopening.")
+                try:
+                    self._stream.close()
+                except Exception:
+                    pass
+                self._stream = None
+                self._rescan_devices()
+            for attempt in range(retries):
+                try:
+                    rate = self._pick_rate()
+                    self.native_rate = rate
+                    self._resampler = (StreamingResampler(rate, self.sample_rate)
+                                       if rate != self.sample_rate else None)
+                    self._stream = sd.RawInputStream(
+                        samplerate=rate,
+                        blocksize=int(rate * BLOCK_SIZE / SAMPLE_RATE),
+                        dtype="int16",
+                        channels=1,
+                        callback=self._callback,
+                        device=self.device,
+                    )
+                    self._stream.start()
+                    print(f"SUCCESS: Shared audio stream active at {rate}Hz.")
+                    return
+                except Exception as e:
+                    print(f"AudioBus: open attempt {attempt+1} failed: {e}")
+                    self._stream = None
+                    if attempt < retries - 1:
+                        self._rescan_devices()
+                        time.sleep(0.5)
+                    else:
+                        raise
+
+    def stop(self):
+        with self._lock:
+            if self._stream is not None:
+                try:
+                    self._stream.stop()
+                    self._stream.close()
+                except Exception:
+                    pass
+                self._stream = None
+
+    def reader(self, preroll: float = 0.0, max_lag: Optional[float] = None,
+               start_pos: Optional[int] = None) -> BusReader:
+        """
+        New cursor positioned at 'now', optionally rewound by preroll
+        seconds so the start of a phrase is not lost, or at an explicit
+        start_pos (e.g. where a wake phrase ended). max_lag (seconds)
+        bounds how much unread audio the reader keeps before dropping
+        the oldest; default is most of the buffer.
+        """
+        self.start()
+        if start_pos is None:
+            start_pos = self.ring.write_pos - int(preroll * self.sample_rate)
+        start = max(self.ring.oldest_pos(), min(start_pos, self.ring.write_pos))
+        lag = int(max_lag * self.sample_rate) if max_lag else None
+        return BusReader(self, start, max_lag=lag)
+
+
+_bus: Optional[AudioBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_audio_bus(device: Optional[int] = None) -> AudioBus:
+    """Process-wide shared capture bus."""
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = AudioBus(device=device)
+        return _bus
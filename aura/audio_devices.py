@@ -0,0 +1,176 @@
+# aura/audio_devices.py
+"""
+Audio input device capabilities for AURA
+ - Each device is probed once (sample rates, channels, latency)
+ - Results are cached until the device list changes (hotplug)
+ - Picks the preferred Windows host API (WDM-KS > WASAPI)
+"""
+
+import platform
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import sounddevice as sd
+
+CANDIDATE_RATES = (16000, 48000, 44100, 32000, 22050, 8000)
+
+
+@dataclass(frozen=True)
+class DeviceCapabilities:
+    index: Optional[int]
+    name: str
+    hostapi: str
+    max_input_channels: int
+    default_samplerate: int
+    supported_rates: Tuple[int, ...]
+    low_latency: float
+    high_latency: float
+
+    def supports(self, rate: int) -> bool:
+        return rate in self.supported_rates
+
+
+class DeviceRegistry:
+    """Probe-once cache of input device capabilities."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._caps: Dict[Optional[int], DeviceCapabilities] = {}
+        self._signature = None
+        self._best = None
+        self._best_known = False
+
+    # ---------- device list ----------
+
+    @staticmethod
+    def _list_signature():
+        return tuple((d["name"], d["hostapi"], d["max_input_channels"])
+                     for d in sd.query_devices())
+
+    @staticmethod
+    def _playing() -> bool:
+        """sd.play() output (TTS) still running; a rescan would cut it off."""
+        try:
+            return bool(sd.get_stream().active)
+        except Exception:   # nothing has been played yet
+            return False
+
+    def refresh(self, rescan: bool = False) -> bool:
+        """
+        Drop cached capabilities if the device list changed.
+        rescan=True re-initializes PortAudio so hotplugged devices show up;
+        only do that while no input stream is open. It is skipped while
+        output is playing, and the current list is compared instead.
+        Returns True if it changed.
+        """
+        with self._lock:
+            if rescan and self._playing():
+                print("[DEBUG] Audio device rescan skipped while audio is playing")
+            elif rescan:
+                try:
+                    sd._terminate()
+                    sd._initialize()
+                except Exception as e:
+                    print(f"[DEBUG] Audio device rescan failed: {e}")
+            signature = self._list_signature()
+            if signature == self._signature:
+                return False
+            if self._signature is not None:
+                print("INFO: Audio device list changed, re-probing devices.")
+            self._signature = signature
+            self._caps.clear()
+            self._best_known = False
+            return True
+
+    def best_input_device(self) -> Optional[int]:
+        """Preferred input device on Windows (WDM-KS > WASAPI); None means system default."""
+        with self._lock:
+            if self._signature is None:
+                self._signature = self._list_signature()
+            if not self._best_known:
+                self._best = self._find_best_device()
+                self._best_known = True
+                if self._best is not None:
+                    print(f"INFO: Using optimal input device index {self._best}")
+            return self._best
+
+    @staticmethod
+    def _find_best_device():
+        if platform.system() != "Windows":
+            return None
+        try:
+            apis = sd.query_hostapis()
+
+            # Prioritize WDM-KS (usually most robust for Intel Smart Sound)
+            for api in apis:
+                if "WDM-KS" in api['name']:
+                    dev_index = api.get('default_input_device', -1)
+                    if dev_index != -1:
+                        return dev_index
+
+            # Fallback to WASAPI
+            for api in apis:
+                if "WASAPI" in api['name']:
+                    dev_index = api.get('default_input_device', -1)
+                    if dev_index != -1:
+                        return dev_index
+        except Exception:
+            pass
+        return None
+
+    # ---------- capabilities ----------
+
+    def get(self, device: Optional[int]) -> DeviceCapabilities:
+        with self._lock:
+            if self._signature is None:
+                self._signature = self._list_signature()
+            caps = self._caps.get(device)
+            if caps is None:
+                caps = self._probe(device)
+                self._caps[device] = caps
+            return caps
+
+    @staticmethod
+    def _probe(device: Optional[int]) -> DeviceCapabilities:
+        info = sd.query_devices(device, "input")
+        rates = []
+        for rate in CANDIDATE_RATES:
+            try:
+                sd.check_input_settings(device=device, samplerate=rate, channels=1, dtype="int16")
+                rates.append(rate)
+            except Exception:
+                pass
+        hostapi = sd.query_hostapis(info["hostapi"])["name"]
+        caps = DeviceCapabilities(
+            index=device,
+            name=info["name"],
+            hostapi=hostapi,
+            max_input_channels=int(info["max_input_channels"]),
+            default_samplerate=int(info["default_samplerate"]),
+            supported_rates=tuple(rates),
+            low_latency=float(info["default_low_input_latency"]),
+            high_latency=float(info["default_high_input_latency"]),
+        )
+        print(f"[DEBUG] Probed input device '{caps.name}' ({hostapi}): rates {list(caps.supported_rates)}")
+        return caps
+
+    def pick_rate(self, device: Optional[int], preferred: int = 16000) -> int:
+        caps = self.get(device)
+        if caps.supports(preferred):
+            return preferred
+        if caps.supports(caps.default_samplerate) or not caps.supported_rates:
+            return caps.default_samplerate
+        return caps.supported_rates[0]
+
+
+_registry: Optional[DeviceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_device_registry() -> DeviceRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = DeviceRegistry()
+        return _registry
@@ -0,0 +1,8 @@
+# aura/audio_format.py
+"""
+Audio format shared by capture, recognizers and the echo gate.
+No audio-device imports here, so text-only code paths can use it.
+"""
+
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 1600          # 100 ms at 16 kHz
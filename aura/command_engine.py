@@ -19,7 +19,7 @@ import requests
 
 try:
     from aura.enhanced_nlp import EnhancedNLP
-    from aura.context import ConversationContext, save_history
+    from aura.context import ConversationContext
     from aura.skills.filesystem import AdvancedFileSystem
 except ImportError:
     class EnhancedNLP:
@@ -29,10 +29,17 @@ except ImportError:
         def add_turn(self, a, b): pass
         def update_search(self, a, b): pass
         def as_dict(self): return {}
-    def save_history(a, b): pass
     class AdvancedFileSystem:
         def __init__(self): pass
 
+# Fixed replies; the wake listener pre-renders their audio (aura/phrase_cache.py)
+GREETING_RESPONSES = [
+    "Hello! I'm AURA, your AI assistant. How can I help you today?",
+    "Hi there! I'm ready to assist you. What would you like me to do?",
+    "Hey! I'm AURA. I can help with searches, opening apps, system controls, and more!",
+    "Good to see you! I'm your AI assistant AURA. What can I do for you?"
+]
+
 class AURACommandEngine:
     """[OK] PRODUCTION READY - ALL FEATURES WORKING"""
     
@@ -42,6 +49,7 @@ class AURACommandEngine:
         self.email_config = self._load_email_config()
         self.app_paths = self._load_app_paths()
         self._history = []
+        self._turn_category = None
         self.nlp = EnhancedNLP()
         self.context = ConversationContext()
         self.fs = AdvancedFileSystem()
@@ -52,13 +60,16 @@ class AURACommandEngine:
         pass
 
     def log_command(self, command, category, result, user_id=None):
-        """[OK] LOG EVERY COMMAND TO MYSQL"""
+        """[OK] NOTE THE CATEGORY; execute_command WRITES THE TURN ONCE"""
+        self._turn_category = category
+
+    def _save_turn(self, command, message, user_id, input_mode):
+        """Queue the turn for the history table (written in the background)"""
         try:
             from history import save_history
-            save_history(user_id, command, result, input_mode="text" if category != "voice" else "voice")
+            save_history(user_id, command, message, input_mode)
         except Exception as e:
             print(f"Logging error: {e}")
-            pass  # Silent fail for demo
 
     def _load_contacts(self):
         """[OK] HARDCODED CONTACTS - NO JSON NEEDED"""
@@ -404,14 +415,8 @@ class AURACommandEngine:
         
         # [OK] 1. GREETINGS (Most Natural)
         if self._is_greeting(cleaned_command):
-            responses = [
-                "Hello! I'm AURA, your AI assistant. How can I help you today?",
-                "Hi there! I'm ready to assist you. What would you like me to do?",
-                "Hey! I'm AURA. I can help with searches, opening apps, system controls, and more!",
-                "Good to see you! I'm your AI assistant AURA. What can I do for you?"
-            ]
             import random
-            return random.choice(responses)
+            return random.choice(GREETING_RESPONSES)
             
         # [OK] 2. CAPABILITIES INQUIRY  
         if self._is_capability_question(cleaned_command):
@@ -1900,8 +1905,9 @@ Your Student
         except Exception as e:
             return {"status": "error", "message": f"Had trouble opening YouTube. You can manually search for '{query}' on YouTube."}
 
-    def execute_command(self, command: str):
+    def execute_command(self, command: str, user_id=None, input_mode="text"):
         """[OK] MAIN EXECUTION + HISTORY"""
+        self._turn_category = None
         result = self.parse_command(command)
         
         # Handle both string and dict returns
@@ -1912,10 +1918,11 @@ Your Student
             message = result.get("message", "")
             
         self.context.add_turn(command, message)
-        save_history(command, message)
+        self._save_turn(command, message, user_id, input_mode)
         self._history.append({
             "timestamp": datetime.now().isoformat(),
             "command": command, 
+            "category": self._turn_category,
             "result": result
         })
         self._history = self._history[-50:]
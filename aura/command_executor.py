@@ -0,0 +1,87 @@
+# aura/command_executor.py
+"""
+Background execution of recognized commands
+ - Audio threads hand commands off and go straight back to reading
+ - Commands of one session run one at a time, in the order submitted;
+   different sessions run in parallel on a small shared pool
+ - Queue wait and run times are kept for diagnostics
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class CommandExecutor:
+    def __init__(self, max_workers: int = 2):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aura-cmd")
+        self._queues: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.wait_ms = deque(maxlen=100)   # submitted -> started
+        self.run_ms = deque(maxlen=100)
+
+    def submit(self, session: str, fn: Callable, *args) -> Future:
+        """Queue fn(*args) behind earlier work of the same session."""
+        future = Future()
+        with self._lock:
+            self.submitted += 1
+            queue = self._queues.get(session)
+            idle = queue is None
+            if idle:
+                queue = self._queues[session] = deque()
+            queue.append((fn, args, future, time.perf_counter()))
+        if idle:
+            self._pool.submit(self._drain, session)
+        return future
+
+    def _drain(self, session: str):
+        while True:
+            with self._lock:
+                queue = self._queues[session]
+                if not queue:
+                    del self._queues[session]
+                    return
+                fn, args, future, queued_at = queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.perf_counter()
+            self.wait_ms.append((started - queued_at) * 1000)
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                print(f"[DEBUG] Command in session '{session}' failed: {e}")
+                future.set_exception(e)
+            finally:
+                self.run_ms.append((time.perf_counter() - started) * 1000)
+                self.completed += 1
+
+    def pending(self, session: Optional[str] = None) -> int:
+        with self._lock:
+            if session is not None:
+                return len(self._queues.get(session, ()))
+            return sum(len(q) for q in self._queues.values())
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "pending": self.pending(),
+            "max_wait_ms": round(max(self.wait_ms, default=0.0), 1),
+            "max_run_ms": round(max(self.run_ms, default=0.0), 1),
+        }
+
+
+_executor: Optional[CommandExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_command_executor() -> CommandExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = CommandExecutor()
+        return _executor
@@ -1,56 +1,7 @@
-import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict
 
-import mysql.connector
-from dotenv import load_dotenv
-
-load_dotenv()
-
-# ---------- DB LOGGING ----------
-
-_db = None
-_cursor = None
-
-
-def _connect():
-    global _db, _cursor
-    if _db:
-        return
-    # Skip MySQL connection for now - using SQLite in command_engine instead
-    # Uncomment below to enable MySQL when available
-    # try:
-    #     _db = mysql.connector.connect(
-    #         host=os.getenv("DB_HOST", "localhost"),
-    #         user=os.getenv("DB_USER", "root"),
-    #         password=os.getenv("DB_PASSWORD", ""),
-    #         database=os.getenv("DB_NAME", "aura_db"),
-    #         auth_plugin="mysql_native_password",
-    #     )
-    #     _cursor = _db.cursor()
-    # except Exception:
-    _db, _cursor = None, None
-
-
-_connect()
-
-
-def save_history(command: str, response: str):
-    """Persist one turn into MySQL table command_history."""
-    if not _cursor:
-        return
-    try:
-        _cursor.execute(
-            "INSERT INTO command_history (user_command, aura_response, created_at) "
-            "VALUES (%s, %s, %s)",
-            (command, response[:255], datetime.now()),
-        )
-        _db.commit()
-    except Exception:
-        pass
-
-
 # ---------- IN‑MEMORY CONTEXT ----------
 
 @dataclass
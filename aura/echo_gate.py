@@ -0,0 +1,141 @@
+# aura/echo_gate.py
+"""
+Echo gating for AURA's microphone path
+ - The TTS module publishes the PCM it is about to play (the reference)
+ - Capture blocks are cross-correlated against the reference over the
+   plausible speaker-to-mic delays; blocks that are mostly AURA's own
+   voice are dropped, while the user talking over it still passes
+ - With no playback in flight the check is a single comparison, so
+   listeners are live again as soon as AURA stops talking
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from aura.audio_format import SAMPLE_RATE
+
+
+class EchoGate:
+    """
+    Decides whether a captured block is echo of recent playback.
+
+    max_delay is the longest speaker-to-mic path expected (output
+    buffering plus room); lead allows for the published start time
+    being late. threshold is the normalized cross-correlation above
+    which a block counts as echo.
+    """
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, max_delay: float = 0.4,
+                 lead: float = 0.1, threshold: float = 0.6, keep: float = 60.0):
+        self.sample_rate = sample_rate
+        self.max_delay = max_delay
+        self.lead = lead
+        self.threshold = threshold
+        self.keep = keep
+        self._refs = deque()   # (start time, float32 samples in [-1, 1])
+        self._lock = threading.Lock()
+        self._unreferenced = 0
+        self.blocks_checked = 0
+        self.blocks_gated = 0
+
+    # ---------- playback side ----------
+
+    def publish(self, pcm: np.ndarray, start_time: Optional[float] = None):
+        """Register int16 PCM (at sample_rate) that starts playing at start_time."""
+        if start_time is None:
+            start_time = time.monotonic()
+        ref = pcm.astype(np.float32) * (1.0 / 32768.0)
+        with self._lock:
+            self._refs.append((start_time, ref))
+            cutoff = time.monotonic() - self.keep
+            while self._refs and self._end(self._refs[0]) < cutoff:
+                self._refs.popleft()
+
+    def set_unreferenced(self, active: bool):
+        """
+        Playback whose PCM is unknown (TTS fell back to direct output):
+        every block is treated as echo while it lasts.
+        """
+        with self._lock:
+            self._unreferenced = max(0, self._unreferenced + (1 if active else -1))
+
+    def _end(self, ref) -> float:
+        return ref[0] + len(ref[1]) / self.sample_rate
+
+    @property
+    def playing(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            return bool(self._unreferenced) or any(
+                self._end(r) + self.max_delay > now for r in self._refs)
+
+    # ---------- capture side ----------
+
+    def _window(self, t0: float, n: int) -> Optional[np.ndarray]:
+        """Reference covering every delay at which it could reach a block starting at t0."""
+        rate = self.sample_rate
+        w_start = t0 - self.max_delay
+        w_len = n + int((self.max_delay + self.lead) * rate)
+        window = None
+        with self._lock:
+            for start, ref in self._refs:
+                offset = int(round((start - w_start) * rate))
+                lo, hi = max(0, offset), min(w_len, offset + len(ref))
+                if lo >= hi:
+                    continue
+                if window is None:
+                    window = np.zeros(w_len, dtype=np.float32)
+                window[lo:hi] = ref[lo - offset:hi - offset]
+        return window
+
+    def correlation(self, block: np.ndarray, t0: float) -> float:
+        """Peak normalized cross-correlation of block with the reference (0 if none)."""
+        n = len(block)
+        window = self._window(t0, n)
+        if window is None or n == 0:
+            return 0.0
+        x = block.astype(np.float32) * (1.0 / 32768.0)
+        ex = float(np.dot(x, x))
+        if ex <= 1e-9:
+            return 0.0
+        size = 1 << int(np.ceil(np.log2(len(window) + n)))
+        num = np.fft.irfft(np.fft.rfft(window, size) * np.conj(np.fft.rfft(x, size)), size)
+        num = num[:len(window) - n + 1]
+        csum = np.concatenate(([0.0], np.cumsum(window.astype(np.float64) ** 2)))
+        ew = csum[n:] - csum[:-n]
+        corr = np.abs(num) / np.sqrt(ex * ew + 1e-12)
+        # Lags where the reference is silent say nothing about echo
+        corr[ew < 1e-6 * n] = 0.0
+        return float(corr.max()) if len(corr) else 0.0
+
+    def is_echo(self, block: np.ndarray, t0: float) -> bool:
+        """block: int16 capture starting at monotonic time t0."""
+        self.blocks_checked += 1
+        if self._unreferenced:
+            self.blocks_gated += 1
+            return True
+        if not self._refs or self._end(self._refs[-1]) + self.max_delay < t0:
+            return False
+        echo = self.correlation(block, t0) >= self.threshold
+        if echo:
+            self.blocks_gated += 1
+        return echo
+
+    def stats(self) -> dict:
+        return {"checked": self.blocks_checked, "gated": self.blocks_gated}
+
+
+_gate: Optional[EchoGate] = None
+_gate_lock = threading.Lock()
+
+
+def get_echo_gate() -> EchoGate:
+    global _gate
+    with _gate_lock:
+        if _gate is None:
+            _gate = EchoGate()
+        return _gate
@@ -5,6 +5,7 @@ Compatibility layer so any old code that uses:
 continues to work.
 """
 
+from aura import command_engine
 from aura.command_engine import get_engine as _get_engine
 
 
@@ -12,15 +13,21 @@ def get_engine():
     return _get_engine()
 
 
-def execute(text: str, *args, **kwargs) -> str:
+def execute(text: str, *args, user_id=None, input_mode="text", **kwargs) -> str:
     """
     Legacy API. Extra args/kwargs (like min_confidence) are ignored.
     """
     engine = _get_engine()
-    result = engine.execute_command(text)
+    result = engine.execute_command(text, user_id=user_id, input_mode=input_mode)
     return result.get("message", "Done.")
 
 
 def handle_command(text: str) -> str:
     """Preferred helper used by wake_word_listener."""
-    return execute(text)
+    return execute(text, input_mode="voice")
+
+
+def turn_category():
+    """Category the engine gave the last command ("file", "email", ...), or None."""
+    engine = command_engine._engine_instance
+    return engine._turn_category if engine is not None else None
@@ -1,39 +1,64 @@
-import sounddevice as sd
 import numpy as np
-import io
-import wave
 import speech_recognition as sr
 import time
-import platform
+
+from aura.echo_gate import get_echo_gate
+from aura.vad import EnergyVAD
+
+
+def pcm_to_audio_data(pcm: np.ndarray, sample_rate: int) -> sr.AudioData:
+    """Wrap an int16 mono array as sr.AudioData without copying it."""
+    return sr.AudioData(pcm.data.cast("B"), sample_rate, 2)
+
+
+def vosk_input(frame_data):
+    """
+    Zero-copy Vosk input for a bytes-like object or int16 array.
+    Vosk's cffi binding rejects memoryview, but accepts a cdata buffer.
+    """
+    if isinstance(frame_data, bytes):
+        return frame_data
+    try:
+        from vosk import _ffi
+        return _ffi.from_buffer(frame_data)
+    except Exception:
+        return bytes(frame_data)
 
 class MicrophoneFix:
     """
     A replacement for sr.Microphone that uses sounddevice instead of PyAudio.
     """
-    def __init__(self, device=None, chunk_size=1024, sample_rate=16000):
+    def __init__(self, device=None, chunk_size=1024, sample_rate=16000, preroll=0.3,
+                 vad_hangover=0.4):
         self.chunk_size = chunk_size
         self.sample_rate = sample_rate
+        self.preroll = preroll  # seconds of already-captured audio to include
+        self.vad_hangover = vad_hangover  # silence after speech that ends a phrase
+        self.stream_chunk = 0.1  # seconds per block handed to on_chunk
+        self.noise_floor = None  # learned by adjust_for_ambient_noise / first frames
         self.audio_data = []
         self._stream = None
-        
-        if device is None and platform.system() == "Windows":
-            self.device = self._find_best_device()
-            if self.device is not None:
-                print(f"[DEBUG] MicrophoneFix: Using optimal device index {self.device}")
-        else:
-            self.device = device
+        # None lets the shared audio bus pick the preferred device
+        self.device = device
 
     def __enter__(self):
-        # We don't actually open the stream here because sr.recognizer.listen 
-        # expects a 'source' that it can call listen on.
+        # The stream itself lives in the shared AudioBus; nothing to open here.
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         pass
 
-    def listen(self, recognizer, timeout=None, phrase_time_limit=None):
+    def listen(self, recognizer, timeout=None, phrase_time_limit=None, on_chunk=None,
+               start_pos=None):
         """
         Mimics recognizer.listen but uses sounddevice.
+        Streams from the shared capture bus and stops as soon as the VAD
+        sees the end of speech; phrase_time_limit is only an upper bound.
+        on_chunk(chunk, sample_rate) is called with each fixed-size int16
+        block while capture is still running, for streaming recognizers.
+        start_pos is an audio bus position to start from instead of 'now'
+        (the wake listener passes where the wake phrase ended).
+        AURA's own voice (e.g. the wake acknowledgement) is left out.
         """
         print(f"[DEBUG] MicrophoneFix.listen started (max {phrase_time_limit}s)")
         
@@ -47,60 +72,60 @@ class MicrophoneFix:
         while is_speaking() and (time.time() - wait_start) < 3.0:
             time.sleep(0.1)
         
-        # Record audio using sounddevice with retry logic
-        recording = None
-        max_retries = 3
-        actual_sample_rate = self.sample_rate
-        
-        for attempt in range(max_retries):
-            try:
-                # Test for 16000Hz support first
-                try:
-                    sd.check_input_settings(device=self.device, samplerate=16000, channels=1)
-                    actual_sample_rate = 16000
-                except:
-                    dev_info = sd.query_devices(self.device)
-                    actual_sample_rate = int(dev_info['default_samplerate'])
-                    print(f"[DEBUG] 16000Hz not supported for recording, using: {actual_sample_rate}")
-
-                print(f"[DEBUG] Recording {duration}s of audio at {actual_sample_rate}Hz (Attempt {attempt+1})...")
-                recording = sd.rec(int(duration * actual_sample_rate), 
-                                  samplerate=actual_sample_rate, 
-                                  channels=1, 
-                                  dtype='float32',
-                                  device=self.device)
-                sd.wait()  # Wait for recording to finish
-                sd.stop()  # Explicitly stop to release device
-                print("[DEBUG] Recording finished successfully.")
+        # Read from the shared capture stream - the device is already open,
+        # so there is no reopen delay and no audio lost at the start
+        from aura.audio_bus import get_audio_bus
+        bus = get_audio_bus(self.device)
+        reader = bus.reader(preroll=self.preroll, start_pos=start_pos)
+        actual_sample_rate = bus.sample_rate
+        wanted = int(duration * actual_sample_rate)
+        vad = EnergyVAD(sample_rate=actual_sample_rate, hangover=self.vad_hangover,
+                        noise_floor=self.noise_floor)
+
+        print(f"[DEBUG] Recording up to {duration}s of audio at {actual_sample_rate}Hz from shared stream...")
+        record_start = time.perf_counter()
+        # One preallocated int16 buffer per utterance; the ring buffer copies
+        # straight into it and everything downstream is a view of it.
+        pcm = np.empty(wanted, dtype=np.int16)
+        block = max(1, int(self.stream_chunk * actual_sample_rate))
+        echo_gate = get_echo_gate()
+        got = 0
+        heard = 0  # including echo, so playback cannot stretch the time limit
+        while got < wanted and heard < wanted:
+            n = reader.readinto(pcm[got:min(wanted, got + block)], timeout=1.0)
+            if n == 0:
+                raise RuntimeError("No audio received from shared stream")
+            heard += n
+            chunk = pcm[got:got + n]
+            # Overwritten by the next read, so echo never reaches the VAD
+            # or the recognizer
+            if echo_gate.is_echo(chunk, bus.ring.time_of(reader.pos - n, actual_sample_rate)):
+                continue
+            got += n
+            if on_chunk is not None:
+                on_chunk(chunk, actual_sample_rate)
+            if vad.process(chunk):
                 break
-            except Exception as e:
-                print(f"[DEBUG] sd.rec attempt {attempt+1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(0.5) 
-                else:
-                    raise
-        
-        # Convert float32 to int16
-        print("[DEBUG] Processing audio data...")
-        audio_int16 = (recording * 32767).astype(np.int16)
-        
-        # Create a buffer for the wav file
-        buf = io.BytesIO()
-        with wave.open(buf, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(actual_sample_rate)
-            wf.writeframes(audio_int16.tobytes())
-        
-        buf.seek(0)
-        print(f"[DEBUG] Audio buffer created ({len(buf.getvalue())} bytes)")
-        
-        # Load into sr.AudioFile to get sr.AudioData
-        with sr.AudioFile(buf) as source:
-            print("[DEBUG] Recognizing from buffer...")
-            audio = recognizer.record(source)
-            print("[DEBUG] AudioData captured for recognizer.")
-            return audio
+            if timeout and not vad.speech_started and got >= timeout * actual_sample_rate:
+                raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+
+        # Keep the learned floor so the next listen starts calibrated
+        self.noise_floor = vad.noise_floor
+        recorded = got / actual_sample_rate
+        if vad.ended:
+            print(f"[DEBUG] End of speech after {recorded:.2f}s "
+                  f"(speech {vad.seconds(vad.speech_start_frame):.2f}-{vad.seconds(vad.speech_end_frame):.2f}s), "
+                  f"saved {duration - recorded:.2f}s of the {duration}s limit, "
+                  f"wall {time.perf_counter() - record_start:.2f}s")
+        else:
+            print(f"[DEBUG] Recording hit the {duration}s limit "
+                  f"(speech detected: {vad.speech_started}).")
+
+        build_start = time.perf_counter()
+        audio = pcm_to_audio_data(pcm[:got], actual_sample_rate)
+        print(f"[DEBUG] AudioData built in {(time.perf_counter() - build_start) * 1000:.2f} ms "
+              f"(buffer {pcm.nbytes} bytes, used {got * 2} bytes, no copy)")
+        return audio
 
     @property
     def stream(self):
@@ -111,32 +136,23 @@ class MicrophoneFix:
         # Allow setting to satisfy sr.Recognizer internal logic
         pass
 
-    def _find_best_device(self):
-        """Helper to find the best input device on Windows (WDM-KS > WASAPI)"""
-        try:
-            apis = sd.query_hostapis()
-            
-            # Prioritize WDM-KS (usually most robust for Intel Smart Sound)
-            for api in apis:
-                if "WDM-KS" in api['name']:
-                    dev_index = api.get('default_input_device', -1)
-                    if dev_index != -1:
-                        return dev_index
-            
-            # Fallback to WASAPI
-            for api in apis:
-                if "WASAPI" in api['name']:
-                    dev_index = api.get('default_input_device', -1)
-                    if dev_index != -1:
-                        return dev_index
-        except:
-            pass
-        return None
-
     def adjust_for_ambient_noise(self, source, duration=1):
-        # Placeholder
+        """Learn the VAD noise floor from `duration` seconds of room audio."""
         print("Calibrating background noise (sounddevice)...")
-        pass
+        from aura.audio_bus import get_audio_bus
+        bus = get_audio_bus(self.device)
+        reader = bus.reader()
+        vad = EnergyVAD(sample_rate=bus.sample_rate, calibration=duration)
+        got = 0
+        while vad.noise_floor is None and got < duration * bus.sample_rate * 2:
+            data = reader.read(timeout=1.0)
+            if data is None:
+                break
+            chunk = np.frombuffer(data, dtype=np.int16)
+            got += len(chunk)
+            vad.process(chunk)
+        self.noise_floor = vad.noise_floor
+        print(f"[DEBUG] Noise floor: {self.noise_floor}")
 
 # Context manager compatible with 'with MicrophoneFix() as source:'
 class MicrophoneSource:
@@ -0,0 +1,226 @@
+# aura/model_registry.py
+"""
+Process-wide registry of loaded Vosk models
+ - Each model directory is loaded once, in a background thread
+ - Every caller gets the same Model object, so memory is not doubled
+ - load() returns a Future right away: UIs can show immediately and
+   adopt the model when it is ready, threads can simply block on get()
+ - Several languages can be resident under a memory budget; the least
+   recently used model is evicted when a new one pushes past it;
+   models still leased by a user (get(), load(lease=True)) are never
+   evicted, and release() lets them go
+ - warm() loads a language's model ahead of a likely switch
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+try:
+    import psutil
+    HAVE_PSUTIL = True
+except ImportError:
+    HAVE_PSUTIL = False
+
+CONFIG_FILE = Path("aura_config.json")
+DEFAULT_MODEL_PATHS = {"en": "models/vosk-small-en"}
+DEFAULT_MEMORY_BUDGET_MB = 1024
+
+# One loader thread: loads are disk/CPU bound and run one after another
+_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aura-model-load")
+
+
+def load_model_config(path: Path = CONFIG_FILE):
+    """(language -> model path, memory budget in MB) from the config file."""
+    paths, budget = dict(DEFAULT_MODEL_PATHS), DEFAULT_MEMORY_BUDGET_MB
+    try:
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+        paths.update(config.get("vosk_models") or {})
+        budget = config.get("model_memory_budget_mb", budget)
+    except (OSError, ValueError, AttributeError):
+        pass
+    return paths, budget
+
+
+def _rss_mb() -> Optional[float]:
+    if not HAVE_PSUTIL:
+        return None
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def _dir_mb(path: str) -> float:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total / (1024 * 1024)
+
+
+class ModelRegistry:
+    """
+    Loads each Vosk model path once and hands out the shared instance.
+    Languages map to model paths (aura_config.json "vosk_models");
+    memory_budget_mb bounds the models kept resident.
+    """
+
+    def __init__(self, factory: Optional[Callable] = None,
+                 paths: Optional[Dict[str, str]] = None,
+                 memory_budget_mb: Optional[float] = None):
+        self._factory = factory
+        config_paths, config_budget = load_model_config()
+        self.paths = dict(paths if paths is not None else config_paths)
+        self.memory_budget_mb = memory_budget_mb if memory_budget_mb is not None else config_budget
+        self._futures: "OrderedDict[str, Future]" = OrderedDict()   # oldest use first
+        self._lock = threading.Lock()
+        self.load_seconds: Dict[str, float] = {}
+        self.resident_mb: Dict[str, float] = {}
+        self.switch_ms: Dict[str, float] = {}
+        self._leases: Dict[str, int] = {}   # users holding each model
+        self.evictions = 0
+
+    @staticmethod
+    def _key(path) -> str:
+        return str(Path(path).resolve())
+
+    def _load(self, key: str):
+        start = time.perf_counter()
+        rss_before = _rss_mb()
+        if self._factory is not None:
+            model = self._factory(key)
+        else:
+            from vosk import Model
+            model = Model(key)
+        self.load_seconds[key] = time.perf_counter() - start
+        # RSS growth is exact here since loads never overlap; without
+        # psutil the on-disk size is a fair estimate
+        rss_after = _rss_mb()
+        if rss_before is not None and rss_after is not None and rss_after > rss_before:
+            self.resident_mb[key] = rss_after - rss_before
+        else:
+            self.resident_mb[key] = _dir_mb(key)
+        print(f"INFO: Vosk model loaded from {key} in {self.load_seconds[key]:.1f}s "
+              f"(~{self.resident_mb[key]:.0f} MB)")
+        self._enforce_budget(keep=key)
+        return model
+
+    def _enforce_budget(self, keep: Optional[str] = None):
+        """
+        Drop least recently used models until the resident total fits the
+        budget. Leased models stay, even if that leaves it over budget.
+        """
+        if not self.memory_budget_mb:
+            return
+        with self._lock:
+            for key in list(self._futures):
+                total = sum(self.resident_mb.get(k, 0.0) for k in self._futures)
+                if total <= self.memory_budget_mb:
+                    break
+                if key == keep or self._leases.get(key) or not self._futures[key].done():
+                    continue
+                del self._futures[key]
+                self.evictions += 1
+                print(f"INFO: Evicted Vosk model {key} ({self.resident_mb.pop(key, 0.0):.0f} MB) "
+                      f"to stay under {self.memory_budget_mb} MB")
+
+    def load(self, path, lease: bool = False) -> Future:
+        """
+        Start loading path in the background (once); returns its Future.
+        With lease=True the model is not evicted until release(path).
+        """
+        key = self._key(path)
+        with self._lock:
+            if lease:
+                self._leases[key] = self._leases.get(key, 0) + 1
+            future = self._futures.get(key)
+            if future is None or (future.done() and future.exception() is not None):
+                future = _loader.submit(self._load, key)
+                self._futures[key] = future
+            self._futures.move_to_end(key)
+            return future
+
+    def get(self, path, timeout: Optional[float] = None):
+        """
+        Shared model for path, waiting for the load if needed. Raises if it
+        failed. The caller holds a lease on it until release(path).
+        """
+        future = self.load(path, lease=True)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            self.release(path)
+            raise
+
+    def release(self, path):
+        """Give back a lease from get() or load(lease=True)."""
+        key = self._key(path)
+        with self._lock:
+            count = self._leases.get(key, 0) - 1
+            if count > 0:
+                self._leases[key] = count
+            else:
+                self._leases.pop(key, None)
+        # Models kept only by this lease can go now
+        self._enforce_budget()
+
+    def is_ready(self, path) -> bool:
+        future = self._futures.get(self._key(path))
+        return future is not None and future.done() and future.exception() is None
+
+    # ---------- languages ----------
+
+    def path_for(self, lang: str) -> Optional[str]:
+        return self.paths.get((lang or "en").lower().split("-")[0])
+
+    def for_language(self, lang: str, lease: bool = False) -> Optional[Future]:
+        """
+        Future of the model for lang (None if no model is configured).
+        The time until it is usable is recorded in switch_ms[lang].
+        lease is as for load(); release with release(path_for(lang)).
+        """
+        path = self.path_for(lang)
+        if path is None:
+            return None
+        start = time.perf_counter()
+        future = self.load(path, lease=lease)
+
+        def record(_):
+            self.switch_ms[lang] = (time.perf_counter() - start) * 1000
+            print(f"[DEBUG] Speech model for '{lang}' ready after {self.switch_ms[lang]:.0f} ms")
+
+        future.add_done_callback(record)
+        return future
+
+    def warm(self, lang: str) -> Optional[Future]:
+        """Load lang's model ahead of a likely switch, without waiting for it."""
+        path = self.path_for(lang)
+        return self.load(path) if path is not None else None
+
+    def stats(self) -> dict:
+        return {
+            key: {"resident_mb": round(self.resident_mb.get(key, 0.0), 1),
+                  "load_s": round(self.load_seconds.get(key, 0.0), 2),
+                  "ready": fut.done() and fut.exception() is None,
+                  "leases": self._leases.get(key, 0)}
+            for key, fut in self._futures.items()
+        }
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
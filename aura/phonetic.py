@@ -0,0 +1,112 @@
+# aura/phonetic.py
+"""
+Phonetic matching of short spoken phrases for AURA
+ - phonetic_key(): compact Metaphone-style key, so recognizer
+   misspellings of one longer word ("aural", "oral") share a key
+ - Phonetic matching only applies to words whose key has at least
+   MIN_PHONETIC_KEY characters; shorter ones ("hey", "aura") must be
+   spelled as in one of the phrases
+ - PhraseMatcher: phrases compiled once into a set of word-form tuples;
+   finding one in a transcript is a single left-to-right pass
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+
+VOWELS = frozenset("aeiou")
+MIN_PHONETIC_KEY = 3   # words with shorter keys ("aura" -> "AR") only match by spelling
+
+_INITIAL = (("kn", "n"), ("gn", "n"), ("pn", "n"), ("wr", "r"), ("ps", "s"), ("x", "s"))
+_DIGRAPHS = (("tch", "X"), ("sch", "sk"), ("ph", "f"), ("sh", "X"), ("ch", "X"),
+             ("th", "0"), ("ck", "k"), ("gh", ""), ("wh", "w"), ("qu", "kw"))
+_LETTERS = {"b": "p", "c": "k", "d": "t", "g": "k", "q": "k", "v": "f",
+            "x": "ks", "z": "s"}
+_TOKEN = re.compile(r"\[[^\]]*\]|[a-z0-9']+")
+
+
+@lru_cache(maxsize=4096)
+def phonetic_key(word: str) -> str:
+    """
+    Consonant skeleton of a word. A leading vowel becomes 'A', other
+    vowels are dropped, similar-sounding consonants share a letter and
+    repeats collapse. Returns "" for words with no letters.
+    """
+    w = "".join(ch for ch in word.lower() if ch.isalpha())
+    if not w:
+        return ""
+    for prefix, repl in _INITIAL:
+        if w.startswith(prefix):
+            w = repl + w[len(prefix):]
+            break
+    for digraph, repl in _DIGRAPHS:
+        w = w.replace(digraph, repl)
+
+    out = []
+    for i, ch in enumerate(w):
+        nxt = w[i + 1] if i + 1 < len(w) else ""
+        if ch in VOWELS:
+            code = "A" if i == 0 else ""
+        elif ch in "hwy":
+            # Only sounded in front of a vowel
+            code = ch.upper() if nxt in VOWELS else ""
+        elif ch in "cg" and nxt in "eiy" and nxt:
+            code = "S" if ch == "c" else "J"
+        else:
+            code = _LETTERS.get(ch, ch).upper()
+        if code and (not out or out[-1] != code):
+            out.append(code)
+    return "".join(out)
+
+
+def tokenize(text: str) -> list:
+    """Lower-cased words; bracketed recognizer tokens like [unk] are kept as-is."""
+    return _TOKEN.findall(text.lower())
+
+
+class PhraseMatcher:
+    """
+    Matches any of a fixed set of phrases inside a transcript.
+
+    Each phrase is stored as a tuple of word forms: the phonetic key of
+    a word, or its spelling if the key is very short. Short keys are
+    shared by too many words ("hey"/"how", "aura"/"are"/"our"), so such
+    words must be spelled as in one of the phrases. A one-word phrase
+    only counts at the start of the transcript or after a recognizer
+    token like [unk], where the words in front of it were lost.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = [p.lower().strip() for p in phrases if p and p.strip()]
+        self._forms = set()
+        self.max_words = 1
+        for phrase in self.phrases:
+            words = tokenize(phrase)
+            if not words:
+                continue
+            self.max_words = max(self.max_words, len(words))
+            self._forms.add(tuple(self._form(w) for w in words))
+
+    @staticmethod
+    def _form(word: str) -> Optional[str]:
+        if word.startswith("["):
+            return None
+        key = phonetic_key(word)
+        return key if len(key) >= MIN_PHONETIC_KEY else word
+
+    def find(self, text: str) -> Optional[int]:
+        """
+        Index of the first word after the earliest matching phrase
+        (so words[end:] is whatever followed it), or None.
+        """
+        words = tokenize(text)
+        forms = [self._form(w) for w in words]
+        for i in range(len(words)):
+            # Longest phrase first, so "hey aura" wins over "aura"
+            for n in range(min(self.max_words, len(words) - i), 0, -1):
+                if n == 1 and i > 0 and forms[i - 1] is not None:
+                    continue
+                span = forms[i:i + n]
+                if None not in span and tuple(span) in self._forms:
+                    return i + n
+        return None
@@ -0,0 +1,162 @@
+# aura/phrase_cache.py
+"""
+Cache of rendered TTS audio for phrases AURA says often
+ - Keyed by text, voice and speaking rate, so a voice change re-renders
+ - Stored as WAV under aura/.cache/tts, bounded in size (oldest use
+   evicted first), and kept in memory once played
+ - Fixed phrases (acknowledgements, greetings) are cached up front;
+   any other response is cached once it has been said promote_after times
+"""
+
+import hashlib
+import os
+import threading
+import wave
+from collections import Counter, OrderedDict
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".cache", "tts"))
+
+
+class PhraseCache:
+    def __init__(self, directory: str = CACHE_DIR, max_disk_bytes: int = 50 * 1024 * 1024,
+                 max_memory_bytes: int = 16 * 1024 * 1024, promote_after: int = 3):
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.promote_after = promote_after
+        self.fixed = set()
+        self.hits = 0
+        self.misses = 0
+        self._counts = Counter()
+        self._memory: "OrderedDict[str, Tuple[np.ndarray, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk = {}            # file name -> size
+        self._lock = threading.Lock()
+        self._scan()
+
+    @staticmethod
+    def key(text: str, voice, rate) -> str:
+        return hashlib.sha1(f"{text}\0{voice}\0{rate}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".wav")
+
+    def _scan(self):
+        try:
+            for name in os.listdir(self.directory):
+                if name.endswith(".wav"):
+                    self._disk[name] = os.path.getsize(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    # ---------- lookup ----------
+
+    def get(self, text: str, voice, rate) -> Optional[Tuple[np.ndarray, int]]:
+        key = self.key(text, voice, rate)
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return hit
+        path = self._path(key)
+        try:
+            with wave.open(path, "rb") as wf:
+                sample_rate = wf.getframerate()
+                pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+            os.utime(path)     # mtime marks last use for eviction
+        except (OSError, EOFError, wave.Error):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self._remember(key, pcm, sample_rate)
+        return pcm, sample_rate
+
+    def _remember(self, key: str, pcm: np.ndarray, sample_rate: int):
+        if key in self._memory:
+            return
+        self._memory[key] = (pcm, sample_rate)
+        self._memory_bytes += pcm.nbytes
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, (old, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= old.nbytes
+
+    # ---------- storing ----------
+
+    def mark_fixed(self, phrases: Iterable[str]):
+        self.fixed.update(p for p in phrases if p)
+
+    def should_cache(self, text: str) -> bool:
+        """Count one use of text; True if it is worth caching."""
+        with self._lock:
+            self._counts[text] += 1
+            return text in self.fixed or self._counts[text] >= self.promote_after
+
+    def put(self, text: str, voice, rate, pcm: np.ndarray, sample_rate: int):
+        key = self.key(text, voice, rate)
+        name = key + ".wav"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = self._path(key) + ".tmp"
+            with wave.open(tmp, "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(sample_rate)
+                wf.writeframes(pcm.astype(np.int16).tobytes())
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            print(f"[DEBUG] Phrase cache write failed: {e}")
+            return
+        with self._lock:
+            self._disk[name] = os.path.getsize(self._path(key))
+            self._remember(key, pcm, sample_rate)
+            self._evict_disk()
+
+    def _evict_disk(self):
+        total = sum(self._disk.values())
+        if total <= self.max_disk_bytes:
+            return
+        by_age = sorted(self._disk, key=lambda n: self._mtime(n))
+        for name in by_age:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= self._disk.pop(name)
+            dropped = self._memory.pop(name[:-len(".wav")], None)
+            if dropped is not None:
+                self._memory_bytes -= dropped[0].nbytes
+
+    def _mtime(self, name: str) -> float:
+        try:
+            return os.path.getmtime(os.path.join(self.directory, name))
+        except OSError:
+            return 0.0
+
+    def contains(self, text: str, voice, rate) -> bool:
+        key = self.key(text, voice, rate)
+        return key in self._memory or (key + ".wav") in self._disk
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "files": len(self._disk),
+                "disk_kb": sum(self._disk.values()) // 1024,
+                "memory_kb": self._memory_bytes // 1024}
+
+
+_cache: Optional[PhraseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_phrase_cache() -> PhraseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PhraseCache()
+        return _cache
@@ -0,0 +1,224 @@
+# aura/recognizers.py
+"""
+Speech recognition engines used by the voice panel
+ - VoskStream: feeds audio to Vosk while it is still being captured
+ - RecognizerOrchestrator: runs the local engine and cloud engines in
+   parallel and keeps the first confident answer
+ - ConnectivityMonitor: lets cloud engines be skipped while offline
+"""
+
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeout
+from typing import Callable, Optional, Tuple
+from urllib.parse import urlparse
+
+import speech_recognition as sr
+
+from aura.audio_format import SAMPLE_RATE
+from aura.mic_fix import vosk_input
+
+GOOGLE_ENDPOINT = "http://www.google.com/speech-api/v2/recognize"
+SPHINX_CONFIDENCE = 0.4    # Sphinx reports no score; rank it below a sure cloud answer
+
+# Shared pool so a recognition never pays for thread start-up
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aura-asr")
+
+
+def make_vosk_recognizer(model, sample_rate: int = SAMPLE_RATE):
+    from vosk import KaldiRecognizer
+    rec = KaldiRecognizer(model, sample_rate)
+    rec.SetWords(True)  # per-word confidences for ranking
+    return rec
+
+
+class VoskStream:
+    """
+    Incremental Vosk decoding for one utterance.
+    Pass feed() as MicrophoneFix.listen(on_chunk=...); partial text is
+    reported as it changes and finish() only has to flush the tail.
+    """
+
+    def __init__(self, model, on_partial: Optional[Callable[[str], None]] = None,
+                 recognizer=None):
+        self.model = model
+        self.on_partial = on_partial
+        # A long-lived recognizer can be passed in and is Reset() for reuse
+        self._rec = recognizer
+        self._rate = SAMPLE_RATE if recognizer is not None else None
+        if recognizer is not None:
+            recognizer.Reset()
+        self._segments = []
+        self._confs = []
+        self._last_partial = ""
+        self.chunks = 0
+
+    def feed(self, chunk, sample_rate: int):
+        if self._rec is None or sample_rate != self._rate:
+            self._rec = make_vosk_recognizer(self.model, sample_rate)
+            self._rate = sample_rate
+        self.chunks += 1
+        if self._rec.AcceptWaveform(vosk_input(chunk.data.cast("B"))):
+            # Vosk finalized a segment mid-utterance (user paused briefly)
+            self._add_segment(json.loads(self._rec.Result()))
+            return
+        partial = (json.loads(self._rec.PartialResult()).get("partial") or "").strip()
+        if partial and partial != self._last_partial:
+            self._last_partial = partial
+            if self.on_partial:
+                shown = " ".join(self._segments + [partial])
+                self.on_partial(shown)
+
+    def _add_segment(self, result: dict):
+        text = (result.get("text") or "").strip()
+        if text:
+            self._segments.append(text)
+            self._confs.extend(w.get("conf", 0.0) for w in result.get("result", []))
+
+    @property
+    def confidence(self) -> float:
+        return sum(self._confs) / len(self._confs) if self._confs else 0.0
+
+    def finish(self) -> str:
+        """Flush the recognizer and return the full utterance text."""
+        if self._rec is None:
+            return ""
+        start = time.perf_counter()
+        self._add_segment(json.loads(self._rec.FinalResult()))
+        text = " ".join(self._segments).strip()
+        print(f"[DEBUG] Vosk final result {(time.perf_counter() - start) * 1000:.1f} ms "
+              f"after end of speech ({self.chunks} chunks streamed)")
+        return text
+
+
+class ConnectivityMonitor:
+    """
+    Remembers whether the cloud endpoint is reachable.
+    Failures mark it offline at once; a cheap TCP probe re-checks in the
+    background every `recheck` seconds, so callers never wait on it.
+    """
+
+    def __init__(self, endpoint: str = GOOGLE_ENDPOINT, recheck: float = 15.0,
+                 probe_timeout: float = 1.5):
+        url = urlparse(endpoint)
+        self.host = url.hostname or "localhost"
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.recheck = recheck
+        self.probe_timeout = probe_timeout
+        self.online = True
+        self._checked = 0.0
+        self._probing = threading.Lock()
+
+    def is_online(self) -> bool:
+        if time.monotonic() - self._checked > self.recheck and not self._probing.locked():
+            _executor.submit(self._probe)
+        return self.online
+
+    def _probe(self):
+        if not self._probing.acquire(blocking=False):
+            return
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.probe_timeout):
+                pass
+            self.mark_online()
+        except OSError:
+            self.mark_offline()
+        finally:
+            self._probing.release()
+
+    def mark_online(self):
+        if not self.online:
+            print("INFO: Speech service reachable again, cloud recognition enabled.")
+        self.online = True
+        self._checked = time.monotonic()
+
+    def mark_offline(self):
+        if self.online:
+            print("INFO: Speech service unreachable, using offline recognition only.")
+        self.online = False
+        self._checked = time.monotonic()
+
+
+class RecognizerOrchestrator:
+    """
+    Hedged recognition: the local engine (a finished VoskStream result,
+    or Sphinx) and Google in each configured language run side by side.
+    The first result at or above min_confidence wins and the others are
+    cancelled; if none is confident the best-scoring result is used.
+    """
+
+    def __init__(self, recognizer: sr.Recognizer, languages=("en-US", "en-IN"),
+                 endpoint: str = GOOGLE_ENDPOINT, min_confidence: float = 0.6,
+                 timeout: float = 8.0, connectivity: Optional[ConnectivityMonitor] = None):
+        self.recognizer = recognizer
+        self.languages = tuple(languages)
+        self.endpoint = endpoint
+        self.min_confidence = min_confidence
+        self.timeout = timeout
+        self.connectivity = connectivity or ConnectivityMonitor(endpoint)
+
+    def _google(self, audio, language: str) -> Tuple[str, float]:
+        return self.recognizer.recognize_google(audio, language=language, with_confidence=True,
+                                                endpoint=self.endpoint)
+
+    def _sphinx(self, audio) -> Tuple[str, float]:
+        return self.recognizer.recognize_sphinx(audio), SPHINX_CONFIDENCE
+
+    def recognize(self, audio, local: Optional[Tuple[str, float]] = None) -> Tuple[Optional[str], float, str]:
+        """
+        Returns (text, confidence, engine name); text is None if nothing
+        was recognized. `local` is a (text, confidence) pair already
+        produced by a streaming engine; without it Sphinx runs locally.
+        """
+        start = time.perf_counter()
+        best = (local[0], local[1], "vosk") if local and local[0] else None
+        if best and best[1] >= self.min_confidence:
+            print(f"[DEBUG] Local result confident ({best[1]:.2f}), cloud skipped")
+            return best
+
+        jobs = {}
+        if local is None:
+            jobs[_executor.submit(self._sphinx, audio)] = "sphinx"
+        if self.connectivity.is_online():
+            for lang in self.languages:
+                jobs[_executor.submit(self._google, audio, lang)] = f"google-{lang}"
+        else:
+            print("[DEBUG] Offline - cloud recognizers skipped")
+
+        try:
+            for fut in as_completed(jobs, timeout=self.timeout):
+                name = jobs[fut]
+                try:
+                    text, conf = fut.result()
+                except sr.UnknownValueError:
+                    print(f"[DEBUG] {name} could not understand audio")
+                    continue
+                except sr.RequestError as e:
+                    print(f"[DEBUG] {name} request failed: {e}")
+                    if name.startswith("google"):
+                        self.connectivity.mark_offline()
+                    continue
+                except Exception as e:
+                    print(f"[DEBUG] {name} failed: {e}")
+                    continue
+
+                if name.startswith("google"):
+                    self.connectivity.mark_online()
+                conf = float(conf or 0.0)
+                print(f"[DEBUG] {name} recognized: '{text}' ({conf:.2f}) "
+                      f"after {(time.perf_counter() - start) * 1000:.0f} ms")
+                if text and (best is None or conf > best[1]):
+                    best = (text, conf, name)
+                if best and best[1] >= self.min_confidence:
+                    break
+        except FutureTimeout:
+            print(f"[DEBUG] Recognition timed out after {self.timeout}s")
+        finally:
+            # Pending jobs are dropped; running HTTP calls finish in the
+            # background and their results are ignored
+            for fut in jobs:
+                fut.cancel()
+
+        return best or (None, 0.0, "none")
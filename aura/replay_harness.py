@@ -0,0 +1,253 @@
+# aura/replay_harness.py
+"""
+Offline replay of labeled WAV files through the wake/command pipeline
+ - ReplayBus: stands in for the microphone AudioBus and writes WAV audio
+   into the same ring buffer, as fast as the listener consumes it
+ - run_replay(): feeds a directory through the unchanged WakeWordListener
+   and reports wake detection rate, false triggers per hour, wake-to-ack
+   and recognition latency, and listener CPU per audio second
+ - Times are audio time (seconds of replayed audio), so results do not
+   depend on how fast the machine replays
+
+Labels come from labels.json in the directory, e.g.
+    {"hey_aura_chrome.wav": {"wake": true, "command": "open chrome"}}
+or, without it, from layout: files under a "wake" folder are wake
+samples and every other file is a negative.
+
+Usage: python -m aura.replay_harness <wav dir> [--model models/vosk-small-en]
+"""
+
+import argparse
+import json
+import threading
+import time
+import wave
+import weakref
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from aura.audio_bus import BLOCK_SIZE, BUFFER_SECONDS, SAMPLE_RATE, AudioBus, AudioRingBuffer
+from aura.resample import StreamingResampler
+from aura.vad import frame_features
+
+LEAD_IN = 1.0      # seconds of silence first, so the energy gate can calibrate
+GAP = 1.5          # silence after each file; longer than the gate hangover
+
+
+def load_wav(path: Path) -> np.ndarray:
+    """int16 mono at SAMPLE_RATE, whatever the file's format."""
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV is supported")
+        channels = wf.getnchannels()
+        rate = wf.getframerate()
+        pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    if channels > 1:
+        pcm = pcm.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    if rate != SAMPLE_RATE:
+        pcm = StreamingResampler(rate, SAMPLE_RATE).process(pcm)
+    return pcm
+
+
+def speech_end(pcm: np.ndarray, frame_ms: int = 20) -> float:
+    """Seconds from the start of pcm to the end of its last loud frame."""
+    frame_len = SAMPLE_RATE * frame_ms // 1000
+    energy, _ = frame_features(pcm, frame_len)
+    if not len(energy) or energy.max() <= 0:
+        return len(pcm) / SAMPLE_RATE
+    loud = np.nonzero(energy > energy.max() * 0.01)[0]
+    return (loud[-1] + 1) * frame_len / SAMPLE_RATE
+
+
+def load_labels(directory: Path) -> list:
+    """[(path, {"wake": bool, "command": str or None})] sorted by name."""
+    labels_file = directory / "labels.json"
+    if labels_file.exists():
+        with open(labels_file, encoding="utf-8") as f:
+            labels = json.load(f)
+        return [(directory / name, {"wake": bool(info.get("wake")), "command": info.get("command")})
+                for name, info in sorted(labels.items())]
+    items = []
+    for path in sorted(directory.rglob("*.wav")):
+        rel = path.relative_to(directory)
+        wake = "wake" in rel.parts[:-1] or path.stem.startswith("wake")
+        items.append((path, {"wake": wake, "command": None}))
+    return items
+
+
+class ReplayBus:
+    """
+    Drop-in for AudioBus fed from memory instead of a device.
+
+    play() writes one BLOCK_SIZE block at a time and waits until every
+    attached reader has consumed it and is idle again, so nothing is
+    dropped, the clock never runs ahead of the listener, and it sees the
+    audio exactly as it would live, only faster.
+    The ring's clock is audio time: samples written / sample rate.
+    """
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, buffer_seconds: float = BUFFER_SECONDS,
+                 stall: float = 2.0):
+        self.sample_rate = sample_rate
+        self.native_rate = sample_rate
+        self.buffer_seconds = buffer_seconds
+        self.stall = stall            # give up waiting on a reader that stopped reading
+        self.input_overflows = 0
+        self._written = 0
+        self._readers = weakref.WeakSet()
+        self.ring = AudioRingBuffer(int(sample_rate * buffer_seconds), clock=self.clock)
+
+    def clock(self) -> float:
+        return self._written / self.sample_rate
+
+    @property
+    def is_active(self) -> bool:
+        return True
+
+    def start(self, retries: int = 3):
+        pass
+
+    def stop(self):
+        pass
+
+    def reader(self, preroll: float = 0.0, max_lag: Optional[float] = None,
+               start_pos: Optional[int] = None):
+        reader = AudioBus.reader(self, preroll, max_lag, start_pos)
+        self._readers.add(reader)
+        return reader
+
+    def wait_for_reader(self, timeout: float = 10.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while not len(self._readers):
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _wait_consumed(self):
+        """Block until every reader has read and processed all written audio."""
+        deadline = time.monotonic() + self.stall
+        while (any(r.available() > 0 for r in list(self._readers))
+               or self.ring.waiters < len(self._readers)):
+            if time.monotonic() > deadline:
+                return
+            time.sleep(0.0002)
+
+    def play(self, pcm: np.ndarray):
+        for i in range(0, len(pcm), BLOCK_SIZE):
+            block = pcm[i:i + BLOCK_SIZE]
+            self._wait_consumed()
+            self._written += len(block)
+            self.ring.write(block)
+        self._wait_consumed()
+
+    def play_silence(self, seconds: float, level: float = 30.0, seed: int = 0):
+        """Low-level noise rather than digital zero, like a quiet room."""
+        noise = np.random.default_rng(seed).standard_normal(int(seconds * self.sample_rate)) * level
+        self.play(noise.astype(np.int16))
+
+
+def _percentile(values, q) -> Optional[float]:
+    return float(np.percentile(values, q)) * 1000 if values else None
+
+
+def run_replay(directory, model_path: str = "models/vosk-small-en") -> dict:
+    """Replay every labeled WAV in directory through WakeWordListener; returns metrics."""
+    from aura.wake_word_listener import WakeWordListener
+
+    directory = Path(directory)
+    items = load_labels(directory)
+    if not items:
+        raise FileNotFoundError(f"No WAV files found in {directory}")
+
+    bus = ReplayBus()
+    current = {"index": None, "end_time": 0.0}
+    wakes = []        # (file index, wake end position)
+    commands = []     # (file index, text, latency seconds)
+
+    def on_wake():
+        wakes.append((current["index"], listener.wake_end_pos))
+
+    def on_command(text):
+        # Called on the audio thread as the command is recognized
+        latency = bus.clock() - current["end_time"]
+        commands.append((current["index"], text, latency))
+
+    listener = WakeWordListener(model_path=model_path, on_wake=on_wake, bus=bus)
+    listener.speak = lambda text: None
+    listener.speak_ack = lambda text: None
+    listener.prerender = lambda phrases: None
+    listener.handle_command = lambda text: ""
+    listener.on_command = on_command
+    thread = threading.Thread(target=listener.start, daemon=True)
+    thread.start()
+    listener.set_enabled(True)
+    if not bus.wait_for_reader():
+        listener.stop()
+        raise RuntimeError("Wake word listener did not attach to the replay bus")
+
+    wall_start = time.perf_counter()
+    bus.play_silence(LEAD_IN)
+    for index, (path, label) in enumerate(items):
+        pcm = load_wav(path)
+        current["index"] = index
+        current["end_time"] = bus.clock() + speech_end(pcm)
+        bus.play(pcm)
+        bus.play_silence(GAP, seed=index + 1)
+        # A wake with no command after it must not swallow the next file
+        listener.cancel_command()
+    wall = time.perf_counter() - wall_start
+    listener.stop()
+    thread.join(timeout=2.0)
+
+    audio_seconds = bus.clock()
+    wake_files = [i for i, (_, label) in enumerate(items) if label["wake"]]
+    woke = {i for i, _ in wakes}
+    negatives = [i for i, (_, label) in enumerate(items) if not label["wake"]]
+    false_triggers = sum(1 for i, _ in wakes if i is not None and not items[i][1]["wake"])
+    negative_seconds = sum(len(load_wav(items[i][0])) / SAMPLE_RATE + GAP for i in negatives)
+    expected = [(i, items[i][1]["command"]) for i in wake_files if items[i][1]["command"]]
+    heard = {i: text for i, text, _ in commands}
+    rec_latencies = [lat for _, _, lat in commands]
+
+    return {
+        "files": len(items),
+        "audio_seconds": round(audio_seconds, 1),
+        "realtime_factor": round(wall / audio_seconds, 3) if audio_seconds else None,
+        "wake_detection_rate": len(woke & set(wake_files)) / len(wake_files) if wake_files else None,
+        "false_triggers": false_triggers,
+        "false_triggers_per_hour": (false_triggers * 3600 / negative_seconds
+                                    if negative_seconds else None),
+        "wake_to_ack_ms_p50": _percentile(listener.wake_latencies, 50),
+        "wake_to_ack_ms_p95": _percentile(listener.wake_latencies, 95),
+        "recognition_ms_p50": _percentile(rec_latencies, 50),
+        "recognition_ms_p95": _percentile(rec_latencies, 95),
+        "command_accuracy": (sum(1 for i, cmd in expected if heard.get(i, "").strip() == cmd.lower())
+                             / len(expected) if expected else None),
+        "cpu_ms_per_audio_s": (listener.cpu_seconds * 1000 / listener.audio_seconds
+                               if listener.audio_seconds else None),
+        "max_loop_busy_ms": round(listener.max_busy_ms, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay labeled WAV files through the wake listener")
+    parser.add_argument("directory")
+    parser.add_argument("--model", default="models/vosk-small-en")
+    parser.add_argument("--json", action="store_true", help="print metrics as JSON only")
+    args = parser.parse_args()
+
+    metrics = run_replay(args.directory, args.model)
+    if args.json:
+        print(json.dumps(metrics, indent=2))
+        return
+    print("\n--- AURA Replay Report ---")
+    for key, value in metrics.items():
+        shown = f"{value:.3f}" if isinstance(value, float) else value
+        print(f"{key:>24}: {shown}")
+
+
+if __name__ == "__main__":
+    main()
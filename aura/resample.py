@@ -0,0 +1,70 @@
+# aura/resample.py
+"""
+Streaming sample-rate conversion for AURA's capture path
+ - Rational polyphase FIR (Kaiser-windowed sinc), vectorized with NumPy
+ - Keeps filter history between blocks, so any block size works
+ - Converts the device's native rate to 16 kHz mono int16
+"""
+
+from math import gcd
+
+import numpy as np
+
+
+def design_polyphase(up: int, down: int, taps_per_phase: int = 32, beta: float = 8.0) -> np.ndarray:
+    """
+    Low-pass prototype for an up/down resampler, split into `up` phases.
+    Returns an array of shape (up, taps_per_phase).
+    """
+    n = up * taps_per_phase
+    # Cut off a little below the lower Nyquist so the transition band
+    # doesn't alias back into speech frequencies
+    cutoff = 0.45 / max(up, down)          # cycles per upsampled sample
+    t = np.arange(n) - (n - 1) / 2.0
+    h = 2 * cutoff * np.sinc(2 * cutoff * t) * np.kaiser(n, beta)
+    h *= up / h.sum()                      # unity DC gain after upsampling
+    return h.reshape(taps_per_phase, up).T.astype(np.float32).copy()
+
+
+class StreamingResampler:
+    """
+    Resample int16 mono blocks from in_rate to out_rate.
+    process() may be called with blocks of any length; output length
+    follows the rate ratio with the remainder carried to the next call.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int = 16000, taps_per_phase: int = 32):
+        g = gcd(int(in_rate), int(out_rate))
+        self.in_rate = int(in_rate)
+        self.out_rate = int(out_rate)
+        self.up = self.out_rate // g
+        self.down = self.in_rate // g
+        self.taps = taps_per_phase
+        self.phases = design_polyphase(self.up, self.down, taps_per_phase)
+        self._tap_offsets = np.arange(self.taps)
+        self._hist = np.zeros(self.taps - 1, dtype=np.float32)
+        # Position of the next output, in upsampled samples from the start of
+        # history+block; the newest input used is index (pos // up)
+        self._pos = (self.taps - 1) * self.up
+
+    @property
+    def passthrough(self) -> bool:
+        return self.up == self.down
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        if self.passthrough:
+            return block
+        buf = np.concatenate((self._hist, block.astype(np.float32)))
+        limit = len(buf) * self.up
+        n_out = max(0, -(-(limit - self._pos) // self.down))
+        pos = self._pos + self.down * np.arange(n_out)
+        newest = pos // self.up
+        phase = pos % self.up
+
+        # Each row: the taps input samples ending at 'newest', newest first
+        window = buf[newest[:, None] - self._tap_offsets[None, :]]
+        out = np.einsum("ij,ij->i", window, self.phases[phase])
+
+        self._pos += self.down * n_out - (len(buf) - (self.taps - 1)) * self.up
+        self._hist = buf[len(buf) - (self.taps - 1):]
+        return np.clip(np.rint(out), -32768, 32767).astype(np.int16)
@@ -9,6 +9,7 @@ from PIL import ImageGrab
 import pytesseract
 
 from aura.voice import speak
+from aura.voice_render import render_for_voice
 
 
 def read_screen(full: bool = True):
@@ -27,5 +28,5 @@ def read_screen(full: bool = True):
     if len(short) > 400:
         short = short[:400].rsplit(" ", 1)[0] + "..."
 
-    speak(short)
+    speak(render_for_voice(short, "screen"))
     return f"📖 Read text from screen:\n{short}"
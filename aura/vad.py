@@ -0,0 +1,214 @@
+# aura/vad.py
+"""
+Lightweight voice-activity detection for AURA
+ - Frame energy + zero-crossing rate computed with NumPy
+ - Adaptive noise floor learned from the first frames
+ - Hangover so short pauses inside a phrase don't end it
+ - EnergyGate: skips silent blocks in front of the wake recognizer
+"""
+
+from typing import Optional
+
+import numpy as np
+
+MIN_NOISE_FLOOR = 1e-6     # normalized energy, keeps silence from dividing by ~0
+
+
+def frame_features(samples: np.ndarray, frame_len: int):
+    """
+    Split int16 samples into whole frames and return (energy, zcr) arrays.
+    Energy is mean square of samples scaled to [-1, 1].
+    """
+    n_frames = len(samples) // frame_len
+    if n_frames == 0:
+        empty = np.zeros(0, dtype=np.float32)
+        return empty, empty
+    frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len).astype(np.float32)
+    frames *= 1.0 / 32768.0
+    energy = np.einsum("ij,ij->i", frames, frames) / frame_len
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_len - 1)
+    return energy, zcr
+
+
+class EnergyVAD:
+    """
+    Streaming end-of-speech detector.
+
+    Feed int16 blocks of any size to process(); the detector keeps
+    leftover samples between calls. After speech has started, 'ended'
+    turns True once hangover seconds of non-speech follow it.
+    """
+
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 20,
+                 hangover: float = 0.4, calibration: float = 0.25,
+                 start_ratio: float = 4.0, min_speech: float = 0.1,
+                 noise_floor: Optional[float] = None):
+        self.sample_rate = sample_rate
+        self.frame_len = int(sample_rate * frame_ms / 1000)
+        self.frame_sec = self.frame_len / sample_rate
+        self.hangover_frames = max(1, int(round(hangover / self.frame_sec)))
+        self.calibration_frames = max(1, int(round(calibration / self.frame_sec)))
+        self.min_speech_frames = max(1, int(round(min_speech / self.frame_sec)))
+        self.start_ratio = start_ratio
+        self.noise_floor = noise_floor
+        self._calib = []
+        self._pending = np.zeros(0, dtype=np.int16)
+
+        self.frames_seen = 0
+        self.speech_frames = 0
+        self.silence_run = 0
+        self.speech_started = False
+        self.ended = False
+        self.speech_start_frame = None
+        self.speech_end_frame = None
+
+    # ---------- noise floor ----------
+
+    def _learn_floor(self, energy: np.ndarray) -> np.ndarray:
+        """Use the first frames to set the noise floor; returns frames left to classify."""
+        if self.noise_floor is not None:
+            return energy
+        need = self.calibration_frames - len(self._calib)
+        self._calib.extend(energy[:need].tolist())
+        if len(self._calib) >= self.calibration_frames:
+            # Median keeps a stray click or the start of a word out of the floor
+            self.noise_floor = max(float(np.median(self._calib)), MIN_NOISE_FLOOR)
+        return energy[need:]
+
+    def _adapt_floor(self, energy: np.ndarray, is_speech: np.ndarray):
+        quiet = energy[~is_speech]
+        if len(quiet):
+            self.noise_floor = max(0.95 * self.noise_floor + 0.05 * float(quiet.mean()),
+                                   MIN_NOISE_FLOOR)
+
+    # ---------- classification ----------
+
+    def is_speech(self, energy: np.ndarray, zcr: np.ndarray) -> np.ndarray:
+        loud = energy > self.noise_floor * self.start_ratio
+        # Voiced speech sits in a moderate ZCR band; hiss is high-ZCR and
+        # hum is near zero. Very loud frames pass regardless.
+        voiced = (zcr > 0.01) & (zcr < 0.5)
+        very_loud = energy > self.noise_floor * self.start_ratio * 4
+        return loud & (voiced | very_loud)
+
+    def process(self, samples: np.ndarray) -> bool:
+        """Consume a block. Returns True once end of speech was detected."""
+        if self.ended:
+            return True
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+        energy, zcr = frame_features(samples, self.frame_len)
+        self._pending = samples[len(energy) * self.frame_len:]
+
+        skipped = len(energy)
+        energy = self._learn_floor(energy)
+        zcr = zcr[len(zcr) - len(energy):]
+        self.frames_seen += skipped - len(energy)
+        if not len(energy):
+            return False
+
+        speech = self.is_speech(energy, zcr)
+        for i, s in enumerate(speech):
+            frame_idx = self.frames_seen + i
+            if s:
+                self.speech_frames += 1
+                self.silence_run = 0
+                if not self.speech_started and self.speech_frames >= self.min_speech_frames:
+                    self.speech_started = True
+                    self.speech_start_frame = frame_idx - self.min_speech_frames + 1
+            else:
+                self.silence_run += 1
+                if not self.speech_started:
+                    self.speech_frames = 0
+                elif self.silence_run >= self.hangover_frames:
+                    self.ended = True
+                    self.speech_end_frame = frame_idx - self.silence_run + 1
+                    break
+        self.frames_seen += len(energy)
+        self._adapt_floor(energy, speech)
+        return self.ended
+
+    def seconds(self, frames: Optional[int]) -> float:
+        return (frames or 0) * self.frame_sec
+
+
+class EnergyGate:
+    """
+    Cheap front gate for a streaming recognizer.
+
+    Blocks are dropped while the room is quiet. When energy rises above
+    the noise floor the gate opens and returns the last `preroll`
+    seconds of skipped audio first, so word onsets reach the recognizer.
+    It stays open for `hangover` seconds after the last loud frame so
+    the recognizer also sees the trailing silence it needs to finalize.
+    """
+
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 20,
+                 open_ratio: float = 3.0, preroll: float = 0.3,
+                 hangover: float = 1.0, calibration: float = 0.5):
+        self.frame_len = int(sample_rate * frame_ms / 1000)
+        self.open_ratio = open_ratio
+        self.preroll_samples = int(preroll * sample_rate)
+        self.hangover_samples = int(hangover * sample_rate)
+        self.calibration_frames = max(1, int(calibration * 1000 / frame_ms))
+        self.noise_floor: Optional[float] = None
+        self._calib = []
+        self._preroll = []
+        self._preroll_len = 0
+        self._quiet_run = 0
+        self.is_open = False
+        self.just_closed = False
+        self.blocks_seen = 0
+        self.blocks_passed = 0
+
+    def _loud(self, block: np.ndarray) -> bool:
+        energy, _ = frame_features(block, self.frame_len)
+        if not len(energy):
+            return False
+        if self.noise_floor is None:
+            self._calib.extend(energy.tolist())
+            if len(self._calib) < self.calibration_frames:
+                return False
+            self.noise_floor = max(float(np.median(self._calib)), MIN_NOISE_FLOOR)
+        # Two loud frames, so a single click doesn't wake the decoder
+        loud = int(np.count_nonzero(energy > self.noise_floor * self.open_ratio)) >= 2
+        if not loud:
+            # Track slow changes in room noise (fans, traffic)
+            self.noise_floor = max(0.95 * self.noise_floor + 0.05 * float(energy.mean()),
+                                   MIN_NOISE_FLOOR)
+        return loud
+
+    def process(self, block: np.ndarray) -> list:
+        """Returns the blocks to feed the recognizer (empty while gated)."""
+        self.blocks_seen += 1
+        self.just_closed = False
+        loud = self._loud(block)
+
+        if self.is_open:
+            self._quiet_run = 0 if loud else self._quiet_run + len(block)
+            if self._quiet_run >= self.hangover_samples:
+                self.is_open = False
+                self.just_closed = True
+            self.blocks_passed += 1
+            return [block]
+
+        if loud:
+            self.is_open = True
+            self._quiet_run = 0
+            out = self._preroll + [block]
+            self._preroll = []
+            self._preroll_len = 0
+            self.blocks_passed += len(out)
+            return out
+
+        # Closed: remember recent audio for the pre-roll
+        self._preroll.append(block)
+        self._preroll_len += len(block)
+        while self._preroll and self._preroll_len - len(self._preroll[0]) >= self.preroll_samples:
+            self._preroll_len -= len(self._preroll.pop(0))
+        return []
+
+    @property
+    def pass_ratio(self) -> float:
+        return self.blocks_passed / self.blocks_seen if self.blocks_seen else 0.0
@@ -4,16 +4,67 @@ Voice utilities for AURA
  - Natural TTS using pyttsx3
  - English + Kannada bilingual support
  - Speaking state flag for UI animation
+ - Speech is rendered to PCM and played here, and the PCM is published
+   to the echo gate so listeners can ignore AURA's own voice
+ - One TTS worker thread owns the engine and plays a priority queue:
+   acknowledgements preempt longer answers (which then resume), an
+   identical message already queued is not queued twice, and
+   interrupt() stops speech at once for barge-in
+ - Long responses are split into sentences; the next one is rendered
+   on a helper thread while the current one plays, so speech starts
+   after the first sentence is ready, and interrupts and preempting
+   acknowledgements are still honored during the render
+ - Rendered audio of fixed and frequently repeated phrases is cached
+   (aura/phrase_cache.py) and played without calling the engine
 """
 
+import heapq
+import itertools
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import wave
+from collections import deque
+from threading import Condition, Event, Lock, Thread
+
+import numpy as np
 import pyttsx3
-from threading import Lock, Thread
+
+from aura.echo_gate import get_echo_gate
+from aura.phrase_cache import get_phrase_cache
+
+PRIORITY_ACK = 0       # short acknowledgements, played first
+PRIORITY_NORMAL = 1    # answers
 
 _engine = None
 _engine_lock = Lock()
 
 _current_lang = "en"
-_is_speaking = False
+_last_voice_key = None   # (voice id, rate) of the last render
+_rendering = None        # helper thread rendering a next chunk; owns the engine meanwhile
+
+# Language -> voice id, from one scan of the installed voices; kept on disk
+VOICE_MAP_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".cache", "voice_map.json"))
+_voice_map = None
+
+# Kannada block: 0C80–0CFF
+_KANNADA = re.compile("[\u0C80-\u0CFF]")
+
+# Worker state; _cond guards _queue and _current
+_cond = Condition()
+_queue = []            # heap of (priority, seq, _Utterance)
+_seq = itertools.count()
+_current = None
+_prerender = deque()   # fixed phrases to render into the cache when idle
+_worker = None
+_speaking = Event()    # set while audio is playing
+_preempt = Event()     # pause the current utterance for a higher-priority one
+_interrupt = Event()   # drop the current utterance
+_finish_chunk = Event()  # drop the current utterance once its chunk has played
+first_audio_ms = deque(maxlen=100)  # time from speak() to first audio, per utterance
 
 
 def _get_engine():
@@ -33,35 +84,60 @@ def _get_engine():
         return _engine
 
 
-def _pick_voice_for_lang(engine, lang: str):
-    """
-    Try to pick a nice voice for the given language.
-    lang: "en" or "kn"
-    """
-    voices = engine.getProperty("voices")
-    if not voices:
-        return None
+def _load_voice_map() -> dict:
+    try:
+        with open(VOICE_MAP_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("platform") != sys.platform:
+        return {}
+    return dict(data.get("map") or {})
 
-    lang = (lang or "en").lower()
 
-    # Prefer Kannada voice when requested
-    if lang.startswith("kn"):
-        for v in voices:
-            n = (v.name or "").lower()
-            l = "".join(getattr(v, "languages", [])).lower()
-            if "kannada" in n or "kn_" in l or "kn-in" in l:
-                return v.id
+def _save_voice_map(mapping: dict):
+    try:
+        os.makedirs(os.path.dirname(VOICE_MAP_FILE), exist_ok=True)
+        with open(VOICE_MAP_FILE, "w", encoding="utf-8") as f:
+            json.dump({"platform": sys.platform, "map": mapping}, f, indent=2)
+    except OSError:
+        pass
 
-    # For English: prefer female / Indian / English voices
-    for v in voices:
-        n = (v.name or "").lower()
-        l = "".join(getattr(v, "languages", [])).lower()
-        if ("female" in n or "zira" in n or "india" in n or "english" in n
-                or "en_" in l):
-            return v.id
 
-    # Fallback: first available voice
-    return voices[0].id
+def _build_voice_map(engine) -> dict:
+    """
+    One pass over the installed voices: the preferred voice per language.
+    Kannada prefers a Kannada voice; English (and Kannada without one) a
+    female / Indian / English voice, else the first voice.
+    """
+    voices = engine.getProperty("voices") or []
+    catalog = [(v.id, (v.name or "").lower(),
+                "".join(str(l) for l in getattr(v, "languages", None) or []).lower())
+               for v in voices]
+    mapping = {}
+    for vid, name, langs in catalog:
+        if "kannada" in name or "kn_" in langs or "kn-in" in langs:
+            mapping.setdefault("kn", vid)
+        if ("female" in name or "zira" in name or "india" in name or "english" in name
+                or "en_" in langs):
+            mapping.setdefault("en", vid)
+    if catalog:
+        mapping.setdefault("en", catalog[0][0])
+        mapping.setdefault("kn", mapping["en"])
+    _save_voice_map(mapping)
+    return mapping
+
+
+def _pick_voice_for_lang(engine, lang: str, refresh: bool = False):
+    """
+    Voice id for the given language ("en" or "kn"), from the voice map.
+    The map is built once and persisted; refresh rebuilds it from the engine.
+    """
+    global _voice_map
+    if _voice_map is None or refresh:
+        _voice_map = (not refresh and _load_voice_map()) or _build_voice_map(engine)
+    lang = (lang or "en").lower()
+    return _voice_map.get("kn" if lang.startswith("kn") else "en")
 
 
 def _detect_lang_from_text(text: str) -> str:
@@ -70,60 +146,382 @@ def _detect_lang_from_text(text: str) -> str:
       - if contains Kannada Unicode chars → "kn"
       - else "en"
     """
-    if not text:
-        return "en"
-
-    for ch in text:
-        code = ord(ch)
-        # Kannada block: 0C80–0CFF
-        if 0x0C80 <= code <= 0x0CFF:
-            return "kn"
+    if text and _KANNADA.search(text):
+        return "kn"
     return "en"
 
 
-def _do_speak(text: str, lang: str):
-    global _is_speaking, _current_lang
-
-    engine = _get_engine()
-    if not engine:
-        print("TTS engine not available, text:", text)
-        return
-
-    # auto-detect if needed
-    if lang == "auto":
-        lang = _detect_lang_from_text(text)
-
+def _select_voice(engine, lang: str):
+    global _current_lang
     # change voice if language changed
     if lang != _current_lang:
         voice_id = _pick_voice_for_lang(engine, lang)
         if voice_id:
-            engine.setProperty("voice", voice_id)
+            try:
+                engine.setProperty("voice", voice_id)
+            except Exception:
+                # Saved voice no longer installed: enumerate voices again
+                voice_id = _pick_voice_for_lang(engine, lang, refresh=True)
+                if not voice_id:
+                    return
+                engine.setProperty("voice", voice_id)
             _current_lang = lang
 
-    _is_speaking = True
+
+def _voice_key(engine):
+    """(voice id, rate) the engine will render with, or None if unknown."""
+    global _last_voice_key
     try:
-        engine.say(text)
+        _last_voice_key = engine.getProperty("voice"), engine.getProperty("rate")
+    except Exception:
+        return None
+    return _last_voice_key
+
+
+def _wait_render():
+    """pyttsx3 is not thread-safe: let a render ahead finish before using the engine."""
+    global _rendering
+    if _rendering is not None:
+        _rendering.join()
+        _rendering = None
+
+
+def _render_pcm(engine, text: str):
+    """Synthesize text to int16 mono PCM. Returns (pcm, rate) or None."""
+    fd, path = tempfile.mkstemp(suffix=".wav", prefix="aura_tts_")
+    os.close(fd)
+    try:
+        engine.save_to_file(text, path)
         engine.runAndWait()
+        with wave.open(path, "rb") as wf:
+            if wf.getsampwidth() != 2:
+                return None
+            channels = wf.getnchannels()
+            rate = wf.getframerate()
+            pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        if channels > 1:
+            pcm = pcm.reshape(-1, channels).mean(axis=1).astype(np.int16)
+        return (pcm, rate) if len(pcm) else None
     except Exception as e:
-        print("TTS speak error:", e)
+        print(f"[DEBUG] TTS render to PCM failed: {e}")
+        return None
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _output_start(pcm: np.ndarray, rate: int):
+    import sounddevice as sd
+    sd.play(pcm, rate)
+
+
+def _output_stop():
+    import sounddevice as sd
+    sd.stop()
+
+
+# Sentence ends (including the Devanagari danda) and line breaks
+_SENTENCE_END = re.compile(r"(?<=[.!?\u0964])\s+|\n+")
+
+
+def _cut_point(piece: str, limit: int) -> int:
+    for sep in (", ", "; ", ": ", " "):
+        i = piece.rfind(sep, 0, limit)
+        if i > 0:
+            return i + 1
+    return limit
+
+
+def split_for_speech(text: str, max_chars: int = 200, first_chars: int = 80) -> list:
+    """
+    Split text into sentences to synthesize one at a time. Long sentences
+    are cut at a clause (or word) boundary; the first chunk is kept short
+    so speech starts sooner.
+    """
+    chunks = []
+    for piece in _SENTENCE_END.split(text):
+        piece = piece.strip()
+        limit = max_chars if chunks else first_chars
+        while len(piece) > limit:
+            cut = _cut_point(piece, limit)
+            chunks.append(piece[:cut].strip())
+            piece = piece[cut:].strip()
+            limit = max_chars
+        if piece:
+            chunks.append(piece)
+    return chunks or [text]
+
+
+class _Utterance:
+    __slots__ = ("text", "lang", "priority", "seq", "done", "chunks", "index",
+                 "pcm", "rate", "offset", "next", "queued_at", "first_audio_ms")
+
+    def __init__(self, text: str, lang: str, priority: int):
+        self.text = text
+        self.lang = lang
+        self.priority = priority
+        self.seq = next(_seq)
+        self.done = Event()
+        self.chunks = split_for_speech(text)
+        self.index = 0         # chunk being played
+        self.pcm = None        # rendered audio of that chunk, kept so a preempted answer can resume
+        self.rate = None
+        self.offset = 0        # samples of it already played
+        self.next = None       # next chunk, rendered while this one plays (False: render failed)
+        self.queued_at = time.perf_counter()
+        self.first_audio_ms = None
+
+
+def _play_pcm(utt: _Utterance, prepare=None) -> bool:
+    """
+    Play the current chunk of utt from its offset, handing the same samples
+    to the echo gate as reference. prepare() is started on a helper thread
+    once the audio has started, unless speech was already stopped; the
+    engine is the helper's until _wait_render(). Returns False if
+    preempted (offset is kept), True when finished or interrupted.
+    """
+    global _rendering
+    from aura.audio_format import SAMPLE_RATE
+    from aura.resample import StreamingResampler
+
+    pcm = utt.pcm[utt.offset:]
+    rate = utt.rate
+    ref = pcm if rate == SAMPLE_RATE else StreamingResampler(rate, SAMPLE_RATE).process(pcm)
+    get_echo_gate().publish(ref, start_time=time.monotonic())
+    start = time.monotonic()
+    duration = len(pcm) / rate
+    _output_start(pcm, rate)
+    _speaking.set()
+    if utt.first_audio_ms is None:
+        utt.first_audio_ms = (time.perf_counter() - utt.queued_at) * 1000
+        first_audio_ms.append(utt.first_audio_ms)
+        print(f"[DEBUG] TTS first audio after {utt.first_audio_ms:.0f} ms "
+              f"({len(utt.chunks)} chunk(s))")
+    try:
+        if prepare is not None and not (_interrupt.is_set() or _preempt.is_set()):
+            _rendering = Thread(target=prepare, name="aura-tts-render", daemon=True)
+            _rendering.start()
+        while True:
+            if _interrupt.wait(0.02):
+                return True
+            elapsed = time.monotonic() - start
+            if _preempt.is_set():
+                utt.offset += min(len(pcm), int(elapsed * rate))
+                return False
+            if elapsed >= duration:
+                return True
+    finally:
+        _output_stop()
+        _speaking.clear()
+
+
+def _render_chunk(engine, text: str):
+    """PCM for one chunk, from the phrase cache when possible."""
+    cache = get_phrase_cache()
+    key = _voice_key(engine)
+    rendered = cache.get(text, *key) if key else None
+    if rendered is None:
+        rendered = _render_pcm(engine, text)
+        if rendered is not None and key and cache.should_cache(text):
+            cache.put(text, *key, *rendered)
+    return rendered
+
+
+def _say_unreferenced(engine, text: str):
+    # Engine can't render to a file: speak directly (not interruptible
+    # mid-chunk), with the echo gate muting capture
+    gate = get_echo_gate()
+    gate.set_unreferenced(True)
+    _speaking.set()
+    try:
+        engine.say(text)
+        engine.runAndWait()
     finally:
-        _is_speaking = False
+        _speaking.clear()
+        gate.set_unreferenced(False)
+
+
+def _speak_one(utt: _Utterance) -> bool:
+    """
+    Play one utterance chunk by chunk on the worker thread; each next chunk
+    is rendered while the one before it plays. Returns False if preempted.
+    """
+    lang = _detect_lang_from_text(utt.text) if utt.lang == "auto" else utt.lang
+    if _rendering is not None and utt.pcm is None and len(utt.chunks) == 1:
+        # The engine is busy rendering ahead for an utterance this one
+        # preempted; a cached phrase (an acknowledgement) plays without it
+        cached = _from_cache(utt.chunks[0], lang)
+        if cached is not None:
+            utt.pcm, utt.rate = cached
+            return _play_pcm(utt)
+    _wait_render()
+    engine = _get_engine()
+    if not engine:
+        print("TTS engine not available, text:", utt.text)
+        return True
+
+    _select_voice(engine, lang)
+
+    def prepare_next():
+        utt.next = _render_chunk(engine, utt.chunks[utt.index + 1]) or False
+
+    while utt.index < len(utt.chunks):
+        if utt.pcm is None:
+            _wait_render()   # utt.next may still be rendering
+            if _interrupt.is_set() or _finish_chunk.is_set():
+                return True
+            if _preempt.is_set():
+                return False
+            rendered = utt.next if utt.next is not None else _render_chunk(engine, utt.chunks[utt.index])
+            utt.next = None
+            if rendered:
+                utt.pcm, utt.rate = rendered
+            else:
+                _say_unreferenced(engine, utt.chunks[utt.index])
+        if utt.pcm is not None:
+            has_next = utt.index + 1 < len(utt.chunks) and utt.next is None
+            if not _play_pcm(utt, prepare_next if has_next else None):
+                return False
+        if _interrupt.is_set() or _finish_chunk.is_set():
+            return True
+        utt.index += 1
+        utt.pcm, utt.offset = None, 0
+    return True
+
+
+def _from_cache(text: str, lang: str):
+    """Cached (pcm, rate) of text in the current voice, found without the engine."""
+    if lang != _current_lang or _last_voice_key is None:
+        return None
+    return get_phrase_cache().get(text, *_last_voice_key)
 
 
-def speak(text: str, lang: str = "auto", async_: bool = True):
+def _prerender_one(text: str):
+    """Render a fixed phrase into the cache unless it is already there."""
+    _wait_render()
+    engine = _get_engine()
+    if not engine:
+        return
+    _select_voice(engine, _detect_lang_from_text(text))
+    key = _voice_key(engine)
+    cache = get_phrase_cache()
+    if key is None or cache.contains(text, *key):
+        return
+    rendered = _render_pcm(engine, text)
+    if rendered is not None:
+        cache.put(text, *key, *rendered)
+
+
+def _worker_loop():
+    global _current
+    while True:
+        with _cond:
+            while not _queue and not _prerender:
+                _cond.wait()
+            if _queue:
+                _, _, utt = heapq.heappop(_queue)
+                _current = utt
+                _preempt.clear()
+                _interrupt.clear()
+                _finish_chunk.clear()
+            else:
+                utt = None
+                text = _prerender.popleft()
+        if utt is None:
+            try:
+                _prerender_one(text)
+            except Exception as e:
+                print(f"[DEBUG] TTS prerender failed: {e}")
+            continue
+        finished = True
+        try:
+            finished = _speak_one(utt)
+        except Exception as e:
+            print("TTS speak error:", e)
+        finally:
+            with _cond:
+                _current = None
+                if not finished:
+                    # Preempted: resume where it stopped, after the acknowledgement
+                    heapq.heappush(_queue, (utt.priority, utt.seq, utt))
+        if finished:
+            utt.done.set()
+
+
+def _ensure_worker():
+    global _worker
+    with _cond:
+        if _worker is None or not _worker.is_alive():
+            _worker = Thread(target=_worker_loop, name="aura-tts", daemon=True)
+            _worker.start()
+
+
+def _enqueue(text: str, lang: str, priority: int) -> _Utterance:
+    _ensure_worker()
+    with _cond:
+        # The same message already waiting (or playing) is said once
+        for _, _, queued in _queue:
+            if queued.text == text:
+                return queued
+        if (_current is not None and _current.text == text
+                and not _interrupt.is_set() and not _finish_chunk.is_set()):
+            return _current
+        utt = _Utterance(text, lang, priority)
+        heapq.heappush(_queue, (priority, utt.seq, utt))
+        if _current is not None and priority < _current.priority:
+            _preempt.set()
+        _cond.notify()
+        return utt
+
+
+def speak(text: str, lang: str = "auto", async_: bool = True,
+          priority: int = PRIORITY_NORMAL):
     """
     Speak text.
       lang: "en", "kn" or "auto"
-      async_: if True, speak in background thread
+      async_: if True, return at once; else wait until it has been spoken
+      priority: PRIORITY_ACK preempts a normal answer that is playing
     """
     if not text:
         return
 
-    if async_:
-        t = Thread(target=_do_speak, args=(text, lang), daemon=True)
-        t.start()
-    else:
-        _do_speak(text, lang)
+    utt = _enqueue(text, lang, priority)
+    if not async_:
+        utt.done.wait()
+
+
+def speak_ack(text: str):
+    """Short acknowledgement; plays ahead of (and pauses) longer answers."""
+    speak(text, lang="auto", async_=True, priority=PRIORITY_ACK)
+
+
+def prerender(phrases):
+    """
+    Cache the audio of phrases AURA always says the same way (acknowledgements,
+    greetings). Rendered on the TTS worker while nothing is queued.
+    """
+    phrases = [p for p in phrases if p]
+    get_phrase_cache().mark_fixed(phrases)
+    _ensure_worker()
+    with _cond:
+        _prerender.extend(phrases)
+        _cond.notify()
+
+
+def interrupt(after_chunk: bool = False):
+    """
+    Barge-in: stop speaking now and drop everything queued. With
+    after_chunk, the sentence being spoken is finished first.
+    """
+    with _cond:
+        dropped = [utt for _, _, utt in _queue]
+        _queue.clear()
+        if _current is not None:
+            (_finish_chunk if after_chunk else _interrupt).set()
+    for utt in dropped:
+        utt.done.set()
 
 
 def speak_en(text: str):
@@ -157,4 +555,4 @@ def is_speaking() -> bool:
     """
     Used by UI (logo animation) to know if AURA is currently speaking.
     """
-    return _is_speaking
+    return _speaking.is_set()
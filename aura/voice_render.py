@@ -0,0 +1,153 @@
+# aura/voice_render.py
+"""
+Turns chat responses into something worth listening to
+ - Drops markdown, emoji and status tags like [OK] / [APP]
+ - Bullet lists become a one-line summary, full paths their file name
+ - Spoken length is capped per category (at a sentence end); the chat
+   panel still shows the full text
+ - Estimated spoken duration before and after is kept for comparison
+"""
+
+import re
+from collections import deque
+
+WORDS_PER_MINUTE = 175   # pyttsx3 rate set in aura/voice.py
+
+# Longest spoken text, in characters, per kind of response. Keys match
+# the categories command_engine logs for a turn; others are guessed
+CATEGORY_LIMITS = {
+    "default": 250,
+    "list": 200,
+    "file": 300,
+    "screen": 400,
+    "email": 250,
+}
+
+_TAG = re.compile(r"\[[A-Z]{1,6}\]|\(i\)")
+_EMOJI = re.compile("[\U0001F000-\U0001FAFF\u2300-\u23FF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D]+")
+_MARKDOWN = re.compile(r"\*\*|__|`+|^#+\s*", re.MULTILINE)
+_BULLET = re.compile(r"^\s*(?:[•\-*]|\d+[.)])\s+")
+_PATH = re.compile(r"(?:[A-Za-z]:\\|~?/)[^\s,;:()'\"]*[\\/]([^\s\\/,;:()'\"]+)")
+_PATH_IN_PARENS = re.compile(r"\s*\((?:[A-Za-z]:\\|~?/)[^)]*\)")
+_LABELED = re.compile(r"^([\w' /&-]{1,30}): \S")
+_COUNTED = re.compile(r"^(\d+) ([a-z]+): (.+?)(?: and \d+ more)?$", re.IGNORECASE)
+
+before_seconds = deque(maxlen=200)
+after_seconds = deque(maxlen=200)
+
+
+def speech_seconds(text: str) -> float:
+    """Rough time it takes to say text at the TTS speaking rate."""
+    return len(text.split()) * 60.0 / WORDS_PER_MINUTE
+
+
+def _clean(line: str) -> str:
+    line = _EMOJI.sub("", _TAG.sub("", line))
+    line = _MARKDOWN.sub("", _PATH_IN_PARENS.sub("", line))
+    line = _PATH.sub(r"\1", line)
+    return re.sub(r"\s{2,}", " ", line).strip(" -")
+
+
+def _names(items: list, total: int = None, limit: int = 3) -> str:
+    total = max(total or 0, len(items))
+    shown = items[:limit]
+    if total > len(shown):
+        return ", ".join(shown) + f" and {total - len(shown)} more"
+    if len(shown) > 1:
+        return ", ".join(shown[:-1]) + " and " + shown[-1]
+    return shown[0] if shown else ""
+
+
+def _summarize(lines: list) -> list:
+    """
+    Spoken parts of a response, in order. A run of bullet items (or of
+    three or more "Label: text" lines) becomes one part naming the first
+    few; "N folders: a, b" lines become "N folders and M files, including a, b".
+    """
+    out, items, counted = [], [], []
+
+    def add(part):
+        if out and out[-1].endswith(":"):
+            out[-1] = out[-1] + " " + part
+        else:
+            out.append(part)
+
+    def flush():
+        if counted:
+            totals = " and ".join(f"{m.group(1)} {m.group(2)}" for m in counted)
+            names = [n.strip() for m in counted for n in m.group(3).split(",")]
+            add(f"{totals}, including {_names(names, sum(int(m.group(1)) for m in counted))}")
+            counted.clear()
+        if items:
+            if len(items) >= 3 or any(bullet for bullet, _ in items):
+                labels = [(_LABELED.match(t).group(1) if _LABELED.match(t) else t).strip("'\"")
+                          for _, t in items]
+                add(_names(labels))
+            else:
+                for _, t in items:
+                    add(t)
+            items.clear()
+
+    for raw in lines:
+        bullet = bool(_BULLET.match(raw))
+        line = _clean(_BULLET.sub("", raw))
+        if not line:
+            continue
+        match = _COUNTED.match(line)
+        if match:
+            counted.append(match)
+        elif bullet or _LABELED.match(line):
+            if counted:
+                flush()
+            items.append((bullet, line))
+        else:
+            flush()
+            add(line)
+    flush()
+    return out
+
+
+def _cap(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    cut = max(text.rfind(". ", 0, limit), text.rfind("? ", 0, limit), text.rfind("! ", 0, limit))
+    if cut > limit // 3:
+        return text[:cut + 1]
+    return text[:limit].rsplit(" ", 1)[0] + "..."
+
+
+def guess_category(text: str) -> str:
+    lines = text.splitlines()
+    if any(_BULLET.match(l) or _COUNTED.match(_clean(l)) for l in lines):
+        return "list"
+    return "default"
+
+
+def render_for_voice(text: str, category: str = None) -> str:
+    """Spoken form of a response; category picks the length cap."""
+    if not text:
+        return ""
+    if category not in CATEGORY_LIMITS:
+        category = guess_category(text)
+    sentences = []
+    for part in _summarize(text.splitlines()):
+        part = part.rstrip(": ")
+        if part:
+            ended = part.rstrip("'\")")[-1:] in (".", "!", "?")
+            sentences.append(part if ended else part + ".")
+    spoken = _cap(" ".join(sentences), CATEGORY_LIMITS.get(category, CATEGORY_LIMITS["default"]))
+    before_seconds.append(speech_seconds(text))
+    after_seconds.append(speech_seconds(spoken))
+    return spoken
+
+
+def duration_stats() -> dict:
+    """Average estimated seconds of speech per response, before and after."""
+    n = len(after_seconds)
+    if not n:
+        return {"responses": 0, "before_s": 0.0, "after_s": 0.0}
+    return {
+        "responses": n,
+        "before_s": round(sum(before_seconds) / n, 2),
+        "after_s": round(sum(after_seconds) / n, 2),
+    }
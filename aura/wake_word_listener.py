@@ -1,95 +1,128 @@
 # aura/wake_word_listener.py
 
 import json
-import queue
 import time
+from collections import deque
+from pathlib import Path
 from typing import Callable, Optional
-import platform
 
-import sounddevice as sd
-from vosk import Model, KaldiRecognizer
+from vosk import KaldiRecognizer
 
-from aura.engine import handle_command
-from aura.voice import speak_auto
+from aura.audio_bus import SAMPLE_RATE, get_audio_bus
+from aura.command_engine import GREETING_RESPONSES
+from aura.command_executor import get_command_executor
+from aura.echo_gate import get_echo_gate
+from aura.engine import handle_command, turn_category
+from aura.mic_fix import vosk_input
+from aura.model_registry import get_model_registry
+from aura.phonetic import PhraseMatcher
+from aura.vad import EnergyGate
+from aura.voice import interrupt, is_speaking, prerender, speak_ack, speak_auto
+from aura.voice_render import render_for_voice
 
+WAKE_BLOCK = 3200  # samples per gate/recognizer step (0.2 s at 16 kHz)
 
-WAKE_WORDS = [
-    "hey aura", "hai aura", "hey ora", "aura", "hey aurora",
-    "hi aura", "hello aura", "ok aura", "hey euler", "hey aura",
-    "air", "ora", "are you there", "wake up", "aurora", "euler",
-    "herrera", "a herrera", "hey herrera"  # Adding variations that were detected
+CONFIG_FILE = Path("aura_config.json")
+
+# Said the same way every time, so their audio is rendered ahead of use
+ACK_PHRASE = "Yes, I'm listening."
+READY_PHRASE = "Voice assistant ready. Say Hey AURA to wake me up."
+
+# Used when aura_config.json has no "wake_phrases"; spellings the
+# recognizer has produced for the wake phrase
+DEFAULT_WAKE_PHRASES = [
+    "hey aura", "hi aura", "hello aura", "hey aurora", "hai aura", "hey ora", "aura",
+    "hey ira", "hey ara", "hey our", "hey ura", "hey error", "hi ora", "hello ora",
+    "hey order", "he aura", "a aura", "hey allah", "hey aural", "hey oral", "hey aur",
+    "aye aura", "hay aura", "hey hora", "hey laura", "hey aida", "ok aura", "okay aura",
+    "hello aurora",
 ]
 
-# Fuzzy matching for better wake word detection
-def _fuzzy_match(text: str, target: str, threshold: float = 0.6) -> bool:
-    """Simple fuzzy matching for wake words"""
-    if target in text:
-        return True
-    
-    # Check for partial matches
-    words = text.split()
-    for word in words:
-        if len(word) >= 3 and len(target) >= 3:
-            # Simple character overlap check
-            overlap = sum(1 for char in word if char in target)
-            if overlap / len(target) >= threshold:
-                return True
-    return False
+def load_wake_phrases(path: Path = CONFIG_FILE) -> list:
+    """Wake phrase spellings from the config file, else the defaults."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            phrases = json.load(f).get("wake_phrases")
+        if phrases:
+            return list(phrases)
+    except (OSError, ValueError, AttributeError):
+        pass
+    return list(DEFAULT_WAKE_PHRASES)
+
+
+def build_wake_grammar(phrases, model=None) -> list:
+    """
+    The only phrases the wake recognizer can output: the wake phrases
+    whose words are all in the model's vocabulary, plus [unk], which
+    everything else decodes as.
+    """
+    find_word = getattr(model, "find_word", None)
+    grammar, dropped = [], []
+    for phrase in phrases:
+        phrase = phrase.lower().strip()
+        if not phrase or phrase in grammar:
+            continue
+        if find_word is not None and any(find_word(w) < 0 for w in phrase.split()):
+            dropped.append(phrase)
+        else:
+            grammar.append(phrase)
+    if dropped:
+        print(f"INFO: Wake phrases not in the speech model's vocabulary: {dropped}")
+    return grammar + ["[unk]"]
 
 
 class WakeWordListener:
     def __init__(self, model_path: str = "models/vosk-small-en",
                  on_wake: Optional[Callable] = None,
-                 device: Optional[int] = None):
-        self.model = Model(model_path)
-        self.rec = KaldiRecognizer(self.model, 16000)
-        self.q: queue.Queue[bytes] = queue.Queue()
+                 device: Optional[int] = None,
+                 bus=None):
+        # Shared with the voice panel; loaded once, in the background, and
+        # leased so the registry does not evict it while listening
+        self.model = get_model_registry().get(model_path)
+        self._model_path = model_path
+        # Compiled once; matching a transcript is a single pass over its words
+        self.wake_phrases = load_wake_phrases()
+        self.wake_matcher = PhraseMatcher(self.wake_phrases)
+        # Wake mode decodes against a small grammar built from the same
+        # phrases; the full vocabulary is only used for the command after a
+        # wake. Both share the model and are Reset() between uses rather
+        # than rebuilt.
+        self.wake_grammar = build_wake_grammar(self.wake_phrases, self.model)
+        self.wake_rec = KaldiRecognizer(self.model, SAMPLE_RATE, json.dumps(self.wake_grammar))
+        self.wake_rec.SetWords(True)
+        self.wake_rec.SetPartialWords(True)  # word end times for wake latency
+        self.command_rec = KaldiRecognizer(self.model, SAMPLE_RATE)
+        self.rec = self.wake_rec
         self.listening_for_command = False
         self.on_wake = on_wake
         self.enabled = False  # Start disabled by default
-        self.last_response_time = 0  # Track when we last spoke
-        self.ignore_duration = 3.0   # Ignore audio for 3 seconds after speaking
-        # Windows-specific device detection to prevent PaErrorCode -9999
-        if device is None and platform.system() == "Windows":
-            self.device = self._find_best_device()
-            if self.device is not None:
-                print(f"INFO: WakeWordListener: Using optimal device index {self.device}")
-        else:
-            self.device = device
-
-    def _find_best_device(self):
-        """Helper to find the best input device on Windows (WDM-KS > WASAPI)"""
-        try:
-            apis = sd.query_hostapis()
-            
-            # Prioritize WDM-KS
-            for api in apis:
-                if "WDM-KS" in api['name']:
-                    dev_index = api.get('default_input_device', -1)
-                    if dev_index != -1:
-                        return dev_index
-            
-            # Fallback to WASAPI
-            for api in apis:
-                if "WASAPI" in api['name']:
-                    dev_index = api.get('default_input_device', -1)
-                    if dev_index != -1:
-                        return dev_index
-        except:
-            pass
-        return None
-
-    def _audio_callback(self, indata, frames, time_, status):
-        if status:
-            print(f"[Audio callback status: {status}]")
-        # Add a small indicator that audio is being received
-        if hasattr(self, 'audio_count'):
-            self.audio_count += 1
-            if self.audio_count % 100 == 0 and self.enabled:  # Every 100 audio frames
-                print(f"[Audio active - frames processed: {self.audio_count}]")
-        else:
-            self.audio_count = 1
-        self.q.put(bytes(indata))
+        # AURA's own voice is dropped by correlating against what TTS plays
+        self.echo_gate = get_echo_gate()
+        self.max_lag = 2.0  # seconds of unread audio kept; older audio is dropped
+        self._rec_samples = 0      # samples fed to wake_rec since it was built
+        self._fed = deque(maxlen=256)  # (rec sample, bus position, length) per fed block
+        self._wake_utterance_open = False  # woke on a partial; its final text is pending
+        self.wake_end_pos = None   # bus position where the last wake phrase ended
+        self.wake_latencies = []   # seconds from end of wake phrase to acknowledgement
+        # None lets the shared audio bus pick the preferred device
+        self.device = device
+        # Audio source; None is the shared microphone bus. Anything with the
+        # same reader()/ring interface works (see aura/replay_harness.py)
+        self.bus = bus
+        self.speak = speak_auto
+        self.speak_ack = speak_ack
+        self.prerender = prerender
+        self.handle_command = handle_command
+        self.turn_category = turn_category
+        self.on_command = None     # called with each command text as it is recognized
+        # Commands of this listener run in order, off the audio thread
+        self.executor = get_command_executor()
+        self.session = "wake"
+        self.max_busy_ms = 0.0     # longest time the loop spent away from reading audio
+        self.late_blocks = 0       # blocks whose processing took longer than their audio
+        self._cancel_command = False
+        self.audio_seconds = 0.0   # audio read by the listener thread
+        self.cpu_seconds = 0.0     # listener thread CPU spent on it
 
     def set_enabled(self, enabled: bool):
         """Enable or disable wake word detection"""
@@ -100,280 +133,244 @@ class WakeWordListener:
         
         if enabled and not old_status:
             print("INFO: Voice assistant is now listening for wake words!")
-            print(f"INFO: Supported wake words: {WAKE_WORDS[:5]}...")
+            print(f"INFO: Supported wake words: {self.wake_phrases[:5]}...")
             print("INFO: Try saying: 'Hey AURA' or 'Hi AURA'")
             
+            self.prerender([ACK_PHRASE, READY_PHRASE, *GREETING_RESPONSES])
             # Provide audio feedback when enabled
             import threading
             import time
             def delayed_speak():
                 time.sleep(0.8)
-                speak_auto("Voice assistant ready. Say Hey AURA to wake me up.")
+                self.speak(READY_PHRASE)
             threading.Thread(target=delayed_speak, daemon=True).start()
         elif not enabled and old_status:
             print("INFO: Voice assistant disabled")
         
-    def _should_ignore_audio(self) -> bool:
-        """Check if we should ignore audio to prevent feedback"""
-        current_time = time.time()
-        return (current_time - self.last_response_time) < self.ignore_duration
-        
-    def _mark_response_time(self):
-        """Mark the time when AURA speaks to ignore feedback"""
-        self.last_response_time = time.time()
-        
-    def _is_own_response(self, text: str) -> bool:
-        """Check if the detected text is likely AURA's own response"""
-        own_responses = [
-            "yes i'm listening", "yes im listening", "i'm listening", 
-            "im listening", "listening", "yes", "sorry i had trouble",
-            "sorry there was an error", "how can i help", "google",
-            "magnifying glass", "search", "opening", "youtube"
-        ]
-        
-        text_lower = text.lower().strip()
-        
-        # Check for exact matches
-        for response in own_responses:
-            if response in text_lower:
-                return True
-                
-        # Check if it contains "google" with other words (likely TTS feedback)
-        if "google" in text_lower and len(text_lower.split()) > 1:
-            return True
-            
-        # Check for very short responses that are likely TTS artifacts
-        if len(text_lower.split()) <= 2 and any(word in text_lower for word in ["yes", "the", "a", "an"]):
-            return True
-            
-        return False
-
     def _contains_wake_word(self, text: str) -> bool:
         """Enhanced wake word detection with better filtering"""
+        return self._find_wake_word(text) is not None
+
+    def _find_wake_word(self, text: str) -> Optional[int]:
+        """
+        Locate a wake phrase in text. Returns the index of the first word
+        after it (so words[end:] is whatever followed), or None.
+        """
         if not text or len(text.strip()) < 3:
-            return False
-            
-        text_lower = text.lower().strip()
-        
-        # Ignore AURA's own responses - common phrases AURA says
-        ignore_phrases = [
-            "voice assistant", "ready", "wake me up", "i'm aura", "hello", "how can i help",
-            "search", "google", "opening", "results", "browser", "find", "answer",
-            "system controls", "apps", "what can i do", "good to see you",
-            "explanation", "definition", "tutorial", "hope you find",
-            "check the browser", "should appear", "looking that up"
-        ]
-        
-        # If text contains AURA's response phrases, ignore it
-        for phrase in ignore_phrases:
-            if phrase in text_lower:
-                print(f"[Ignoring own response: {text[:30]}...]")
-                return False
-        
-        # More lenient wake word matching
-        wake_variations = [
-            # Standard wake words
-            "hey aura", "hi aura", "hello aura", "hey aurora",
-            "hai aura", "hey ora", "aura", 
-            
-            # More lenient variations
-            "hey ira", "hey ara", "hey our", "hey ura", "hey error",
-            "hi ora", "hello ora", "hey order", "he aura", "a aura",
-            "hey allah", "hey aural", "hey oral", "hey aur",
-            
-            # Handle common misrecognitions
-            "aye aura", "hay aura", "hey hora", "hey laura", "hey aida"
-        ]
-        
-        # Check for wake word matches with fuzzy matching
-        for wake_word in wake_variations:
-            # Direct match
-            if wake_word in text_lower:
-                return True
-                
-            # Fuzzy match - allow for small variations
-            words = text_lower.split()
-            if len(words) >= 2:
-                # Check first two words
-                first_two = " ".join(words[:2])
-                if self._fuzzy_match(wake_word, first_two):
-                    return True
-                    
-                # Check for wake word anywhere in text
-                for i in range(len(words) - 1):
-                    two_words = " ".join(words[i:i+2])
-                    if self._fuzzy_match(wake_word, two_words):
-                        return True
-        
-        return False
-        
-    def _fuzzy_match(self, target: str, text: str, threshold: float = 0.6) -> bool:
-        """Fuzzy string matching for wake words - more lenient threshold"""
-        if not target or not text:
-            return False
+            return None
             
-        # Calculate simple similarity
-        target_words = target.split()
-        text_words = text.split()
-        
-        if len(target_words) != len(text_words):
+        return self.wake_matcher.find(text)
+
+    def cancel_command(self):
+        """Drop back to wake mode if a wake was never followed by a command."""
+        self._cancel_command = True
+
+    def _use_recognizer(self, rec):
+        """Make rec the active recognizer, starting it from a clean state."""
+        self.rec.Reset()
+        self.rec = rec
+        rec.Reset()
+
+    def _feed(self, block, bus_pos: int) -> bool:
+        """AcceptWaveform, remembering where wake-mode blocks came from on the bus."""
+        if self.rec is self.wake_rec:
+            self._fed.append((self._rec_samples, bus_pos, len(block)))
+            self._rec_samples += len(block)
+        return self.rec.AcceptWaveform(vosk_input(block))
+
+    def _bus_pos_at(self, rec_seconds: float) -> Optional[int]:
+        """Map a wake recognizer timestamp back to a position on the audio bus."""
+        sample = int(rec_seconds * SAMPLE_RATE)
+        for rec_start, bus_start, n in reversed(self._fed):
+            if rec_start <= sample <= rec_start + n:
+                return bus_start + (sample - rec_start)
+        return None
+
+    def _spot_wake(self, text: str, words: list, reader) -> bool:
+        """Trigger if text (partial or final) holds a wake phrase."""
+        end = self._find_wake_word(text)
+        if end is None:
             return False
-            
-        matches = 0
-        for t_word, txt_word in zip(target_words, text_words):
-            # Check similarity with more lenient threshold
-            if self._word_similarity(t_word, txt_word) >= 0.5:  # More lenient per-word matching
-                matches += 1
-                
-        return matches >= len(target_words) * 0.7  # Allow 70% of words to match
-        
-    def _word_similarity(self, word1: str, word2: str) -> float:
-        """Calculate similarity between two words"""
-        if word1 == word2:
-            return 1.0
-            
-        # Handle common speech recognition errors
-        substitutions = {
-            "aura": ["ora", "ira", "ara", "our", "ura", "error", "order", "allah", "aural", "oral", "aur"],
-            "hey": ["hi", "aye", "hay", "he", "a"],
-            "hello": ["halo", "hullo", "helo"]
-        }
-        
-        for key, alternatives in substitutions.items():
-            if word1 == key and word2 in alternatives:
-                return 0.8
-            if word2 == key and word1 in alternatives:
-                return 0.8
-                
-        # Basic edit distance similarity
-        if len(word1) == 0:
-            return len(word2)
-        if len(word2) == 0:
-            return len(word1)
-            
-        # Simple character overlap
-        common_chars = set(word1.lower()) & set(word2.lower())
-        total_chars = set(word1.lower()) | set(word2.lower())
-        
-        if total_chars:
-            return len(common_chars) / len(total_chars)
-        return 0.0
+        pos = None
+        if 0 < end <= len(words):
+            pos = self._bus_pos_at(words[end - 1].get("end", 0.0))
+        if pos is None:
+            pos = reader.pos
+        print(f"INFO: WAKE WORD DETECTED! Text: '{text}'")
+        self._trigger_wake(reader, pos)
+        return True
+
+    def _trigger_wake(self, reader, wake_end_pos: int):
+        if is_speaking():
+            # Barge-in: the user woke AURA over its own answer
+            interrupt()
+        self.wake_end_pos = wake_end_pos
+        handed_off = False
+        if self.on_wake:
+            try:
+                # True: the caller captures the command and acknowledges it
+                handed_off = bool(self.on_wake())
+            except Exception as e:
+                print(f"on_wake callback error: {e}")
+        ring = reader.bus.ring
+        latency = ring.clock() - ring.time_of(wake_end_pos, SAMPLE_RATE)
+        self.wake_latencies.append(latency)
+        print(f"[WakeWord] end of wake phrase -> acknowledgement: {latency * 1000:.0f} ms")
+        if handed_off:
+            self._use_recognizer(self.wake_rec)
+            return
+
+        self.listening_for_command = True
+        self._wake_utterance_open = True
+        # Decode the command with the full vocabulary, re-reading from the
+        # end of the wake phrase so words said straight after it are kept
+        self._use_recognizer(self.command_rec)
+        reader.pos = max(wake_end_pos, reader.bus.ring.oldest_pos())
+
+    def _run_command(self, text: str):
+        try:
+            response = self.handle_command(text)
+            category = self.turn_category()
+        except Exception as e:
+            print(f"handle_command error: {e}")
+            response, category = "Sorry, I had trouble with that.", None
+        # Spoken without the chat formatting, and shorter; the kind of
+        # command picks the length cap
+        self.speak(render_for_voice(response, category))
+
+    def acknowledge(self):
+        """Say the wake acknowledgement (also used by on_wake handlers)."""
+        self.speak_ack(ACK_PHRASE)
 
     def start(self):
         print("Wake word listener background thread started.")
         import threading
         self._stop_event = threading.Event()
+        self._is_listening = False
         
         while not self._stop_event.is_set():
             if not self.enabled:
-                time.sleep(0.5)
+                time.sleep(0.1)
                 continue
                 
-            print("INFO: Opening audio stream for wake word...")
             try:
-                # STREAM COORDINATION: Wait for TTS to finish if it's speaking
-                from aura.voice import is_speaking
-                wait_start = time.time()
-                while is_speaking() and (time.time() - wait_start) < 3.0:
-                    time.sleep(0.1)
-                
-                # Attempt to open at 16000Hz, fallback to native if driver demands
-                try:
-                    stream_samplerate = 16000
-                    test_stream = sd.RawInputStream(samplerate=stream_samplerate, device=self.device)
-                    test_stream.close()
-                except:
-                    dev_info = sd.query_devices(self.device)
-                    stream_samplerate = int(dev_info['default_samplerate'])
-                    print(f"INFO: 16000Hz not supported, using native rate: {stream_samplerate}")
-                
-                # Re-init recognizer with the actual rate
-                self.rec = KaldiRecognizer(self.model, stream_samplerate)
-                
-                with sd.RawInputStream(
-                    samplerate=stream_samplerate,
-                    blocksize=8000,
-                    dtype="int16",
-                    channels=1,
-                    callback=self._audio_callback,
-                    device=self.device,
-                ):
-                    print("SUCCESS: Wake word audio stream is now active.")
-                    self._is_listening = True
+                # The shared bus keeps the device open; attaching a reader is instant
+                # The bus always delivers 16 kHz, so the recognizers built in
+                # __init__ are reused; Reset() drops any half-decoded audio
+                bus = self.bus or get_audio_bus(self.device)
+                reader = bus.reader(max_lag=self.max_lag)
+                self.listening_for_command = False
+                self._wake_utterance_open = False
+                self._use_recognizer(self.wake_rec)
+                print("SUCCESS: Wake word listener attached to shared audio stream.")
+                self._is_listening = True
+                processed = 0
+                # Silent blocks never reach the decoder
+                gate = EnergyGate(sample_rate=SAMPLE_RATE)
+                cpu_mark = time.thread_time()
+                busy_from = None
+                block_ms = 0.0
                     
-                    # Clear queue to avoid processing stale audio
-                    while not self.q.empty():
-                        try: self.q.get_nowait()
-                        except: break
+                while self.enabled and not self._stop_event.is_set():
+                    try:
+                        if busy_from is not None:
+                            busy_ms = (time.perf_counter() - busy_from) * 1000
+                            self.max_busy_ms = max(self.max_busy_ms, busy_ms)
+                            if busy_ms > block_ms:
+                                self.late_blocks += 1
+                        # Use timeout to allow checking self.enabled frequently
+                        # View into the shared ring buffer - no copy per block
+                        data = reader.read_view(max_samples=WAKE_BLOCK, timeout=0.5)
+                        if data is None:
+                            busy_from = None
+                            continue
+                        busy_from = time.perf_counter()
+                        block_ms = len(data) * 1000 / SAMPLE_RATE
+
+                        if self._cancel_command:
+                            self._cancel_command = False
+                            self.listening_for_command = False
+                            self._wake_utterance_open = False
+                            self._use_recognizer(self.wake_rec)
+
+                        processed += 1
+                        now_cpu = time.thread_time()
+                        self.cpu_seconds += now_cpu - cpu_mark
+                        cpu_mark = now_cpu
+                        self.audio_seconds += len(data) / SAMPLE_RATE
+                        if processed % 100 == 0:
+                            cpu_ms = self.cpu_seconds * 1000 / max(self.audio_seconds, 1e-6)
+                            print(f"[Audio active - blocks processed: {processed}, "
+                                  f"decoded {gate.pass_ratio:.0%}, listener CPU {cpu_ms:.1f} ms/audio s, "
+                                  f"loop busy max {self.max_busy_ms:.0f} ms, late blocks {self.late_blocks}, "
+                                  f"{reader.stats()}, commands {self.executor.stats()}]")
                         
-                    while self.enabled and not self._stop_event.is_set():
-                        try:
-                            # Use timeout to allow checking self.enabled frequently
-                            try:
-                                data = self.q.get(timeout=0.5)
-                            except queue.Empty:
-                                continue
-                            
-                            # Skip processing if we recently spoke (prevent feedback)
-                            if self._should_ignore_audio():
-                                continue
-                                
-                            if not self.rec.AcceptWaveform(data):
-                                continue
-                                
-                            result = self.rec.Result()
-                            text = json.loads(result).get("text", "").strip()
+                        # Skip AURA's own voice coming back through the mic
+                        block_time = bus.ring.time_of(reader.pos - len(data), SAMPLE_RATE)
+                        if self.echo_gate.is_echo(data, block_time):
+                            continue
                             
-                            if not text:
-                                continue
-                                
-                            print(f"[WakeWord] heard: '{text}'")
-                            
-                            # Ignore if this is likely our own response
-                            if self._is_own_response(text):
-                                continue
-                                
-                            if not self.listening_for_command:
-                                if self._contains_wake_word(text):
-                                    self.listening_for_command = True
-                                    print(f"INFO: WAKE WORD DETECTED! Text: '{text}'")
-                                    if self.on_wake:
-                                        try:
-                                            self.on_wake()
-                                        except Exception as e:
-                                            print(f"on_wake callback error: {e}")
-                                    
-                                    self._mark_response_time()
-                                    speak_auto("Yes, I'm listening.")
-                                    
-                                    # Reset recognizer for the actual command
-                                    self.rec = KaldiRecognizer(self.model, 16000)
-                                    time.sleep(0.5) # Short pause for AURA to finish speaking
+                        fed = gate.process(data)
+                        # Gate output is contiguous audio ending at the reader
+                        pos = reader.pos - sum(len(b) for b in fed)
+                        result = {}
+                        for block in fed:
+                            if self._feed(block, pos):
+                                segment = json.loads(self.rec.Result())
+                                if segment.get("text"):
+                                    result = segment
+                            pos += len(block)
+                        if not result and gate.just_closed:
+                            # Back to silence: flush what the recognizer still holds
+                            result = json.loads(self.rec.FinalResult())
+                        text = (result.get("text") or "").strip()
+
+                        if not self.listening_for_command:
+                            if not fed:
                                 continue
+                            # React on the partial result, while the utterance
+                            # is still going, when there is no final one yet
+                            words = result.get("result") or []
+                            if not result:
+                                partial = json.loads(self.rec.PartialResult())
+                                text = (partial.get("partial") or "").strip()
+                                words = partial.get("partial_result") or []
+                            if (self._spot_wake(text, words, reader) and self._wake_utterance_open
+                                    and not gate.is_open):
+                                # The utterance already ended with the wake phrase
+                                self._wake_utterance_open = False
+                                self.acknowledge()
+                            continue
 
-                            # If we reached here, we are listening_for_command
-                            self.listening_for_command = False
-                            print(f"🎯 Command received via wake word: '{text}'")
-                            
-                            try:
-                                response = handle_command(text)
-                            except Exception as e:
-                                print(f"handle_command error: {e}")
-                                response = "Sorry, I had trouble with that."
-                                
-                            self._mark_response_time()
-                            speak_auto(response)
-                            
-                        except Exception as e:
-                            print(f"[Stream processing error: {e}]")
-                            break
-                            
-                print("INFO: Wake word audio stream closed (either disabled or stopping).")
+                        if not text:
+                            if gate.just_closed and self._wake_utterance_open:
+                                # Only the wake phrase was said: prompt for the command
+                                self._wake_utterance_open = False
+                                self.acknowledge()
+                            continue
+
+                        print(f"[WakeWord] heard: '{text}'")
+
+                        # If we reached here, we are listening_for_command
+                        self.listening_for_command = False
+                        self._wake_utterance_open = False
+                        self._use_recognizer(self.wake_rec)
+                        print(f"🎯 Command received via wake word: '{text}'")
+                        if self.on_command:
+                            self.on_command(text)
+                        # Slow commands run elsewhere; this thread keeps reading audio
+                        self.executor.submit(self.session, self._run_command, text)
+                        
+                    except Exception as e:
+                        print(f"[Stream processing error: {e}]")
+                        break
+                        
+                print("INFO: Wake word listener detached from shared audio stream.")
                 self._is_listening = False
-                sd.stop() # Explicitly stop sounddevice
                 
             except Exception as e:
                 # This often happens if the device is busy
+                self._is_listening = False
                 if self.enabled:
                     print(f"Wake-word stream error: {e}")
                     print("INFO: Microphone might be busy. Retrying in 2 seconds...")
@@ -386,3 +383,6 @@ class WakeWordListener:
         if hasattr(self, '_stop_event'):
             self._stop_event.set()
         self.enabled = False
+        if self._model_path is not None:
+            get_model_registry().release(self._model_path)
+            self._model_path = None
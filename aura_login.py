@@ -531,7 +531,7 @@ class AuraLoginWindow(QWidget):
         user_memory.save_user(email, password, user_id, user_name)
        
         self.error_label.setStyleSheet("color:#80ff9a;font-size:13px;")
-        self.error_label.setText("Login successful! Opening AURA…")
+        self.error_label.setText(f"{msg}! Opening AURA…")
         self.error_label.setVisible(True)
         QTimer.singleShot(300, lambda: self.open_panel(user_id, user_name))
 
@@ -11,7 +11,7 @@ Integrated with:
  - Natural TTS voice with speaking animation
 """
 
-import json
+import importlib.util
 import math
 import random
 from pathlib import Path
@@ -32,13 +32,8 @@ from PyQt6.QtWidgets import (
 
 import speech_recognition as sr
 
-# optional Vosk
-HAVE_VOSK = False
-try:
-    import vosk
-    HAVE_VOSK = True
-except Exception:
-    HAVE_VOSK = False
+# optional Vosk; only probed here, the model registry imports it
+HAVE_VOSK = importlib.util.find_spec("vosk") is not None
 
 # ----------------------------------------------
 # IMPORT AI ENGINE + WAKE WORD LISTENER + VOICE STATE
@@ -46,13 +41,9 @@ except Exception:
 from aura import get_engine
 from aura.wake_word_listener import WakeWordListener
 from aura.voice import is_speaking as voice_is_speaking
-
-# History (safe fallback)
-try:
-    from history import save_history
-except Exception:
-    def save_history(id, t, r, m): 
-        pass
+from aura.voice import _detect_lang_from_text as detect_language
+from aura.model_registry import get_model_registry
+from aura.recognizers import RecognizerOrchestrator, VoskStream, make_vosk_recognizer
 
 # ------------- UI COLORS -------------
 BG_DARK   = QColor(18, 20, 28, 255)
@@ -277,10 +268,14 @@ class SendButton(QWidget):
 # ------------------------------------------------------------
 # VOICE INPUT THREAD
 # ------------------------------------------------------------
+# Cloud recognizer languages per spoken language
+GOOGLE_LANGUAGES = {"en": ("en-US", "en-IN"), "kn": ("kn-IN", "en-IN")}
+
 class VoiceThread(QThread):
     transcript = pyqtSignal(str)
     listening_state = pyqtSignal(bool)
     partial_transcript = pyqtSignal(str)  # New signal for real-time transcription
+    model_ready = pyqtSignal(bool)  # Vosk model finished loading (False if it failed)
 
     def __init__(self, model_path=None, parent=None):
         super().__init__(parent)
@@ -294,26 +289,85 @@ class VoiceThread(QThread):
         self._recognizer.dynamic_energy_threshold = True
         self._recognizer.non_speaking_duration = 1.0  # More patient non-speaking duration  
         self._recognizer.phrase_threshold = 0.15  # Very lenient phrase detection
-        self._recognizer.operation_timeout = None  # No timeout for patience
+        self._recognizer.operation_timeout = 8  # bounds each cloud request in the hedged chain
+        self._orchestrator = RecognizerOrchestrator(self._recognizer)
         
         self.engine = "none"
         self._vosk_model = None
+        self._vosk_rec = None
+        self._start_pos = None
+        self._model_future = None
+        # Registry leases: the model in use, and the one loading to replace it
+        self._model_lease = None
+        self._pending_lease = None
+        self.language = "en"
 
         if HAVE_VOSK and model_path:
             p = Path(model_path)
             if p.exists():
-                try:
-                    self._vosk_model = vosk.Model(str(p))
-                    self.engine = "vosk"
-                    print("Vosk model loaded for better speech recognition")
-                except Exception as e:
-                    print(f"Vosk model load failed: {e}")
-                    self._vosk_model = None
+                # Loaded in the background and shared with the wake listener;
+                # until it is ready, recognition runs without Vosk
+                self._pending_lease = p
+                self._model_future = get_model_registry().load(p, lease=True)
+                self._model_future.add_done_callback(self._on_model_loaded)
+
+    def set_language(self, lang: str):
+        """
+        Recognize in lang from the next utterance. Its model loads in the
+        background if needed; the current one is used until then.
+        """
+        if lang == self.language:
+            return
+        self.language = lang
+        self._orchestrator.languages = GOOGLE_LANGUAGES.get(lang, GOOGLE_LANGUAGES["en"])
+        registry = get_model_registry()
+        future = registry.for_language(lang, lease=True) if HAVE_VOSK else None
+        if future is None:
+            print(f"[DEBUG] No offline speech model configured for '{lang}'")
+            return
+        if self._pending_lease is not None:
+            registry.release(self._pending_lease)  # superseded before it loaded
+        self._pending_lease = registry.path_for(lang)
+        self._model_future = future
+        future.add_done_callback(self._on_model_loaded)
+
+    def _on_model_loaded(self, future):
+        if future is not self._model_future:
+            return  # superseded by a later language switch
+        registry = get_model_registry()
+        lease, self._pending_lease = self._pending_lease, None
+        try:
+            model = future.result()
+            # Capture is always 16 kHz, so one recognizer serves every utterance
+            rec = make_vosk_recognizer(model)
+        except Exception as e:
+            print(f"Vosk model load failed: {e}")
+            if lease is not None:
+                registry.release(lease)
+            self.model_ready.emit(False)
+            return
+        # The previous model may be evicted once nothing else holds it
+        if self._model_lease is not None:
+            registry.release(self._model_lease)
+        self._model_lease = lease
+        self._vosk_rec = rec
+        self._vosk_model = model
+        self.engine = "vosk"
+        print(f"Vosk model loaded for better speech recognition ({self.language})")
+        print(f"[DEBUG] Resident speech models: {registry.stats()}")
+        self.model_ready.emit(True)
 
     def stop(self):
         self._running = False
-
-    def request_once(self, on: bool):
+        registry = get_model_registry()
+        for lease in (self._model_lease, self._pending_lease):
+            if lease is not None:
+                registry.release(lease)
+        self._model_lease = self._pending_lease = None
+
+    def request_once(self, on: bool, start_pos: Optional[int] = None):
+        # start_pos: bus position to capture from (e.g. right after the wake phrase)
+        self._start_pos = start_pos if on else None
         self._want_once = bool(on)
 
     def run(self):
@@ -322,8 +376,11 @@ class VoiceThread(QThread):
             source = MicrophoneFix(sample_rate=16000)
             
             print("Adjusting for ambient noise...")
-            # MicrophoneFix doesn't actually need calibration but we keep the call
-            # or skip it if it's a dummy.
+            # Seeds the VAD noise floor used for end-of-speech detection
+            try:
+                source.adjust_for_ambient_noise(source, duration=0.5)
+            except Exception as e:
+                print(f"Noise calibration skipped: {e}")
             print("Voice recognition ready (sounddevice mode)!")
 
             while self._running:
@@ -331,12 +388,19 @@ class VoiceThread(QThread):
                     self.msleep(50)
                     continue
 
+                # With Vosk, decode while capturing so the result is ready
+                # as soon as end of speech is detected
+                stream = None
+                if self.engine == "vosk" and self._vosk_model:
+                    stream = VoskStream(self._vosk_model, self.partial_transcript.emit,
+                                        recognizer=self._vosk_rec)
+
                 self.listening_state.emit(True)
                 try:
-                    # Note: Our fix.listen signature is slightly different or 
-                    # we call it directly if we changed the pattern.
-                    # Since we want to use sr.Recognizer methods, let's adapt.
-                    audio = source.listen(self._recognizer, phrase_time_limit=10)
+                    start_pos, self._start_pos = self._start_pos, None
+                    audio = source.listen(self._recognizer, phrase_time_limit=10,
+                                          on_chunk=stream.feed if stream else None,
+                                          start_pos=start_pos)
                 except Exception as e:
                     print(f"Audio capture error: {e}")
                     self.listening_state.emit(False)
@@ -348,58 +412,22 @@ class VoiceThread(QThread):
                 text = None
 
                 try:
-                    if self.engine == "vosk" and self._vosk_model:
-                        print("[DEBUG] Using Vosk engine for recognition")
-                        # Real-time Vosk processing with partial results
-                        rec = vosk.KaldiRecognizer(self._vosk_model, audio.sample_rate)
-                        
-                        # Process audio in chunks for real-time feedback
-                        audio_data = audio.get_raw_data(convert_rate=audio.sample_rate, convert_width=2)
-                        
-                        # Send partial results during processing
-                        if rec.AcceptWaveform(audio_data):
-                            result = json.loads(rec.Result())
-                            text = (result.get("text") or "").strip()
-                        else:
-                            # Get partial result for real-time display
-                            partial_result = json.loads(rec.PartialResult())
-                            partial_text = (partial_result.get("partial") or "").strip()
-                            if partial_text:
-                                self.partial_transcript.emit(partial_text)
-                                
-                        print(f"[DEBUG] Vosk recognized: '{text}'")
-                        
+                    # Local result (streamed Vosk, else Sphinx) races the cloud
+                    # engines; cloud is skipped while offline
+                    local = None
+                    if stream is not None:
+                        text = stream.finish()
+                        print(f"[DEBUG] Vosk recognized: '{text}' ({stream.confidence:.2f})")
+                        local = (text, stream.confidence)
+                    if local is None or local[1] < self._orchestrator.min_confidence:
+                        self.partial_transcript.emit("Processing speech...")
+                    text, conf, used = self._orchestrator.recognize(audio, local=local)
+                    if text:
+                        print(f"[DEBUG] Using '{text}' from {used} ({conf:.2f})")
                     else:
-                        print("[DEBUG] Using Google engine for recognition")
-                        # Enhanced Google Speech Recognition with multiple attempts
-                        try:
-                            # Show "Processing..." feedback
-                            self.partial_transcript.emit("Processing speech...")
-                            text = self._recognizer.recognize_google(audio, language='en-US')
-                            print(f"[DEBUG] Google Speech recognized: '{text}'")
-                            
-                        except sr.UnknownValueError:
-                            print("[DEBUG] Google could not understand audio")
-                            # Try with different language settings
-                            try:
-                                text = self._recognizer.recognize_google(audio, language='en-IN')
-                                print(f"[DEBUG] Google Speech (India) recognized: '{text}'")
-                            except:
-                                # Final fallback to Sphinx
-                                try:
-                                    text = self._recognizer.recognize_sphinx(audio)
-                                    print(f"[DEBUG] Sphinx recognized: '{text}'")
-                                except:
-                                    print("[DEBUG] All recognition methods failed")
+                        print("[DEBUG] All recognition methods failed")
+                        self.partial_transcript.emit("❌ Could not understand - try again")
                                     
-                except sr.UnknownValueError:
-                    print("[DEBUG] Could not understand audio - please speak clearly")
-                    self.partial_transcript.emit("❌ Could not understand - try again")
-                    text = None
-                except sr.RequestError as e:
-                    print(f"[DEBUG] Recognition service error: {e}")
-                    self.partial_transcript.emit("❌ Service error - check connection")
-                    text = None
                 except Exception as e:
                     print(f"[DEBUG] Recognition error: {e}")
                     self.partial_transcript.emit("❌ Recognition failed")
@@ -588,14 +616,19 @@ class AuraPanel(QWidget):
         self.voice_assistant_enabled = False
 
         # VOICE THREAD (push-to-talk mic)
-        model = model_path or "models/vosk-small-en"
-        self.voice = VoiceThread(model, self)
+        self._model_path = model_path or "models/vosk-small-en"
+        self.voice = VoiceThread(self._model_path, self)
         self.voice.listening_state.connect(self._on_listening)
         self.voice.transcript.connect(self._on_voice_text)
         self.voice.partial_transcript.connect(self._on_partial_voice_text)  # Real-time transcription
+        self.voice.model_ready.connect(self._on_model_ready)
         self.voice.start()
 
-        self.subtitle.setText("Ready • Text Mode • Voice Toggle Available")
+        # The panel shows at once; the speech model keeps loading behind it
+        if self.voice.engine == "vosk":
+            self.subtitle.setText("Ready • Text Mode • Voice Toggle Available")
+        else:
+            self.subtitle.setText("Ready • Text Mode • Loading speech model...")
 
         # VOICE ANIMATION TIMER (logo reacts to speech)
         self._speak_anim_timer = QTimer(self)
@@ -660,17 +693,26 @@ class AuraPanel(QWidget):
         def on_wake():
             # Coordinate microphone access
             print("INFO: Wake-word detected, pausing listener stream...")
-            if self.wake_word_listener:
-                self.wake_word_listener.set_enabled(False)
+            listener = self.wake_word_listener
+            if listener:
+                listener.set_enabled(False)
+                # The listener stops here, so the acknowledgement is ours;
+                # command capture drops its echo
+                listener.acknowledge()
             
             # safely bring panel to front in Qt main thread
             QTimer.singleShot(0, self._bring_to_front)
             
-            # Start active voice recognition after a tiny delay to allow stream to close
-            QTimer.singleShot(200, lambda: self._toggle_voice(True))
+            # Both read the shared audio stream, so command capture starts
+            # right where the wake phrase ended - words said straight after
+            # "Hey AURA" are not lost
+            pos = listener.wake_end_pos if listener else None
+            QTimer.singleShot(0, lambda: self._toggle_voice(True, start_pos=pos))
+            return True  # the panel captures the command
 
         try:
-            self.wake_word_listener = WakeWordListener(model_path="models/vosk-small-en",
+            # Shares the panel's model; blocks this thread, not the UI, until it loads
+            self.wake_word_listener = WakeWordListener(model_path=self._model_path,
                                                       on_wake=on_wake)
             # Start disabled by default
             self.wake_word_listener.set_enabled(False)
@@ -678,6 +720,12 @@ class AuraPanel(QWidget):
         except Exception as e:
             print("Wake-word error:", e)
 
+    def _on_model_ready(self, ok: bool):
+        if not self.voice_assistant_enabled:
+            self.subtitle.setText("Ready • Text Mode • Voice Toggle Available")
+        if not ok:
+            self._append_chat("System", "Offline speech model unavailable, using online recognition.")
+
     def _bring_to_front(self):
         win = self.window()
         if win is not None:
@@ -688,14 +736,14 @@ class AuraPanel(QWidget):
     # ------------------------------------------------------------
     # Voice toggle from MIC button
     # ------------------------------------------------------------
-    def _toggle_voice(self, on: bool):
-        # STREAM COORDINATION: 
-        # If enabling active mic, pause wake-word listener to free up device
+    def _toggle_voice(self, on: bool, start_pos: Optional[int] = None):
+        # If enabling active mic, pause wake-word listener so the command
+        # is not also decoded as a wake phrase (the device stays shared)
         if on and self.wake_word_listener and self.voice_assistant_enabled:
             print("INFO: Pausing wake-word listener for active command...")
             self.wake_word_listener.set_enabled(False)
             
-        self.voice.request_once(on)
+        self.voice.request_once(on, start_pos=start_pos)
         self.pill.set_listening(on)
 
     def _on_listening(self, is_on: bool):
@@ -704,8 +752,7 @@ class AuraPanel(QWidget):
         # If active mic turned OFF and voice assistant WAS on, re-enable it
         if not is_on and self.voice_assistant_enabled and self.wake_word_listener:
             print("INFO: Resuming wake-word listener...")
-            # Small delay to ensure MicrophoneFix has fully closed
-            QTimer.singleShot(500, lambda: self.wake_word_listener.set_enabled(True))
+            self.wake_word_listener.set_enabled(True)
 
     def _on_voice_text(self, text: str):
         self._handle_text_command(text, from_voice=True)
@@ -772,6 +819,13 @@ class AuraPanel(QWidget):
         who = "You (Voice)" if from_voice else "You"
         self._append_chat(who, text)
 
+        # The user writing in another language hints the next voice
+        # command will be in it too: start loading that model now
+        lang = detect_language(text)
+        if lang != self.voice.language:
+            get_model_registry().warm(lang)
+            self.voice.set_language(lang)
+
         try:
             # Show processing state
             self.pill.set_processing(True)
@@ -779,7 +833,11 @@ class AuraPanel(QWidget):
             
             # Preprocess text for better understanding
             processed_text = self._preprocess_command(text)
-            resp = self.enhanced_engine.execute(processed_text, min_confidence=0.15)
+            # The engine logs the turn to history (once, in the background)
+            resp = self.enhanced_engine.execute(
+                processed_text, min_confidence=0.15,
+                user_id=getattr(self.window(), "user_id", None),
+                input_mode="voice" if from_voice else "text")
             
             # Make responses more conversational like Alexa
             resp = self._make_response_conversational(resp, text)
@@ -791,16 +849,6 @@ class AuraPanel(QWidget):
             self.pill.set_processing(False)
 
         self._append_chat("AURA", resp)
-
-        # save history if available
-        try:
-            win = self.window()
-            uid = getattr(win, "user_id", None)
-            if uid is not None:
-                mode = "voice" if from_voice else "text"
-                save_history(uid, text, resp, mode)
-        except Exception:
-            pass
     
     def _preprocess_command(self, text: str) -> str:
         """Preprocess commands for better understanding"""
@@ -0,0 +1,66 @@
+"""
+Per-insert latency into command_history against the MySQL server in .env:
+a new connection per insert (how db.get_connection used to work) versus
+the connection pool. Rows written here are deleted again at the end.
+
+    python bench_db_pool.py [inserts]
+"""
+import statistics
+import sys
+import time
+
+import db
+
+SQL = """
+    INSERT INTO command_history (user_id, user_command, aura_response, input_mode)
+    VALUES (%s, %s, %s, %s)
+"""
+MODE = "bench"
+
+
+def _insert(conn, i):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(SQL, (None, f"bench command {i}", "bench response", MODE))
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+def _report(name, times):
+    times = sorted(t * 1000 for t in times)
+    p95 = times[int(len(times) * 0.95) - 1]
+    print(f"{name:<22} mean {statistics.mean(times):7.2f} ms   "
+          f"p50 {statistics.median(times):7.2f} ms   p95 {p95:7.2f} ms")
+
+
+def run(inserts=200):
+    print(f"--- {inserts} inserts into {db.DB_NAME}@{db.DB_HOST} ---")
+
+    unpooled = []
+    for i in range(inserts):
+        start = time.perf_counter()
+        conn = db._connect()
+        _insert(conn, i)
+        conn.close()
+        unpooled.append(time.perf_counter() - start)
+    _report("connection per insert", unpooled)
+
+    pooled = []
+    for i in range(inserts):
+        start = time.perf_counter()
+        with db.connection() as conn:
+            _insert(conn, i)
+        pooled.append(time.perf_counter() - start)
+    _report("pooled", pooled)
+    print(f"pool: {db.get_pool().stats()}")
+
+    with db.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM command_history WHERE input_mode = %s", (MODE,))
+        conn.commit()
+        cursor.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
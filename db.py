@@ -1,8 +1,22 @@
 # db.py  (root folder)
+"""
+MySQL access for AURA
+ - One process-wide pool of connections, created on first use up to
+   DB_POOL_SIZE and reused instead of connecting per query
+ - A connection idle for DB_POOL_CHECK_IDLE seconds is pinged (and
+   reconnected if the server dropped it) before it is handed out
+ - `with connection() as conn:` returns it to the pool; so does
+   conn.close() on a connection from get_connection()
+"""
 from dotenv import load_dotenv
 load_dotenv()
 
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
 import mysql.connector
 from mysql.connector import Error
 
@@ -10,18 +24,162 @@ DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_USER = os.getenv("DB_USER", "")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
 DB_NAME = os.getenv("DB_NAME", "")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+DB_POOL_CHECK_IDLE = float(os.getenv("DB_POOL_CHECK_IDLE", "30"))
+
+
+def _connect():
+    return mysql.connector.connect(
+        host=DB_HOST,
+        user=DB_USER,
+        password=DB_PASSWORD,
+        database=DB_NAME
+    )
+
+
+class PooledConnection:
+    """A connection borrowed from the pool; close() gives it back."""
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is not None:
+            self._pool.release(self._conn)
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    def __init__(self, size: int = DB_POOL_SIZE, connect=_connect,
+                 check_idle: float = DB_POOL_CHECK_IDLE, timeout: float = 5.0):
+        self.size = size
+        self.check_idle = check_idle
+        self.timeout = timeout
+        self._connect = connect
+        self._idle = queue.LifoQueue()   # (conn, time returned); most recent first
+        self._open = 0
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.reconnects = 0
+
+    def _new(self):
+        with self._lock:
+            if self._open >= self.size:
+                return None
+            self._open += 1
+        try:
+            return self._connect()
+        except Exception:
+            with self._lock:
+                self._open -= 1
+            raise
+
+    def _discard(self, conn):
+        with self._lock:
+            self._open -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _healthy(self, conn, idle_for: float) -> bool:
+        if idle_for < self.check_idle:
+            return True
+        try:
+            conn.ping(reconnect=True, attempts=1, delay=0)
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        """A live connection, waiting up to timeout if all are in use."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                conn, returned = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._new()
+                if conn is not None:
+                    break
+                wait = deadline - time.monotonic()
+                if wait <= 0:
+                    raise Error(msg=f"connection pool exhausted ({self.size} in use)")
+                try:
+                    conn, returned = self._idle.get(timeout=wait)
+                except queue.Empty:
+                    continue
+            if self._healthy(conn, time.monotonic() - returned):
+                break
+            # Server dropped it and it would not reconnect: replace it
+            self.reconnects += 1
+            self._discard(conn)
+        self.checkouts += 1
+        return conn
+
+    def release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()   # never hand out someone else's open transaction
+        except Exception:
+            self._discard(conn)
+            return
+        self._idle.put((conn, time.monotonic()))
+
+    def close_all(self):
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    def stats(self) -> dict:
+        return {"size": self.size, "open": self._open, "idle": self._idle.qsize(),
+                "checkouts": self.checkouts, "reconnects": self.reconnects}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
+
 
 def get_connection():
     # MySQL connection enabled
     try:
-        conn = mysql.connector.connect(
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME
-        )
-        return conn
+        pool = get_pool()
+        return PooledConnection(pool, pool.acquire())
     except Error as e:
         print(f"[db.py] MYSQL CONNECTION ERROR: {e}")
         # Log error but don't necessarily crash unless it's critical
         return None
+
+
+@contextmanager
+def connection():
+    """
+    with connection() as conn: ...
+    conn is None when MySQL is unreachable; it goes back to the pool after.
+    """
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        if conn is not None:
+            conn.close()
@@ -1,41 +1,279 @@
 # history.py — final version matching your actual DB schema
+"""
+Chat history sink. save_history() only queues the turn; one background
+writer stores queued turns in the local SQLite store (local_store.py) in
+batches (executemany, one transaction) every BATCH_SIZE rows or
+FLUSH_INTERVAL seconds, and flushes what is left when the process exits.
+A second thread copies stored turns to MySQL in bulk whenever it is
+reachable; each row's sync_key makes a repeated copy a no-op. A
+database without the sync_key column stops the copying (see SQL.sql).
+"""
+
+import atexit
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from mysql.connector import DataError, Error, IntegrityError, ProgrammingError, errorcode
+
+from db import connection
+from local_store import REJECTED, SYNCED, get_local_store
+
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 0.5     # seconds a queued turn may wait for a full batch
+QUEUE_SIZE = 1000
+SYNC_BATCH = 500
+SYNC_INTERVAL = 2.0      # seconds between syncs while MySQL is reachable
+SYNC_MAX_BACKOFF = 60.0  # longest wait between retries while it is not
+
+# MySQL uses %s placeholders; a sync_key already there is left as it is
+UPSERT_SQL = """
+    INSERT INTO command_history (sync_key, user_id, user_command, aura_response, input_mode, timestamp)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE sync_key = sync_key
+"""
+
+# Databases created before sync_key existed need this once (SQL.sql)
+SYNC_KEY_MIGRATION = "ALTER TABLE command_history ADD COLUMN sync_key CHAR(32) UNIQUE AFTER id;"
+
+
+def _write_rows(rows):
+    """Store rows locally in one transaction; returns how many."""
+    return get_local_store().add_history(rows)
+
+
+def _push_rows(rows):
+    """
+    Copy (sync_key, ...) rows to MySQL in one transaction. Returns
+    (synced keys, rejected keys), or None if MySQL is unreachable.
+    """
+    with connection() as conn:
+        if conn is None:
+            return None
+        cursor = conn.cursor()
+        try:
+            try:
+                cursor.executemany(UPSERT_SQL, rows)
+                conn.commit()
+                return [row[0] for row in rows], []
+            except (IntegrityError, DataError) as e:
+                conn.rollback()
+                print("SAVE_HISTORY ERROR:", e)
+            # One bad row must not hold back the rest of the batch
+            synced, rejected = [], []
+            for row in rows:
+                try:
+                    cursor.execute(UPSERT_SQL, row)
+                    conn.commit()
+                    synced.append(row[0])
+                except (IntegrityError, DataError):
+                    conn.rollback()
+                    rejected.append(row[0])
+            return synced, rejected
+        finally:
+            cursor.close()
+
+
+class HistoryWriter:
+    def __init__(self, write=_write_rows, batch_size: int = BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL, maxsize: int = QUEUE_SIZE):
+        self._write = write
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self.written = 0
+        self.dropped = 0          # queue full, or nowhere to write
+        self.failed = 0           # rejected by the database
+        self.flush_ms = deque(maxlen=100)
+        self._thread = threading.Thread(target=self._run, name="aura-history", daemon=True)
+        self._thread.start()
+
+    def put(self, row) -> bool:
+        """Queue one row; never waits. False if the queue is full."""
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _take_batch(self):
+        batch = []
+        deadline = None            # set by the first row of the batch
+        while len(batch) < self.batch_size:
+            if self._stop.is_set():
+                # Shutting down: take what is queued without waiting
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    break
+            timeout = 0.1 if deadline is None else deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=min(timeout, 0.1)))
+            except queue.Empty:
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+        return batch
+
+    def _flush(self, batch):
+        start = time.perf_counter()
+        try:
+            written = self._write(batch)
+            if written is None:
+                self.dropped += len(batch)
+            else:
+                self.written += written
+                self.failed += len(batch) - written
+        except Exception as e:
+            print("SAVE_HISTORY ERROR:", e)
+            self.failed += len(batch)
+        self.flush_ms.append((time.perf_counter() - start) * 1000)
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if batch:
+                self._flush(batch)
+            elif self._stop.is_set():
+                return
+
+    def close(self, timeout: float = 5.0):
+        """Write everything still queued, then stop."""
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_flush_ms": round(self.flush_ms[-1], 1) if self.flush_ms else 0.0,
+            "max_flush_ms": round(max(self.flush_ms, default=0.0), 1),
+        }
+
+
+class HistorySyncer:
+    """Copies rows from the local store to MySQL, backing off while it is down."""
+
+    def __init__(self, store, push=_push_rows, batch_size: int = SYNC_BATCH,
+                 interval: float = SYNC_INTERVAL, max_backoff: float = SYNC_MAX_BACKOFF):
+        self.store = store
+        self._push = push
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.reachable = None     # unknown until there is something to copy
+        self.synced = 0
+        self.rejected = 0         # refused by MySQL (e.g. unknown user); kept locally
+        self.disabled = False     # the MySQL table has no sync_key column
+        self.sync_ms = deque(maxlen=100)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="aura-history-sync", daemon=True)
+        self._thread.start()
+
+    def sync_once(self) -> bool:
+        """Copy everything pending. False if MySQL could not be reached."""
+        while not self.disabled:
+            rows = self.store.pending_history(self.batch_size)
+            if not rows:
+                return True
+            start = time.perf_counter()
+            try:
+                result = self._push(rows)
+            except Error as e:
+                if isinstance(e, ProgrammingError) and e.errno == errorcode.ER_BAD_FIELD_ERROR:
+                    # Retrying cannot fix the schema: say so once and stop
+                    print(f"[ERROR] History sync stopped: {e}. Turns stay in the local store; "
+                          f"add the column with: {SYNC_KEY_MIGRATION}")
+                    self.reachable = True
+                    self.disabled = True
+                    return False
+                print(f"[DEBUG] History sync failed: {e}")
+                result = None
+            self.reachable = result is not None
+            if result is None:
+                return False
+            synced, rejected = result
+            self.store.mark_history(synced, SYNCED)
+            self.store.mark_history(rejected, REJECTED)
+            self.synced += len(synced)
+            self.rejected += len(rejected)
+            self.sync_ms.append((time.perf_counter() - start) * 1000)
+        return False
+
+    def _run(self):
+        wait = self.interval
+        while True:
+            ok = self.sync_once()
+            if self.disabled:
+                return
+            wait = self.interval if ok else min(wait * 2, self.max_backoff)
+            if self._stop.wait(wait):
+                return
+
+    def close(self, timeout: float = 2.0):
+        """Stop; a last sync is attempted if MySQL was reachable."""
+        self._stop.set()
+        self._thread.join(timeout)
+        if self.reachable and not self.disabled:
+            self.sync_once()
+
+    def stats(self) -> dict:
+        return {
+            "pending_sync": self.store.pending_count(),
+            "synced": self.synced,
+            "rejected": self.rejected,
+            "mysql_reachable": self.reachable,
+            "sync_disabled": self.disabled,
+            "last_sync_ms": round(self.sync_ms[-1], 1) if self.sync_ms else 0.0,
+        }
+
+
+_writer = None
+_syncer = None
+_writer_lock = threading.Lock()
+
+
+def _shutdown():
+    _writer.close()
+    _syncer.close()
+
+
+def get_history_writer() -> HistoryWriter:
+    global _writer, _syncer
+    with _writer_lock:
+        if _writer is None:
+            _writer = HistoryWriter()
+            _syncer = HistorySyncer(get_local_store())
+            atexit.register(_shutdown)
+        return _writer
 
-from db import get_connection
 
 def save_history(user_id, user_text, bot_text, input_mode="text"):
     """
-    Saves chat history into MySQL using the real table columns:
+    Queues one turn for the command_history table, using the real columns:
     - user_id
     - user_command
     - aura_response
     - input_mode
     - timestamp (auto)
+    Returns at once; False only if the queue is full. The guest user
+    (id 0) has no users row and is stored as NULL.
     """
-    conn = None
-    cursor = None
-    try:
-        conn = get_connection()
-        if conn is None:
-            # MySQL not available, skip database logging
-            return True
-        cursor = conn.cursor()
-
-        # MySQL uses %s placeholders
-        sql = """
-            INSERT INTO command_history (user_id, user_command, aura_response, input_mode)
-            VALUES (%s, %s, %s, %s)
-        """
+    timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
+    return get_history_writer().put((user_id or None, user_text, bot_text, input_mode, timestamp))
 
-        cursor.execute(sql, (user_id, user_text, bot_text, input_mode))
-        conn.commit()
-        return True
 
-    except Exception as e:
-        print("SAVE_HISTORY ERROR:", e)
-        return False
-
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+def history_stats() -> dict:
+    """Queue depth, rows written / dropped, flush latency, MySQL sync state."""
+    stats = get_history_writer().stats()
+    stats.update(_syncer.stats())
+    return stats
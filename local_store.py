@@ -0,0 +1,122 @@
+# local_store.py  (root folder)
+"""
+Local SQLite store that takes every history write, MySQL or not
+ - WAL journal, one writer connection shared under a lock, fixed SQL
+   strings so sqlite3 reuses its prepared statements
+ - Each history row gets a sync_key (idempotency key) and a synced flag;
+   the syncer in history.py copies unsynced rows to MySQL in bulk
+ - Users who logged in online are cached here so login works offline
+"""
+
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+
+DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "aura_local.db")
+
+PENDING, SYNCED, REJECTED = 0, 1, 2   # command_history.synced
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS command_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sync_key TEXT UNIQUE NOT NULL,
+    user_id INTEGER,
+    user_command TEXT,
+    aura_response TEXT,
+    input_mode TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    synced INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_history_pending ON command_history(synced, id);
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    name TEXT,
+    email TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    updated_at TEXT
+);
+"""
+
+INSERT_HISTORY = """
+    INSERT INTO command_history (sync_key, user_id, user_command, aura_response, input_mode, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+SELECT_PENDING = """
+    SELECT sync_key, user_id, user_command, aura_response, input_mode, timestamp
+    FROM command_history WHERE synced = 0 ORDER BY id LIMIT ?
+"""
+MARK_SYNCED = "UPDATE command_history SET synced = ? WHERE sync_key = ?"
+UPSERT_USER = """
+    INSERT INTO users (user_id, name, email, password_hash, updated_at) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(email) DO UPDATE SET user_id = excluded.user_id, name = excluded.name,
+        password_hash = excluded.password_hash, updated_at = excluded.updated_at
+"""
+SELECT_USER = "SELECT user_id, name, password_hash FROM users WHERE email = ?"
+
+
+class LocalStore:
+    def __init__(self, path: str = DB_FILE):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, cached_statements=32)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # WAL + NORMAL: committed rows survive a crash of AURA itself
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    # ---------- history ----------
+
+    def add_history(self, rows) -> int:
+        """
+        Store (user_id, command, response, input_mode, timestamp) rows in
+        one transaction, each under a new sync_key.
+        """
+        params = [(uuid.uuid4().hex, *row) for row in rows]
+        with self._lock, self._conn:
+            self._conn.executemany(INSERT_HISTORY, params)
+        return len(params)
+
+    def pending_history(self, limit: int = 500) -> list:
+        """Oldest rows not yet copied to MySQL, sync_key first."""
+        with self._lock:
+            return self._conn.execute(SELECT_PENDING, (limit,)).fetchall()
+
+    def mark_history(self, keys, state: int = SYNCED):
+        with self._lock, self._conn:
+            self._conn.executemany(MARK_SYNCED, [(state, key) for key in keys])
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM command_history WHERE synced = 0").fetchone()[0]
+
+    # ---------- users ----------
+
+    def cache_user(self, user_id, name, email, password_hash):
+        with self._lock, self._conn:
+            self._conn.execute(UPSERT_USER, (user_id, name, email, password_hash,
+                                             datetime.now().isoformat(timespec="seconds")))
+
+    def find_user(self, email):
+        """(user_id, name, password_hash) of a user cached at an online login, or None."""
+        with self._lock:
+            return self._conn.execute(SELECT_USER, (email,)).fetchone()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_local_store() -> LocalStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LocalStore()
+        return _store
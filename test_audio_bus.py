@@ -0,0 +1,58 @@
+import numpy as np
+
+from aura.audio_bus import AudioBus, BusReader
+
+
+def _bus(seconds=1):
+    bus = AudioBus(buffer_seconds=seconds)
+    bus.start = lambda retries=3: None   # no device: the test writes the ring directly
+    return bus
+
+
+def test_ring_views_are_contiguous():
+    bus = _bus()
+    cap = bus.ring.capacity
+    reader = bus.reader()
+    block = np.arange(1000, dtype=np.int16)
+    seen = []
+    for _ in range(40):                  # wraps the buffer several times
+        bus.ring.write(block)
+        view = reader.read_view(timeout=0)
+        assert view.base is not None     # a view into the ring, not a copy
+        seen.append(view.copy())
+    assert np.array_equal(np.concatenate(seen), np.tile(block, 40))
+    assert reader.overruns == 0 and reader.dropped_frames == 0
+    print(f"SUCCESS: {40 * len(block)} samples read through a {cap}-sample ring without copies.")
+
+
+def test_drop_oldest_accounting():
+    bus = _bus()
+    reader = bus.reader(max_lag=0.25)    # keep at most 4000 samples unread
+    for i in range(10):
+        bus.ring.write(np.full(1600, i, dtype=np.int16))
+    out = np.empty(8000, dtype=np.int16)
+    n = reader.readinto(out, timeout=0)
+    assert n == 4000 and out[n - 1] == 9
+    assert reader.overruns == 1 and reader.dropped_frames == 16000 - 4000
+    assert reader.depth == 0 and reader.max_depth == 4000
+    print(f"SUCCESS: stale audio dropped oldest-first: {reader.stats()}")
+
+
+def test_max_lag_keeps_headroom():
+    bus = _bus()
+    cap = bus.ring.capacity
+    # Asking for more lag than the ring holds is capped below capacity
+    reader = BusReader(bus, 0, max_lag=2 * cap)
+    assert reader.max_lag == cap * 3 // 4
+    bus.ring.write(np.arange(cap, dtype=np.int16))
+    view = reader.read_view(timeout=0)
+    assert len(view) == reader.max_lag and view[-1] == cap - 1
+    assert view[0] == cap - reader.max_lag        # oldest samples were the ones dropped
+    assert reader.overruns == 1 and reader.dropped_frames == cap - reader.max_lag
+    print(f"SUCCESS: max_lag capped at {reader.max_lag} of {cap} samples: {reader.stats()}")
+
+
+if __name__ == "__main__":
+    test_ring_views_are_contiguous()
+    test_drop_oldest_accounting()
+    test_max_lag_keeps_headroom()
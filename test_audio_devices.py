@@ -0,0 +1,87 @@
+from aura import audio_devices
+from aura.audio_devices import DeviceRegistry
+
+
+class _FakeSoundDevice:
+    """The parts of sounddevice DeviceRegistry uses, counting the expensive calls."""
+
+    def __init__(self):
+        self.devices = [self._device("Built-in Mic")]
+        self.rate_checks = 0
+        self.reinits = 0
+        self.playing = False
+
+    @staticmethod
+    def _device(name):
+        return {"name": name, "hostapi": 0, "max_input_channels": 1,
+                "default_samplerate": 48000.0, "default_low_input_latency": 0.01,
+                "default_high_input_latency": 0.1}
+
+    def query_devices(self, device=None, kind=None):
+        if device is None and kind is None:
+            return list(self.devices)
+        return self.devices[device or 0]
+
+    def query_hostapis(self, index=None):
+        apis = [{"name": "ALSA", "default_input_device": 0}]
+        return apis if index is None else apis[index]
+
+    def check_input_settings(self, device=None, samplerate=None, **kwargs):
+        self.rate_checks += 1
+        if samplerate not in (16000, 48000):
+            raise ValueError("Invalid sample rate")
+
+    def get_stream(self):
+        if not self.playing:
+            raise RuntimeError("play()/rec()/playrec() was not called yet")
+        return type("Stream", (), {"active": True})()
+
+    def _terminate(self):
+        self.reinits += 1
+
+    def _initialize(self):
+        pass
+
+
+def test_audio_devices():
+    print("--- AURA Audio Device Registry Test ---")
+    real_sd, audio_devices.sd = audio_devices.sd, _FakeSoundDevice()
+    fake = audio_devices.sd
+    try:
+        registry = DeviceRegistry()
+
+        print("1. A device is probed once, then served from the cache...")
+        assert registry.pick_rate(None) == 16000
+        probed = fake.rate_checks
+        assert probed == len(audio_devices.CANDIDATE_RATES)
+        for _ in range(5):
+            registry.get(None)
+            registry.pick_rate(None, preferred=44100)
+        assert fake.rate_checks == probed
+
+        print("2. An unchanged device list keeps the cache...")
+        assert registry.refresh() is False
+        registry.get(None)
+        assert fake.rate_checks == probed
+
+        print("3. A hotplugged device drops it, and the next open re-probes...")
+        fake.devices.append(fake._device("USB Headset"))
+        assert registry.refresh() is True
+        registry.get(None)
+        assert fake.rate_checks == 2 * probed
+
+        print("4. PortAudio is only re-initialized while nothing is playing...")
+        fake.playing = True
+        registry.refresh(rescan=True)
+        assert fake.reinits == 0
+        fake.playing = False
+        registry.refresh(rescan=True)
+        assert fake.reinits == 1
+    finally:
+        audio_devices.sd = real_sd
+
+    print("SUCCESS: Device capabilities are cached until the device list changes.")
+
+
+if __name__ == "__main__":
+    test_audio_devices()
@@ -0,0 +1,74 @@
+import io
+import time
+import tracemalloc
+import wave
+
+import numpy as np
+import speech_recognition as sr
+
+from aura.audio_bus import AudioBus, BusReader
+from aura.mic_fix import pcm_to_audio_data, vosk_input
+
+RATE = 16000
+SECONDS = 10
+
+
+def _measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed:8.2f} ms   peak {peak / 1024:8.0f} KiB")
+    return result
+
+
+def old_path(recording):
+    """Previous MicrophoneFix + VoiceThread path: float32 -> int16 -> WAV -> AudioFile -> raw."""
+    audio_int16 = (recording * 32767).astype(np.int16)
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(RATE)
+        wf.writeframes(audio_int16.tobytes())
+    buf.seek(0)
+    with sr.AudioFile(buf) as source:
+        audio = sr.Recognizer().record(source)
+    return audio.get_raw_data(convert_rate=audio.sample_rate, convert_width=2)
+
+
+def new_path(bus):
+    """Current path: ring buffer -> preallocated int16 -> views for sr and Vosk."""
+    reader = BusReader(bus, 0)
+    pcm = np.empty(RATE * SECONDS, dtype=np.int16)
+    got = 0
+    while got < len(pcm):
+        n = reader.readinto(pcm[got:], timeout=0)
+        if n == 0:
+            break
+        got += n
+    audio = pcm_to_audio_data(pcm[:got], RATE)
+    return vosk_input(audio.frame_data)
+
+
+def test_capture_path():
+    print(f"--- Capture path, {SECONDS}s utterance at {RATE}Hz ---")
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(RATE * SECONDS) * 3000).astype(np.int16)
+
+    recording = (samples.astype(np.float32) / 32767).reshape(-1, 1)
+    old = _measure("old (WAV round trip)", lambda: old_path(recording))
+
+    vosk_input(bytearray(2))  # warm the Vosk import so it isn't measured
+    bus = AudioBus(buffer_seconds=SECONDS * 2)
+    bus.ring.write(samples)
+    new = _measure("new (preallocated + views)", lambda: new_path(bus))
+
+    assert len(old) == len(new) == samples.nbytes
+    print("SUCCESS: Both paths deliver the same number of bytes.")
+
+
+if __name__ == "__main__":
+    test_capture_path()
@@ -0,0 +1,46 @@
+import time
+
+from aura.command_executor import CommandExecutor
+
+
+def test_command_executor():
+    print("--- AURA Command Executor Test ---")
+    executor = CommandExecutor(max_workers=2)
+    done = []
+
+    def command(name, seconds):
+        time.sleep(seconds)
+        done.append(name)
+        return name
+
+    print("1. Handing off a slow command does not block the caller...")
+    start = time.perf_counter()
+    first = executor.submit("wake", command, "open app", 0.5)
+    handoff_ms = (time.perf_counter() - start) * 1000
+    print(f"   hand-off took {handoff_ms:.2f} ms")
+    assert handoff_ms < 20
+
+    print("2. Commands of one session run in order...")
+    second = executor.submit("wake", command, "volume up", 0.0)
+    third = executor.submit("wake", command, "what time", 0.0)
+
+    print("3. Another session is not held up behind it...")
+    other = executor.submit("panel", command, "typed", 0.0)
+    assert other.result(timeout=2) == "typed"
+    assert not first.done()
+
+    third.result(timeout=5)
+    assert [n for n in done if n != "typed"] == ["open app", "volume up", "what time"]
+    assert second.done() and executor.pending() == 0
+
+    print("4. A failing command doesn't stop the session...")
+    failed = executor.submit("wake", lambda: 1 / 0)
+    after = executor.submit("wake", command, "after", 0.0)
+    assert after.result(timeout=2) == "after" and failed.exception() is not None
+    print(f"   {executor.stats()}")
+
+    print("SUCCESS: Command executor behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_command_executor()
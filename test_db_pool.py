@@ -0,0 +1,69 @@
+import threading
+import time
+
+from db import ConnectionPool, PooledConnection
+
+
+class FakeConnection:
+    opened = 0
+
+    def __init__(self):
+        FakeConnection.opened += 1
+        self.alive = True
+        self.in_transaction = False
+        self.pings = 0
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        self.pings += 1
+        if not self.alive:
+            raise OSError("server has gone away")
+
+    def rollback(self):
+        self.in_transaction = False
+
+    def close(self):
+        self.alive = False
+
+
+def test_db_pool():
+    print("--- AURA Connection Pool Test ---")
+    pool = ConnectionPool(size=2, connect=FakeConnection, check_idle=0.05, timeout=0.5)
+
+    print("1. Connections are reused instead of opened per query...")
+    for _ in range(20):
+        with PooledConnection(pool, pool.acquire()):
+            pass
+    assert FakeConnection.opened == 1 and pool.checkouts == 20
+
+    print("2. No more than size connections; others wait for one...")
+    a, b = pool.acquire(), pool.acquire()
+    threading.Timer(0.1, pool.release, (a,)).start()
+    start = time.perf_counter()
+    c = pool.acquire()
+    assert c is a and time.perf_counter() - start >= 0.09 and FakeConnection.opened == 2
+    try:
+        pool.acquire()
+        assert False, "pool should be exhausted"
+    except Exception as e:
+        print(f"   {e}")
+    pool.release(b)
+    pool.release(c)
+
+    print("3. An idle connection is checked and replaced if the server dropped it...")
+    time.sleep(0.06)
+    for conn, _ in list(pool._idle.queue):
+        conn.alive = False
+    conn = pool.acquire()
+    assert conn.alive and pool.reconnects == 2 and pool.stats()["open"] == 1
+
+    print("4. An open transaction is rolled back before reuse...")
+    conn.in_transaction = True
+    pool.release(conn)
+    assert pool.acquire().in_transaction is False
+    print(f"   {pool.stats()}")
+
+    print("SUCCESS: Connection pool behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_db_pool()
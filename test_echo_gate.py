@@ -0,0 +1,77 @@
+import time
+
+import numpy as np
+
+from aura.echo_gate import EchoGate
+
+RATE = 16000
+BLOCK = 3200
+
+
+def _speech_like(seconds, seed):
+    """Noise shaped by a syllable-rate envelope, roughly like speech."""
+    rng = np.random.default_rng(seed)
+    n = int(seconds * RATE)
+    t = np.arange(n) / RATE
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t + seed)
+    return rng.standard_normal(n) * envelope * 6000
+
+
+def _room(signal, delay, gain=0.3):
+    """Delay, attenuate and add a short reverb tail, as a speaker-to-mic path."""
+    taps = np.zeros(int(0.05 * RATE))
+    taps[0] = 1.0
+    taps[::160] += 0.4 * np.exp(-np.arange(len(taps[::160])))
+    out = np.convolve(signal, taps)[:len(signal)] * gain
+    d = int(delay * RATE)
+    return np.concatenate((np.zeros(d), out))[:len(signal)]
+
+
+def _run(gate, mic, t_start):
+    gated = 0
+    blocks = 0
+    for i in range(0, len(mic) - BLOCK + 1, BLOCK):
+        block = np.clip(mic[i:i + BLOCK], -32768, 32767).astype(np.int16)
+        blocks += 1
+        gated += gate.is_echo(block, t_start + i / RATE)
+    return gated, blocks
+
+
+def test_echo_gate():
+    print("--- AURA Echo Gate Test ---")
+    rng = np.random.default_rng(1)
+    tts = _speech_like(3.0, 0)
+    noise = rng.standard_normal(len(tts)) * 100
+
+    print("1. AURA's own voice through the room is gated...")
+    gate = EchoGate()
+    t0 = time.monotonic()
+    gate.publish(tts.astype(np.int16), start_time=t0)
+    gated, blocks = _run(gate, _room(tts, 0.15) + noise, t0)
+    print(f"   {gated}/{blocks} echo blocks gated")
+    assert gated >= blocks * 0.9
+
+    print("2. The user talking over playback passes...")
+    user = _speech_like(3.0, 7)
+    gated, blocks = _run(gate, _room(tts, 0.15) + user + noise, t0)
+    print(f"   {gated}/{blocks} double-talk blocks gated")
+    assert gated <= blocks * 0.2
+
+    print("3. Live again right after playback ends...")
+    after = t0 + len(tts) / RATE + gate.max_delay + 0.01
+    gated, blocks = _run(gate, user, after)
+    assert gated == 0
+
+    print("4. Cost per block during playback...")
+    block = np.clip(_room(tts, 0.15)[:BLOCK], -32768, 32767).astype(np.int16)
+    start = time.perf_counter()
+    for _ in range(200):
+        gate.correlation(block, t0)
+    per_block = (time.perf_counter() - start) / 200 * 1000
+    print(f"   {per_block:.2f} ms per {BLOCK / RATE:.1f} s block")
+
+    print("SUCCESS: Echo gate behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_echo_gate()
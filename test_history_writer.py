@@ -0,0 +1,46 @@
+import time
+
+from history import HistoryWriter
+
+
+def test_history_writer():
+    print("--- AURA History Writer Test ---")
+    batches = []
+
+    def slow_write(rows):
+        time.sleep(0.05)           # one database round-trip
+        batches.append(list(rows))
+        return len(rows)
+
+    writer = HistoryWriter(write=slow_write, batch_size=10, flush_interval=0.1, maxsize=100)
+
+    print("1. Logging a turn does not wait for the database...")
+    start = time.perf_counter()
+    for i in range(25):
+        assert writer.put((1, f"command {i}", "response", "text"))
+    per_turn_ms = (time.perf_counter() - start) * 1000 / 25
+    print(f"   {per_turn_ms:.3f} ms per turn, queue depth {writer.stats()['queue_depth']}")
+    assert per_turn_ms < 1
+
+    print("2. Turns are written in batches of up to batch_size, in order...")
+    time.sleep(0.5)
+    assert [len(b) for b in batches] == [10, 10, 5]
+    assert [row[1] for b in batches for row in b] == [f"command {i}" for i in range(25)]
+
+    print("3. Nothing queued is lost on shutdown...")
+    for i in range(3):
+        writer.put((1, f"late {i}", "response", "voice"))
+    writer.close()
+    assert batches[-1][-1][1] == "late 2" and writer.written == 28
+
+    print("4. A full queue drops the turn instead of blocking...")
+    stuck = HistoryWriter(write=lambda rows: time.sleep(1) or len(rows), batch_size=1, maxsize=2)
+    results = [stuck.put((None, "c", "r", "text")) for _ in range(6)]
+    assert results.count(False) >= 3 and stuck.stats()["dropped"] >= 3
+    print(f"   {writer.stats()}")
+
+    print("SUCCESS: History writer behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_history_writer()
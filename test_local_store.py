@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import tempfile
+import time
+
+from mysql.connector import ProgrammingError, errorcode
+
+from history import SYNC_KEY_MIGRATION, HistorySyncer
+from local_store import REJECTED, LocalStore
+
+
+def test_local_store():
+    print("--- AURA Local Store Test ---")
+    path = os.path.join(tempfile.mkdtemp(), "aura_local.db")
+    store = LocalStore(path)
+
+    print("1. Writes go to a WAL-mode SQLite file...")
+    assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    rows = [(1, f"command {i}", "response", "text", "2026-10-19 10:00:00") for i in range(200)]
+    start = time.perf_counter()
+    store.add_history(rows)
+    print(f"   200 turns stored in {(time.perf_counter() - start) * 1000:.1f} ms")
+    assert store.pending_count() == 200
+
+    print("2. Nothing is copied while MySQL is down, and nothing is lost...")
+    server = {}                  # sync_key -> row, as MySQL would keep it
+    up = [False]
+
+    def push(batch):
+        if not up[0]:
+            return None
+        rejected = [r[0] for r in batch if r[1] == 999]     # unknown user
+        for r in batch:
+            if r[0] not in rejected:
+                server.setdefault(r[0], r)                  # duplicate key: no-op
+        return [r[0] for r in batch if r[0] not in rejected], rejected
+
+    syncer = HistorySyncer(store, push=push, batch_size=64, interval=0.05, max_backoff=0.1)
+    time.sleep(0.2)
+    assert syncer.reachable is False and store.pending_count() == 200 and not server
+
+    print("3. Once it is back, rows are copied in batches, each once...")
+    store.add_history([(999, "from a deleted user", "response", "voice", "2026-10-19 10:01:00")])
+    up[0] = True
+    deadline = time.monotonic() + 3
+    while store.pending_count() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    syncer.close()
+    assert len(server) == 200 and syncer.synced == 200 and syncer.rejected == 1
+    assert len(syncer.sync_ms) >= 4       # 201 rows in batches of 64
+    check = sqlite3.connect(path)
+    assert check.execute("SELECT COUNT(*) FROM command_history WHERE synced = ?",
+                         (REJECTED,)).fetchone()[0] == 1
+
+    print("4. Re-sending rows MySQL already has does not duplicate them...")
+    keys = [r[0] for r in store._conn.execute("SELECT sync_key FROM command_history LIMIT 10")]
+    store.mark_history(keys, 0)
+    assert syncer.sync_once() and len(server) == 200
+
+    print("5. Users cached at login are found for offline login...")
+    store.cache_user(7, "Sinchana", "s@example.com", "$2b$12$hash")
+    store.cache_user(7, "Sinchana B", "s@example.com", "$2b$12$newhash")
+    assert store.find_user("s@example.com") == (7, "Sinchana B", "$2b$12$newhash")
+    assert store.find_user("nobody@example.com") is None
+    print(f"   {syncer.stats()}")
+
+    print("6. A table without sync_key stops the sync instead of retrying forever...")
+    attempts = []
+
+    def old_schema(batch):
+        attempts.append(len(batch))
+        raise ProgrammingError(msg="1054 (42S22): Unknown column 'sync_key' in 'field list'",
+                               errno=errorcode.ER_BAD_FIELD_ERROR)
+
+    store.add_history([(1, "after an upgrade", "response", "text", "2026-10-19 10:02:00")])
+    stale = HistorySyncer(store, push=old_schema, interval=0.02, max_backoff=0.05)
+    time.sleep(0.3)
+    stale.close()
+    assert attempts == [1] and stale.disabled and stale.reachable
+    assert store.pending_count() == 1 and "ADD COLUMN sync_key" in SYNC_KEY_MIGRATION
+
+    print("SUCCESS: Local store behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_local_store()
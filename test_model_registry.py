@@ -0,0 +1,85 @@
+import os
+import tempfile
+import threading
+import time
+
+from aura.model_registry import ModelRegistry
+
+
+def test_model_registry():
+    print("--- AURA Model Registry Test ---")
+    loads = []
+
+    def slow_model(path):
+        loads.append(path)
+        time.sleep(0.3)
+        return object()
+
+    registry = ModelRegistry(factory=slow_model)
+
+    print("1. load() returns at once while the model loads in the background...")
+    start = time.perf_counter()
+    future = registry.load("models/vosk-small-en")
+    assert time.perf_counter() - start < 0.05 and not future.done()
+
+    print("2. Concurrent users share one load and one model...")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("models/vosk-small-en")))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(loads) == 1 and all(m is results[0] for m in results)
+    assert registry.is_ready("./models/vosk-small-en")
+
+    print("3. A failed load is retried on the next request...")
+    attempts = []
+
+    def flaky(path):
+        attempts.append(path)
+        if len(attempts) == 1:
+            raise RuntimeError("model files missing")
+        return object()
+
+    registry = ModelRegistry(factory=flaky)
+    try:
+        registry.get("models/other")
+        assert False, "first load should fail"
+    except RuntimeError:
+        pass
+    assert registry.get("models/other") is not None and len(attempts) == 2
+
+    print("4. Least recently used model is evicted over the memory budget, leased ones stay...")
+    with tempfile.TemporaryDirectory() as root:
+        paths = {}
+        for lang in ("en", "kn", "hi"):
+            paths[lang] = os.path.join(root, lang)
+            os.makedirs(paths[lang])
+            # 20 MB on disk (sparse) and 20 MB in memory, whichever is measured
+            with open(os.path.join(paths[lang], "final.mdl"), "wb") as f:
+                f.truncate(20 * 1024 * 1024)
+
+        registry = ModelRegistry(factory=lambda path: b"x" * (20 * 1024 * 1024),
+                                 memory_budget_mb=50, paths=paths)
+        registry.for_language("en", lease=True).result()  # held, like the wake listener
+        registry.for_language("kn").result()
+        registry.warm("hi").result()          # en is oldest, but leased
+        resident = set(registry.stats())
+        assert registry._key(paths["kn"]) not in resident, resident
+        assert registry._key(paths["en"]) in resident and registry.evictions == 1
+        assert set(registry.switch_ms) == {"en", "kn"}
+
+        registry.release(paths["en"])         # en is now free to go
+        registry.get(paths["kn"])
+        resident = set(registry.stats())
+        assert registry._key(paths["en"]) not in resident, resident
+        assert registry._key(paths["kn"]) in resident and registry.evictions == 2
+        assert registry.stats()[registry._key(paths["kn"])]["leases"] == 1
+    assert registry.for_language("fr") is None
+
+    print("SUCCESS: Model registry behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_model_registry()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from aura.phrase_cache import PhraseCache
+
+RATE = 22050
+
+
+def _pcm(seconds):
+    return (np.random.default_rng(0).standard_normal(int(seconds * RATE)) * 1000).astype(np.int16)
+
+
+def test_phrase_cache():
+    print("--- AURA Phrase Cache Test ---")
+    directory = tempfile.mkdtemp(prefix="aura_tts_cache_")
+    cache = PhraseCache(directory, max_disk_bytes=200_000, promote_after=3)
+
+    print("1. A cached phrase comes back identical, for the same voice and rate only...")
+    ack = _pcm(0.5)
+    cache.put("Yes, I'm listening.", "zira", 175, ack, RATE)
+    pcm, rate = cache.get("Yes, I'm listening.", "zira", 175)
+    assert rate == RATE and np.array_equal(pcm, ack)
+    assert cache.get("Yes, I'm listening.", "david", 175) is None
+    assert cache.get("Yes, I'm listening.", "zira", 200) is None
+
+    print("2. It survives a restart and loads faster than rendering...")
+    cache = PhraseCache(directory, max_disk_bytes=200_000, promote_after=3)
+    start = time.perf_counter()
+    pcm, _ = cache.get("Yes, I'm listening.", "zira", 175)
+    load_ms = (time.perf_counter() - start) * 1000
+    print(f"   loaded from disk in {load_ms:.2f} ms")
+    assert np.array_equal(pcm, ack) and load_ms < 50
+
+    print("3. Fixed phrases are cached at once, others after repeated use...")
+    cache.mark_fixed(["Hello! I'm AURA."])
+    assert cache.should_cache("Hello! I'm AURA.")
+    assert [cache.should_cache("Done.") for _ in range(3)] == [False, False, True]
+
+    print("4. The least recently used files are evicted over the size limit...")
+    os.utime(os.path.join(directory, cache.key("Yes, I'm listening.", "zira", 175) + ".wav"),
+             (time.time() - 60, time.time() - 60))
+    cache.put("Done.", "zira", 175, _pcm(2.0), RATE)          # ~88 KB
+    cache.get("Done.", "zira", 175)
+    cache.put("Opening Chrome.", "zira", 175, _pcm(2.5), RATE)  # ~110 KB
+    files = os.listdir(directory)
+    assert len(files) == 2 and cache.stats()["disk_kb"] * 1024 <= 200_000, files
+    assert not cache.contains("Yes, I'm listening.", "zira", 175)
+    print(f"   {cache.stats()}")
+
+    print("SUCCESS: Phrase cache behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_phrase_cache()
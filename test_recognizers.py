@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import speech_recognition as sr
+
+from aura.recognizers import ConnectivityMonitor, RecognizerOrchestrator
+
+
+class _FakeGoogle(BaseHTTPRequestHandler):
+    """Local stand-in for the Google speech endpoint."""
+    transcript = "open chrome"
+    confidence = 0.92
+    delay = 0.0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay)
+        body = json.dumps({"result": []}) + "\n" + json.dumps({
+            "result": [{"alternative": [{"transcript": self.transcript,
+                                         "confidence": self.confidence}],
+                        "final": True}],
+            "result_index": 0,
+        })
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGoogle)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _audio():
+    pcm = (np.random.default_rng(0).standard_normal(16000) * 1000).astype(np.int16)
+    return sr.AudioData(pcm.tobytes(), 16000, 2)
+
+
+def _orchestrator(endpoint):
+    rec = sr.Recognizer()
+    rec.operation_timeout = 3
+    return RecognizerOrchestrator(rec, endpoint=endpoint, timeout=3.0,
+                                  connectivity=ConnectivityMonitor(endpoint, recheck=60))
+
+
+def test_recognizers():
+    print("--- AURA Hedged Recognition Test ---")
+    server = _start_server()
+    endpoint = f"http://127.0.0.1:{server.server_port}/speech-api/v2/recognize"
+    audio = _audio()
+
+    print("1. Cloud answer beats a low-confidence local result...")
+    orch = _orchestrator(endpoint)
+    text, conf, used = orch.recognize(audio, local=("open crow", 0.3))
+    assert text == "open chrome" and used.startswith("google"), (text, used)
+
+    print("2. Confident local result returns without waiting on a slow cloud...")
+    _FakeGoogle.delay = 2.0
+    start = time.perf_counter()
+    text, conf, used = orch.recognize(audio, local=("volume up", 0.9))
+    assert used == "vosk" and time.perf_counter() - start < 0.5
+    _FakeGoogle.delay = 0.0
+
+    print("3. Unreachable endpoint marks offline, then cloud is skipped...")
+    server.shutdown()
+    server.server_close()
+    orch = _orchestrator(endpoint)
+    text, conf, used = orch.recognize(audio, local=("volume up", 0.3))
+    assert used == "vosk" and not orch.connectivity.online
+    start = time.perf_counter()
+    orch.recognize(audio, local=("volume up", 0.3))
+    assert time.perf_counter() - start < 0.1
+
+    print("SUCCESS: Hedged recognition behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_recognizers()
@@ -0,0 +1,51 @@
+import time
+
+import numpy as np
+
+from aura.resample import StreamingResampler
+
+OUT_RATE = 16000
+
+
+def _rms_ratio(rate, freq, seconds=2):
+    t = np.arange(rate * seconds) / rate
+    x = (np.sin(2 * np.pi * freq * t) * 10000).astype(np.int16)
+    r = StreamingResampler(rate, OUT_RATE)
+    block = rate // 10
+    y = np.concatenate([r.process(x[i:i + block]) for i in range(0, len(x), block)])
+    y = y[OUT_RATE // 10:].astype(np.float64)   # skip filter warm-up
+    return np.sqrt(np.mean(y ** 2)) / (10000 / np.sqrt(2)), len(y)
+
+
+def test_resample():
+    print("--- AURA Streaming Resampler Test ---")
+    for rate in (44100, 48000):
+        passband, _ = _rms_ratio(rate, 1000)
+        stopband, _ = _rms_ratio(rate, 10000)
+        assert 0.97 < passband < 1.03, passband
+        assert stopband < 0.05, stopband
+
+        # Block boundaries must not change the output
+        x = (np.random.default_rng(0).standard_normal(rate * 2) * 3000).astype(np.int16)
+        whole = StreamingResampler(rate, OUT_RATE).process(x)
+        r = StreamingResampler(rate, OUT_RATE)
+        pieces = np.concatenate([r.process(x[i:i + 777]) for i in range(0, len(x), 777)])
+        assert len(whole) == 2 * OUT_RATE and np.array_equal(whole, pieces)
+
+        # CPU cost in 100 ms capture blocks
+        seconds = 10
+        x = (np.random.default_rng(1).standard_normal(rate * seconds) * 3000).astype(np.int16)
+        r = StreamingResampler(rate, OUT_RATE)
+        block = rate // 10
+        start = time.process_time()
+        for i in range(0, len(x), block):
+            r.process(x[i:i + block])
+        cpu_ms = (time.process_time() - start) * 1000 / seconds
+        print(f"{rate}Hz -> {OUT_RATE}Hz: passband {passband:.3f}, 10kHz {stopband:.4f}, "
+              f"CPU {cpu_ms:.2f} ms per audio second ({cpu_ms / 10:.2f}% of one core)")
+
+    print("SUCCESS: Resampler output is correct and streaming-safe.")
+
+
+if __name__ == "__main__":
+    test_resample()
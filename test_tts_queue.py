@@ -0,0 +1,146 @@
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+import aura.voice as voice
+from aura.phrase_cache import PhraseCache
+
+RATE = 16000
+LENGTHS = {"long answer": 1.0, "Yes, I'm listening.": 0.2, "Done.": 0.1}
+started = []
+
+
+def _fake_render(engine, text):
+    return np.zeros(int(LENGTHS.get(text, 0.1) * RATE), dtype=np.int16), RATE
+
+
+def _wait_idle(timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while (voice._queue or voice._current is not None) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_tts_queue():
+    print("--- AURA TTS Worker Test ---")
+    # No audio device or speech engine needed: render and output are faked
+    voice._get_engine = lambda: object()
+    voice._render_pcm = _fake_render
+    voice._output_start = lambda pcm, rate: started.append(len(pcm))
+    voice._output_stop = lambda: None
+
+    print("1. Every utterance goes through one worker thread...")
+    threads_before = threading.active_count()
+    for _ in range(5):
+        voice.speak("Done.")
+        voice.speak("long answer")
+    _wait_idle()
+    assert threading.active_count() <= threads_before + 1
+
+    print("2. Identical queued messages are coalesced...")
+    assert started.count(int(0.1 * RATE)) == 1 and started.count(RATE) == 1
+
+    print("3. An acknowledgement preempts an answer, which then resumes...")
+    started.clear()
+    voice.speak("long answer")
+    time.sleep(0.3)
+    assert voice.is_speaking()
+    voice.speak_ack("Yes, I'm listening.")
+    _wait_idle()
+    assert started[0] == RATE and started[1] == int(0.2 * RATE)
+    assert 0 < started[2] < RATE, started      # resumed from where it stopped
+    assert not voice.is_speaking()
+
+    print("4. interrupt() stops speech at once and drops the queue...")
+    started.clear()
+    voice.speak("long answer")
+    voice.speak("Done.")
+    time.sleep(0.2)
+    start = time.perf_counter()
+    voice.interrupt()
+    while voice.is_speaking():
+        time.sleep(0.005)
+    stop_ms = (time.perf_counter() - start) * 1000
+    _wait_idle()
+    print(f"   stopped after {stop_ms:.0f} ms")
+    assert stop_ms < 100 and started == [RATE]
+
+    print("5. Long text starts after its first sentence, the rest rendered ahead...")
+    renders = []
+
+    def slow_render(engine, text):
+        renders.append(text)
+        time.sleep(len(text) / 1000)     # ~1 ms of synthesis per character
+        return np.zeros(int(0.3 * RATE), dtype=np.int16), RATE
+
+    voice._render_pcm = slow_render
+    story = " ".join(f"This is sentence number {i} of a rather long spoken answer." for i in range(6))
+    started.clear()
+    voice.speak(story, async_=False)
+    first_ms = voice.first_audio_ms[-1]
+    print(f"   first audio after {first_ms:.0f} ms ({len(story)} ms to render it all)")
+    assert len(renders) == 6 and len(started) == 6
+    assert first_ms < len(story) / 3
+
+    print("6. interrupt(after_chunk=True) stops at the end of the sentence...")
+    started.clear()
+    voice.speak(story)
+    time.sleep(0.15)
+    voice.interrupt(after_chunk=True)
+    _wait_idle()
+    assert len(started) == 1, started
+
+    print("7. While the next sentence renders, barge-in and acknowledgements don't wait...")
+
+    class _Engine:
+        def getProperty(self, name):
+            return {"voice": "test-voice", "rate": 175}[name]
+
+    def render_second_slowly(engine, text):
+        if text.startswith("Second"):
+            time.sleep(1.0)
+        return np.zeros(int(0.5 * RATE), dtype=np.int16), RATE
+
+    ack = "Yes, I'm listening."
+    real_engine, real_cache = voice._get_engine, voice.get_phrase_cache
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PhraseCache(directory=tmp)
+        cache.put(ack, "test-voice", 175, np.zeros(1234, dtype=np.int16), RATE)
+        engine = _Engine()
+        voice._get_engine = lambda: engine
+        voice.get_phrase_cache = lambda: cache
+        voice._render_pcm = render_second_slowly
+        two = "First sentence here. Second sentence here."
+        try:
+            started.clear()
+            voice.speak(two)
+            time.sleep(0.2)
+            start = time.perf_counter()
+            voice.interrupt()
+            while voice.is_speaking():
+                time.sleep(0.005)
+            stop_ms = (time.perf_counter() - start) * 1000
+            _wait_idle()
+            time.sleep(1.0)      # the render of the dropped sentence still holds the engine
+
+            voice.speak(two)
+            time.sleep(0.2)
+            start = time.perf_counter()
+            voice.speak_ack(ack)
+            while 1234 not in started and time.perf_counter() - start < 2.0:
+                time.sleep(0.005)
+            ack_ms = (time.perf_counter() - start) * 1000
+            _wait_idle()
+        finally:
+            voice._get_engine, voice.get_phrase_cache = real_engine, real_cache
+    print(f"   stopped after {stop_ms:.0f} ms, acknowledgement after {ack_ms:.0f} ms "
+          f"(next sentence takes 1000 ms to render)")
+    assert stop_ms < 100 and ack_ms < 150
+    assert started[-1] == int(0.5 * RATE)       # the answer still finished afterwards
+
+    print("SUCCESS: TTS worker behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_tts_queue()
@@ -0,0 +1,63 @@
+import numpy as np
+
+from aura.vad import EnergyVAD
+
+RATE = 16000
+BLOCK = 1600      # 100 ms, as MicrophoneFix.listen hands them over
+HANGOVER = 0.4
+
+
+def _quiet_room(seconds, rng):
+    # Low broadband hiss plus a faint 50 Hz hum
+    t = np.arange(int(seconds * RATE)) / RATE
+    noise = rng.standard_normal(len(t)) * 60 + np.sin(2 * np.pi * 50 * t) * 40
+    return noise.astype(np.int16)
+
+
+def _tone(seconds, rng):
+    t = np.arange(int(seconds * RATE)) / RATE
+    voiced = np.sin(2 * np.pi * 180 * t) * 5000 * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))
+    return (voiced + rng.standard_normal(len(t)) * 60).astype(np.int16)
+
+
+def _run(signal, vad):
+    """Feed signal block by block; returns the time at which the VAD reported the end."""
+    for i in range(0, len(signal), BLOCK):
+        if vad.process(signal[i:i + BLOCK]):
+            return (i + BLOCK) / RATE
+    return None
+
+
+def test_vad():
+    print("--- AURA End-of-Speech VAD Test ---")
+    rng = np.random.default_rng(0)
+
+    print("1. End of speech is reported within the hangover window...")
+    signal = np.concatenate([_quiet_room(0.5, rng), _tone(1.0, rng), _quiet_room(2.0, rng)])
+    vad = EnergyVAD(sample_rate=RATE, hangover=HANGOVER)
+    ended_at = _run(signal, vad)
+    assert ended_at is not None and vad.speech_started
+    assert abs(vad.seconds(vad.speech_start_frame) - 0.5) <= 0.05, vad.seconds(vad.speech_start_frame)
+    assert abs(vad.seconds(vad.speech_end_frame) - 1.5) <= 0.05, vad.seconds(vad.speech_end_frame)
+    assert 1.5 + HANGOVER <= ended_at <= 1.5 + HANGOVER + BLOCK / RATE, ended_at
+    print(f"   speech {vad.seconds(vad.speech_start_frame):.2f}-{vad.seconds(vad.speech_end_frame):.2f}s, "
+          f"end reported at {ended_at:.2f}s")
+
+    print("2. A short pause inside speech does not end the utterance...")
+    signal = np.concatenate([_quiet_room(0.5, rng), _tone(0.6, rng), _quiet_room(0.2, rng),
+                             _tone(0.6, rng), _quiet_room(2.0, rng)])
+    vad = EnergyVAD(sample_rate=RATE, hangover=HANGOVER)
+    ended_at = _run(signal, vad)
+    assert abs(vad.seconds(vad.speech_end_frame) - 1.9) <= 0.05, vad.seconds(vad.speech_end_frame)
+    assert 1.9 + HANGOVER <= ended_at <= 1.9 + HANGOVER + BLOCK / RATE, ended_at
+    print(f"   utterance ended at {vad.seconds(vad.speech_end_frame):.2f}s, after the second word")
+
+    print("3. Silence alone never starts or ends an utterance...")
+    vad = EnergyVAD(sample_rate=RATE, hangover=HANGOVER)
+    assert _run(_quiet_room(3.0, rng), vad) is None and not vad.speech_started
+
+    print("SUCCESS: End of speech is detected without cutting off pauses.")
+
+
+if __name__ == "__main__":
+    test_vad()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import time
+
+import aura.voice as voice
+
+
+class FakeVoice:
+    def __init__(self, id, name, languages=()):
+        self.id, self.name, self.languages = id, name, list(languages)
+
+
+class FakeEngine:
+    def __init__(self, voices):
+        self.voices = voices
+        self.scans = 0
+        self.voice = None
+
+    def getProperty(self, name):
+        if name == "voices":
+            self.scans += 1
+            return self.voices
+        return getattr(self, name)
+
+    def setProperty(self, name, value):
+        if name == "voice" and value not in [v.id for v in self.voices]:
+            raise ValueError(f"unknown voice {value}")
+        setattr(self, name, value)
+
+
+VOICES = [FakeVoice("david", "Microsoft David"), FakeVoice("zira", "Microsoft Zira"),
+          FakeVoice("kannada", "Kannada", ["kn-IN"])]
+
+
+def test_voice_catalog():
+    print("--- AURA Voice Catalog Test ---")
+    voice.VOICE_MAP_FILE = os.path.join(tempfile.mkdtemp(), "voice_map.json")
+    voice._voice_map = None
+    engine = FakeEngine(VOICES)
+
+    print("1. Voices are enumerated once, however often the language changes...")
+    for text in ["hello", "ನಮಸ್ಕಾರ", "what time is it", "ಸಮಯ ಎಷ್ಟು"] * 25:
+        voice._select_voice(engine, voice._detect_lang_from_text(text))
+    assert engine.scans == 1 and voice._current_lang == "kn" and engine.voice == "kannada"
+    assert voice._pick_voice_for_lang(engine, "en") == "zira"
+
+    print("2. The language map is reused on the next run...")
+    voice._voice_map = None
+    engine = FakeEngine(VOICES)
+    assert voice._pick_voice_for_lang(engine, "kn") == "kannada" and engine.scans == 0
+
+    print("3. A saved voice that has gone is found again...")
+    voice._voice_map = None
+    engine = FakeEngine(VOICES[:2])
+    voice._current_lang = "en"
+    voice._select_voice(engine, "kn")
+    assert engine.scans == 1 and engine.voice == "zira"
+
+    print("4. Script detection is one regex search...")
+    text = "Please open the file called notes for me " * 50
+    start = time.perf_counter()
+    for _ in range(1000):
+        voice._detect_lang_from_text(text)
+    per_call_us = (time.perf_counter() - start) * 1000
+    print(f"   {per_call_us:.1f} us per {len(text)}-character text")
+    assert voice._detect_lang_from_text(text + "ಕ") == "kn"
+
+    print("SUCCESS: Voice catalog behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_voice_catalog()
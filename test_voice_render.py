@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from aura.voice_render import CATEGORY_LIMITS, duration_stats, render_for_voice
+
+RESPONSES = [
+    "Here's what I can do for you:\n\n"
+    "[MUSIC] **Media**: Play YouTube videos, search the web\n"
+    "💻 **System**: Control volume, brightness, open/close apps\n"
+    "⏰ **Information**: Tell time, weather, quick facts\n"
+    "✉️ **Communication**: Send emails to your contacts\n\n"
+    "Just ask me naturally, like 'Play music on YouTube' or 'What time is it?'",
+    "[APP] WhatsApp Commands:\n• 'message sinchana hello'\n• 'whatsapp dad saying I'm coming home'\n"
+    "• 'text mom good morning'",
+    "📁 'Documents' contains:\n📂 3 folders: work, photos, notes\n"
+    "📄 12 files: a.txt, b.pdf, c.doc, d.md, e.py and 7 more",
+    "Found 📄 report.pdf (C:\\Users\\me\\Documents\\work\\report.pdf)",
+    "[OK] Email sent to john@example.com",
+]
+
+
+def test_voice_render():
+    print("--- AURA Voice Rendering Test ---")
+    spoken = [render_for_voice(text) for text in RESPONSES]
+    for text in spoken:
+        print(f"   {text}")
+
+    print("1. Markup, emoji and status tags are not read out...")
+    for text in spoken:
+        assert not any(mark in text for mark in ("**", "[OK]", "[APP]", "📁", "✉", "•", "\n"))
+
+    print("2. Lists are summarized and paths shortened...")
+    assert "Media, System, Information and 1 more" in spoken[0]
+    assert "3 folders and 12 files, including work, photos, notes and 12 more" in spoken[2]
+    assert spoken[3] == "Found report.pdf."
+    assert spoken[4] == "Email sent to john@example.com."
+
+    print("3. Spoken length is capped per category, at a sentence end...")
+    long_text = " ".join(f"Line {i} of the text on screen." for i in range(40))
+    capped = render_for_voice(long_text, "screen")
+    assert len(capped) <= CATEGORY_LIMITS["screen"] and capped.endswith(".")
+
+    print("4. The listener speaks a command's answer with that command's cap...")
+    from aura.wake_word_listener import WakeWordListener
+    answer = " ".join(f"Found report_{i}.pdf in the work folder." for i in range(20))
+    said = []
+    listener = SimpleNamespace(handle_command=lambda text: answer, speak=said.append,
+                               turn_category=lambda: "file")
+    WakeWordListener._run_command(listener, "find reports")
+    listener.turn_category = lambda: "app"      # no cap of its own: guessed from the text
+    WakeWordListener._run_command(listener, "find reports")
+    assert CATEGORY_LIMITS["default"] < len(said[0]) <= CATEGORY_LIMITS["file"], len(said[0])
+    assert said[1] == render_for_voice(answer, "default")
+
+    stats = duration_stats()
+    print(f"   average speech {stats['before_s']} s -> {stats['after_s']} s per response")
+    assert stats["after_s"] < stats["before_s"]
+
+    print("SUCCESS: Voice rendering behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_voice_render()
@@ -0,0 +1,87 @@
+import json
+
+import numpy as np
+
+from aura.recognizers import VoskStream
+
+RATE = 16000
+
+
+class _ScriptedRecognizer:
+    """
+    Stand-in for a KaldiRecognizer. Each AcceptWaveform() call takes the
+    next step of the script: words heard so far in the current segment,
+    and whether Vosk finalizes the segment there.
+    """
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.words = []
+        self.calls = 0
+        self.resets = 0
+
+    def AcceptWaveform(self, data):
+        self.words, final = self.script[self.calls]
+        self.calls += 1
+        return final
+
+    def _result(self):
+        text = " ".join(self.words)
+        result = {"text": text, "result": [{"word": w, "conf": 0.8} for w in self.words]}
+        self.words = []
+        return json.dumps(result)
+
+    def Result(self):
+        return self._result()
+
+    def FinalResult(self):
+        return self._result()
+
+    def PartialResult(self):
+        return json.dumps({"partial": " ".join(self.words)})
+
+    def Reset(self):
+        self.resets += 1
+        self.words = []
+
+
+def _chunks(n):
+    return [np.zeros(RATE // 10, dtype=np.int16) for _ in range(n)]
+
+
+def test_vosk_stream():
+    print("--- AURA Streaming Vosk Decode Test ---")
+    rec = _ScriptedRecognizer([
+        (["open"], False),
+        (["open"], False),                  # unchanged: not reported again
+        (["open", "chrome"], False),
+        (["open", "chrome"], True),         # user paused: Vosk finalizes a segment
+        (["and"], False),
+        (["and", "play", "music"], False),
+    ])
+    partials = []
+
+    print("1. Partial text is reported as it changes, while audio is still coming in...")
+    stream = VoskStream(model=None, on_partial=partials.append, recognizer=rec)
+    assert rec.resets == 1
+    for chunk in _chunks(6):
+        stream.feed(chunk, RATE)
+    assert partials == ["open", "open chrome", "open chrome and", "open chrome and play music"], partials
+
+    print("2. finish() only flushes the tail and joins the segments...")
+    assert stream.finish() == "open chrome and play music"
+    assert stream.chunks == 6 and abs(stream.confidence - 0.8) < 1e-9
+
+    print("3. A reused recognizer is reset, so nothing carries over...")
+    rec.script.append((["volume"], False))
+    rec.words = ["stale"]                   # left half-decoded by an aborted capture
+    stream = VoskStream(model=None, recognizer=rec)
+    assert rec.resets == 2 and rec.words == []
+    stream.feed(_chunks(1)[0], RATE)
+    assert stream.finish() == "volume"
+
+    print("SUCCESS: Vosk stream decodes incrementally and resets between utterances.")
+
+
+if __name__ == "__main__":
+    test_vosk_stream()
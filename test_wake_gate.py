@@ -0,0 +1,89 @@
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from aura.vad import EnergyGate
+
+RATE = 16000
+BLOCK = 3200
+MODEL = Path("models/vosk-small-en")
+
+
+def _quiet_room(seconds, rng):
+    # Low broadband hiss plus a faint 50 Hz hum
+    t = np.arange(int(seconds * RATE)) / RATE
+    noise = rng.standard_normal(len(t)) * 60 + np.sin(2 * np.pi * 50 * t) * 40
+    return noise.astype(np.int16)
+
+
+def _speech(seconds, rng):
+    t = np.arange(int(seconds * RATE)) / RATE
+    voiced = np.sin(2 * np.pi * 180 * t) * 5000 * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))
+    return (voiced + rng.standard_normal(len(t)) * 60).astype(np.int16)
+
+
+def _wake_recognizer():
+    """A KaldiRecognizer with the listener's wake grammar, or None without a full model."""
+    if not (MODEL / "am").exists():
+        return None
+    from vosk import KaldiRecognizer, Model
+    from aura.wake_word_listener import build_wake_grammar, load_wake_phrases
+    model = Model(str(MODEL))
+    return KaldiRecognizer(model, RATE, json.dumps(build_wake_grammar(load_wake_phrases(), model)))
+
+
+def test_wake_gate():
+    print("--- AURA Wake Gate Test ---")
+    rng = np.random.default_rng(0)
+    quiet = _quiet_room(60, rng)
+
+    blocks = [quiet[i:i + BLOCK] for i in range(0, len(quiet), BLOCK)]
+    rec = _wake_recognizer()
+    if rec is not None:
+        # Before the gate: every block went to the recognizer
+        start = time.process_time()
+        for block in blocks:
+            rec.AcceptWaveform(block.tobytes())
+        before_ms = (time.process_time() - start) * 1000 / 60
+        rec.Reset()
+
+    gate = EnergyGate(sample_rate=RATE)
+    start = time.process_time()
+    passed = 0
+    for block in blocks:
+        for fed in gate.process(block):
+            passed += len(fed)
+            if rec is not None:
+                rec.AcceptWaveform(fed.tobytes())
+    cpu_ms = (time.process_time() - start) * 1000 / 60
+    print(f"Quiet room: {gate.pass_ratio:.1%} of blocks reach the decoder, "
+          f"gate CPU {cpu_ms:.2f} ms per audio second")
+    assert passed == 0
+    if rec is None:
+        print(f"   SKIPPED: decoder CPU without the gate needs a complete Vosk model in {MODEL}")
+    else:
+        print(f"   wake decoding CPU per audio second: {before_ms:.2f} ms ungated -> "
+              f"{cpu_ms:.2f} ms gated")
+        assert cpu_ms < before_ms
+
+    # A word after silence: the gate opens with the pre-roll in front of it
+    signal = np.concatenate([quiet[:RATE * 2], _speech(0.6, rng), quiet[:RATE * 2]])
+    gate = EnergyGate(sample_rate=RATE)
+    fed = []
+    closed_at = None
+    for i in range(0, len(signal), BLOCK):
+        fed.extend(gate.process(signal[i:i + BLOCK]))
+        if gate.just_closed:
+            closed_at = i / RATE
+    fed_seconds = sum(len(b) for b in fed) / RATE
+    assert 0.6 + 0.3 <= fed_seconds <= 0.6 + 0.3 + 1.0 + 2 * BLOCK / RATE, fed_seconds
+    assert closed_at is not None
+    print(f"Speech burst: {fed_seconds:.2f}s fed to the decoder (incl. pre-roll and hangover), "
+          f"gate closed at {closed_at:.1f}s")
+    print("SUCCESS: Silent blocks are skipped and word onsets are kept.")
+
+
+if __name__ == "__main__":
+    test_wake_gate()
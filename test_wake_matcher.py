@@ -0,0 +1,61 @@
+import time
+
+from aura.phonetic import PhraseMatcher
+from aura.wake_word_listener import DEFAULT_WAKE_PHRASES, build_wake_grammar, load_wake_phrases
+
+PHRASES = ["hey aura", "hi aura", "hello aura", "hey aurora", "aura", "hey ora", "hey aural"]
+
+
+class _Vocabulary:
+    """Model stand-in: find_word() is -1 for words the model does not know."""
+
+    def __init__(self, words):
+        self.words = words
+
+    def find_word(self, word):
+        return 1 if word in self.words else -1
+
+
+def test_wake_matcher():
+    print("--- AURA Wake Phrase Matcher Test ---")
+    matcher = PhraseMatcher(PHRASES)
+
+    print("1. Short words wake only as spelled, longer ones by sound...")
+    for text in ("hey ora", "hi aura", "hey aural", "hey oral"):
+        assert matcher.find(text) is not None, text
+    for text in ("hay aura", "hey error", "hi ora", "ho aura"):
+        assert matcher.find(text) is None, text
+
+    print("2. Returns the word index right after the wake phrase...")
+    assert matcher.find("hey ora open chrome") == 2
+    assert matcher.find("hey oral what time is it") == 2   # same key as "aural"
+    assert matcher.find("[unk] aura") == 2
+    assert matcher.find("aura") == 1
+
+    print("3. Ordinary speech does not match...")
+    for text in ("what time is it", "are you there", "play some music", "[unk] [unk]",
+                 "how are you", "hi our team", "hire aura"):
+        assert matcher.find(text) is None, text
+
+    print("4. Everything the wake grammar can output wakes...")
+    vocabulary = _Vocabulary({"hey", "hi", "hello", "ok", "okay", "aura", "aurora", "ora"})
+    for phrases in (load_wake_phrases(), DEFAULT_WAKE_PHRASES):
+        configured = PhraseMatcher(phrases)
+        grammar = build_wake_grammar(phrases, vocabulary)
+        assert "hey laura" not in grammar and "ok aura" in grammar and grammar[-1] == "[unk]"
+        for phrase in grammar[:-1]:
+            assert configured.find(phrase) is not None, phrase
+
+    print("5. Matching cost...")
+    text = "please could you open the browser and play some music for me " * 4
+    start = time.perf_counter()
+    for _ in range(2000):
+        matcher.find(text)
+    per_call = (time.perf_counter() - start) / 2000 * 1e6
+    print(f"   {per_call:.1f} us per {len(text.split())}-word transcript")
+
+    print("SUCCESS: Wake phrase matcher behaves as expected.")
+
+
+if __name__ == "__main__":
+    test_wake_matcher()
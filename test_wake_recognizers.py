@@ -0,0 +1,131 @@
+import json
+import threading
+
+import numpy as np
+
+from aura import wake_word_listener
+from aura.model_registry import ModelRegistry
+from aura.replay_harness import ReplayBus
+
+RATE = 16000
+
+
+class _FakeRecognizer:
+    """
+    Stand-in for KaldiRecognizer. The grammar (wake) recognizer hears
+    "hey aura" in any audio, the free one "open chrome"; every call is
+    logged so the test can see which one the listener was using.
+    """
+    log = []
+
+    def __init__(self, model, rate, grammar=None):
+        self.kind = "wake" if grammar else "command"
+        self.samples = 0     # since it was built, like Vosk's word times
+        self.fed = 0         # since the last Reset() / final result
+
+    def SetWords(self, on):
+        pass
+
+    def SetPartialWords(self, on):
+        pass
+
+    def AcceptWaveform(self, data):
+        self.samples += len(data) // 2
+        self.fed += 1
+        self.log.append(self.kind)
+        return False
+
+    def _words(self):
+        text = "hey aura" if self.kind == "wake" else "open chrome"
+        end = self.samples / RATE
+        return text, [{"word": w, "end": end} for w in text.split()]
+
+    def PartialResult(self):
+        if not self.fed:
+            return json.dumps({"partial": ""})
+        text, words = self._words()
+        return json.dumps({"partial": text, "partial_result": words})
+
+    def Result(self):
+        return self.FinalResult()
+
+    def FinalResult(self):
+        text, words = self._words() if self.fed else ("", [])
+        self.fed = 0
+        return json.dumps({"text": text, "result": words})
+
+    def Reset(self):
+        self.fed = 0
+        self.log.append(f"{self.kind} reset")
+
+
+def _speech(seconds, seed):
+    t = np.arange(int(seconds * RATE)) / RATE
+    voiced = np.sin(2 * np.pi * 180 * t) * 5000 * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))
+    return (voiced + np.random.default_rng(seed).standard_normal(len(t)) * 60).astype(np.int16)
+
+
+def _runs(log):
+    """Recognizers fed, in order, with repeats collapsed."""
+    fed = [entry for entry in log if not entry.endswith("reset")]
+    return [kind for i, kind in enumerate(fed) if i == 0 or fed[i - 1] != kind]
+
+
+def test_wake_recognizers():
+    print("--- AURA Wake/Command Recognizer Switch Test ---")
+    real_rec = wake_word_listener.KaldiRecognizer
+    real_registry = wake_word_listener.get_model_registry
+    registry = ModelRegistry(factory=lambda path: object())
+    wake_word_listener.KaldiRecognizer = _FakeRecognizer
+    wake_word_listener.get_model_registry = lambda: registry
+    _FakeRecognizer.log.clear()
+    try:
+        bus = ReplayBus()
+        wakes, commands = [], []
+        ran = threading.Event()
+
+        def handle_command(text):
+            commands.append(text)
+            ran.set()
+            return ""
+
+        listener = wake_word_listener.WakeWordListener(on_wake=lambda: wakes.append(1), bus=bus)
+        listener.speak = listener.speak_ack = lambda text: None
+        listener.prerender = lambda phrases: None
+        listener.handle_command = handle_command
+        thread = threading.Thread(target=listener.start, daemon=True)
+        thread.start()
+        listener.set_enabled(True)
+        assert bus.wait_for_reader()
+
+        print("1. Silence never reaches either recognizer...")
+        bus.play_silence(1.0)
+        assert _runs(_FakeRecognizer.log) == []
+        assert listener.rec is listener.wake_rec
+
+        print("2. A wake phrase switches to the free recognizer, which starts clean...")
+        bus.play(_speech(1.0, seed=1))
+        assert wakes and listener.rec is listener.command_rec
+        assert "command reset" in _FakeRecognizer.log
+        assert _runs(_FakeRecognizer.log) == ["wake", "command"]
+
+        print("3. After the command, it switches back to the wake grammar...")
+        bus.play_silence(1.5, seed=2)       # end of utterance: the command is final
+        assert ran.wait(2.0) and commands == ["open chrome"]
+        assert listener.rec is listener.wake_rec and not listener.listening_for_command
+        bus.play(_speech(0.6, seed=3))      # the next utterance is a wake phrase again
+        assert _runs(_FakeRecognizer.log)[:3] == ["wake", "command", "wake"]
+        assert len(wakes) == 2
+    finally:
+        listener.stop()
+        thread.join(timeout=2.0)
+        wake_word_listener.KaldiRecognizer = real_rec
+        wake_word_listener.get_model_registry = real_registry
+
+    (model,) = registry.stats().values()
+    assert model["leases"] == 0          # stop() gave the shared model back
+    print("SUCCESS: The listener switches recognizers on wake and back after the command.")
+
+
+if __name__ == "__main__":
+    test_wake_recognizers()